@@ -0,0 +1,37 @@
+"""Shared setup for the benchmark scripts.
+
+Each script is run directly (python benchmarks/bench_x.py), so this module
+is importable by name. Call configure() before importing jobtrack:
+
+    from _setup import configure
+
+    configure()
+
+    from jobtrack.core.config import settings  # noqa: E402
+"""
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Placeholder settings; anything already set in the environment wins
+BENCH_ENV = {
+    'SUPABASE_URL': 'http://localhost:54321',
+    # supabase-py only checks that the key is shaped like a JWT
+    'SUPABASE_KEY': 'bench.bench.bench',
+    'SUPABASE_SECRET_KEY': 'bench',
+    'SECRET_KEY': 'bench-secret',
+    'OPENAI_API_KEY': 'bench'
+}
+
+
+def configure(*paths: str, **env: str) -> None:
+    """Put src/ and any other repo-relative paths on sys.path and fill in settings.
+
+    env adds settings to, or overrides, BENCH_ENV for one script.
+    """
+    for path in ('src', *paths):
+        sys.path.insert(0, str(ROOT / path))
+    for name, value in {**BENCH_ENV, **env}.items():
+        os.environ.setdefault(name, value)
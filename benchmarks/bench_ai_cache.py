@@ -0,0 +1,65 @@
+"""Cost of serving a repeated AI request from the result cache.
+
+Runs AIService.analyze_resume against a stubbed client that answers after
+a fixed delay standing in for the model, once uncached and once per cache
+backend, over a workload where most resumes are re-submissions.
+
+    python benchmarks/bench_ai_cache.py
+"""
+import asyncio
+import random
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from types import SimpleNamespace
+
+from _setup import configure
+
+configure()
+
+from jobtrack.services.ai import AIService  # noqa: E402
+from jobtrack.services.ai_cache import AIResultCache, MemoryCacheBackend, SQLiteCacheBackend  # noqa: E402
+
+REQUESTS = 500
+DISTINCT_RESUMES = 50
+MODEL_DELAY = 0.005
+
+
+class StubClient:
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(MODEL_DELAY)
+        message = SimpleNamespace(content='{"skills": []}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    async def close(self):
+        pass
+
+
+async def run(label: str, cache) -> None:
+    client = StubClient()
+    service = AIService(client=client, cache=cache)
+    # AIService falls back to the configured cache when given none
+    service.cache = cache
+    rng = random.Random(0)
+    resumes = [f'resume {rng.randrange(DISTINCT_RESUMES)} ' + 'experience ' * 200 for _ in range(REQUESTS)]
+    started = perf_counter()
+    for resume in resumes:
+        await service.analyze_resume(resume)
+    elapsed = perf_counter() - started
+    print(f'{label:<10} {elapsed / REQUESTS * 1e3:8.3f} ms/request  {client.calls:4d} model calls')
+
+
+async def main() -> None:
+    await run('uncached', None)
+    await run('memory', AIResultCache(MemoryCacheBackend(1024, None)))
+    with tempfile.TemporaryDirectory() as directory:
+        await run('sqlite', AIResultCache(SQLiteCacheBackend(str(Path(directory) / 'cache.sqlite3'), None)))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+"""Submit latency and throughput of the background AI task queue.
+
+Submits a burst of tasks from several users to services.tasks.TaskQueue
+backed by a temporary SQLite store, with a stubbed AI service that answers
+after a fixed delay standing in for the model, at several
+AI_TASK_WORKERS values.
+
+    python benchmarks/bench_ai_tasks.py
+"""
+import asyncio
+import tempfile
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+from _setup import configure
+
+configure()
+
+from jobtrack.core.config import settings  # noqa: E402
+from jobtrack.schemas.ai import AITaskKind, AITaskPriority  # noqa: E402
+from jobtrack.services.tasks import TaskQueue, TaskStore  # noqa: E402
+
+TASKS = 400
+USERS = 20
+MODEL_DELAY = 0.05
+WORKERS = (1, 4, 16)
+
+
+class StubAIService:
+    async def analyze_resume(self, resume_text: str) -> str:
+        await asyncio.sleep(MODEL_DELAY)
+        return '{"skills": []}'
+
+    async def match_job(self, job_description: str, resume_analysis: dict) -> str:
+        return '{}'
+
+    async def generate_cover_letter(self, job_description: str, resume_analysis: dict, company_name: str) -> str:
+        return ''
+
+    async def suggest_improvements(self, application_materials: dict) -> str:
+        return '{}'
+
+
+async def run(directory: str, workers: int) -> None:
+    settings.ai_task_workers = workers
+    queue = TaskQueue(StubAIService(), TaskStore(str(Path(directory) / f'tasks-{workers}.sqlite3')))
+    await queue.start()
+    submits = []
+    started = perf_counter()
+    try:
+        for n in range(TASKS):
+            submitted = perf_counter()
+            await queue.submit(f'user-{n % USERS}', AITaskKind.ANALYZE_RESUME, {'resume_text': str(n)}, AITaskPriority.NORMAL)
+            submits.append(perf_counter() - submitted)
+        while queue._pending:
+            await asyncio.sleep(0.005)
+        elapsed = perf_counter() - started
+    finally:
+        await queue.stop()
+    print(f'workers {workers:>3}  {TASKS / elapsed:8.1f} tasks/s  '
+          f'submit p50 {median(submits) * 1e3:6.2f} ms  max {max(submits) * 1e3:6.2f} ms')
+
+
+def main() -> None:
+    print(f'{TASKS} tasks from {USERS} users, {MODEL_DELAY * 1e3:.0f} ms per completion, '
+          f'AI_TASK_USER_CONCURRENCY={settings.ai_task_user_concurrency}')
+    settings.ai_task_queue_limit = TASKS
+    with tempfile.TemporaryDirectory() as directory:
+        for workers in WORKERS:
+            asyncio.run(run(directory, workers))
+
+
+if __name__ == '__main__':
+    main()
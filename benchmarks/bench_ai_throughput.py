@@ -0,0 +1,72 @@
+"""Completion throughput of AIService against a fake OpenAI server.
+
+Serves tests/fake_openai.py with uvicorn on a local port, points the pooled
+client at it and pushes a burst of completions through AIService at
+several OPENAI_MAX_CONCURRENCY values. The fake answers after a fixed
+delay, so throughput should scale with the cap until the pool saturates.
+
+    python benchmarks/bench_ai_throughput.py
+"""
+import asyncio
+import socket
+import threading
+import time
+from time import perf_counter
+
+from _setup import configure
+
+configure('tests')
+
+import uvicorn  # noqa: E402
+
+from jobtrack.core.config import settings  # noqa: E402
+from jobtrack.services.ai import AIService  # noqa: E402
+
+from fake_openai import FakeOpenAI  # noqa: E402
+
+REQUESTS = 200
+MODEL_DELAY = 0.05
+CONCURRENCY = (1, 4, 8, 16)
+
+
+def serve(fake: FakeOpenAI) -> uvicorn.Server:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(fake.app, port=port, log_level='warning'))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    settings.openai_base_url = f'http://127.0.0.1:{port}/v1'
+    return server
+
+
+async def run(fake: FakeOpenAI, concurrency: int) -> None:
+    settings.openai_max_concurrency = concurrency
+    service = AIService()
+    service.cache = None
+    fake.max_in_flight = 0
+    started = perf_counter()
+    try:
+        await asyncio.gather(*(
+            service.generate_cover_letter(f'job {n}', {}, 'Acme') for n in range(REQUESTS)
+        ))
+    finally:
+        await service.close()
+    elapsed = perf_counter() - started
+    print(f'concurrency {concurrency:>3}  {REQUESTS / elapsed:8.1f} completions/s  '
+          f'max in flight {fake.max_in_flight}')
+
+
+def main() -> None:
+    fake = FakeOpenAI(delay=MODEL_DELAY)
+    server = serve(fake)
+    try:
+        for concurrency in CONCURRENCY:
+            asyncio.run(run(fake, concurrency))
+    finally:
+        server.should_exit = True
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Per-request cost of bearer token validation.
+
+Compares a full JWT decode (signature check + JSON parse) with
+core.security.verify_token, which serves repeat tokens from the verified
+token cache and then checks type and revocation.
+
+    python benchmarks/bench_auth.py
+"""
+import asyncio
+from timeit import timeit
+
+from _setup import configure
+
+configure()
+
+from jose import jwt  # noqa: E402
+
+from jobtrack.core.config import settings  # noqa: E402
+from jobtrack.core.security import create_tokens, verify_token  # noqa: E402
+
+ROUNDS = 20000
+
+
+def main() -> None:
+    access_token, _ = create_tokens('bench@example.com', 'user')
+    loop = asyncio.new_event_loop()
+
+    def full_decode():
+        jwt.decode(access_token, settings.secret_key, algorithms=[settings.algorithm])
+
+    def cached_verify():
+        loop.run_until_complete(verify_token(access_token))
+
+    def empty_loop_turn():
+        loop.run_until_complete(asyncio.sleep(0))
+
+    # Warm the token cache before timing
+    cached_verify()
+    baseline = timeit(empty_loop_turn, number=ROUNDS)
+    for label, func, overhead in (
+        ('jwt.decode', full_decode, 0.0),
+        ('verify_token (cached)', cached_verify, baseline)
+    ):
+        seconds = timeit(func, number=ROUNDS) - overhead
+        print(f'{label:<24} {seconds / ROUNDS * 1e6:8.2f} us/request')
+    loop.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Serialization cost of a large job list response.
+
+Compares FastAPI's response_model path for List[Job] (validate the
+returned models again, jsonable_encoder, json.dumps) with the
+TypeAdapter.dump_json path the job list endpoints use, over 10k jobs.
+
+    python benchmarks/bench_job_list_json.py
+"""
+import asyncio
+from datetime import date, datetime, timedelta
+from timeit import timeit
+from typing import List
+from uuid import uuid4
+
+from _setup import configure
+
+configure()
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from jobtrack.schemas.job import Job  # noqa: E402
+
+JOBS = 10000
+ROUNDS = 5
+
+
+def make_jobs() -> List[Job]:
+    user_id = uuid4()
+    now = datetime.utcnow()
+    return [Job(
+        id=uuid4(),
+        user_id=user_id,
+        company_name=f'Company {n}',
+        position_title='Backend Engineer',
+        job_description='Build and run services. ' * 20,
+        job_url=f'https://jobs.example.com/{n}',
+        status='applied',
+        salary_min=90000,
+        salary_max=120000,
+        location='Remote',
+        remote_type='remote',
+        notes='Referred by a friend',
+        applied_date=date.today() - timedelta(days=n % 90),
+        created_at=now,
+        updated_at=now
+    ) for n in range(JOBS)]
+
+
+def main() -> None:
+    jobs = make_jobs()
+    field = create_response_field('Response_read_user_jobs', List[Job], mode='serialization')
+    adapter = TypeAdapter(List[Job])
+    loop = asyncio.new_event_loop()
+
+    def response_model_path():
+        content = loop.run_until_complete(serialize_response(field=field, response_content=jobs))
+        return JSONResponse(content).body
+
+    def dump_json_path():
+        return adapter.dump_json(jobs)
+
+    assert len(response_model_path()) > 0 and len(dump_json_path()) > 0
+    for label, func in (('response_model', response_model_path), ('TypeAdapter.dump_json', dump_json_path)):
+        seconds = timeit(func, number=ROUNDS) / ROUNDS
+        print(f'{label:<22} {seconds * 1e3:8.1f} ms per {JOBS} jobs')
+    loop.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Login throughput and /jobs/ latency during a login burst.
+
+Runs a burst of password verifications while a stream of cheap requests,
+standing in for /jobs/, measures how long they wait for the event loop.
+"inline" verifies with bcrypt on the loop as the login handler used to;
+"pooled" uses core.security.verify_password_async on the hashing pool.
+
+    python benchmarks/bench_password_hashing.py
+"""
+import asyncio
+from statistics import median
+from time import perf_counter
+
+from _setup import configure
+
+configure(BCRYPT_ROUNDS='10')
+
+from jobtrack.core.config import settings  # noqa: E402
+from jobtrack.core.security import get_password_hash, verify_password, verify_password_async  # noqa: E402
+
+LOGINS = 32
+PASSWORD = 'correct horse battery staple'
+
+
+async def inline_login(hashed: str) -> bool:
+    return verify_password(PASSWORD, hashed)
+
+
+async def pooled_login(hashed: str) -> bool:
+    return await verify_password_async(PASSWORD, hashed)
+
+
+async def jobs_requests(latencies, stop):
+    while not stop.is_set():
+        submitted = perf_counter()
+        await asyncio.sleep(0)
+        latencies.append(perf_counter() - submitted)
+        await asyncio.sleep(0.005)
+
+
+async def run(label: str, login, hashed: str) -> None:
+    latencies, stop = [], asyncio.Event()
+    probing = asyncio.create_task(jobs_requests(latencies, stop))
+    await asyncio.sleep(0.01)
+    started = perf_counter()
+    await asyncio.gather(*(login(hashed) for _ in range(LOGINS)))
+    elapsed = perf_counter() - started
+    stop.set()
+    await probing
+    latencies.sort()
+    print(f'{label:<7} {LOGINS / elapsed:7.1f} logins/s  /jobs/ latency '
+          f'p50 {median(latencies) * 1e3:7.2f} ms  max {latencies[-1] * 1e3:8.2f} ms')
+
+
+def main() -> None:
+    print(f'{LOGINS} concurrent logins, BCRYPT_ROUNDS={settings.bcrypt_rounds}, '
+          f'PASSWORD_HASH_WORKERS={settings.password_hash_workers}')
+    hashed = get_password_hash(PASSWORD)
+    asyncio.run(run('inline', inline_login, hashed))
+    asyncio.run(run('pooled', pooled_login, hashed))
+
+
+if __name__ == '__main__':
+    main()
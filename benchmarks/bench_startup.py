@@ -0,0 +1,65 @@
+"""Cold start cost of the application.
+
+Each run starts a fresh interpreter that imports jobtrack.main, runs the
+lifespan startup and serves a first GET /health through the ASGI test
+client, timing each step. Reports the median over several runs.
+
+    python benchmarks/bench_startup.py
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+from _setup import BENCH_ENV, ROOT
+
+RUNS = 5
+
+
+def child() -> None:
+    started = perf_counter()
+    from fastapi.testclient import TestClient
+
+    from jobtrack.main import app
+    imported = perf_counter()
+    with TestClient(app) as client:
+        ready = perf_counter()
+        response = client.get('/health')
+        first_response = perf_counter()
+    response.raise_for_status()
+    print(json.dumps({
+        'import': imported - started,
+        'startup': ready - imported,
+        'first request': first_response - ready,
+        'time to first request': first_response - started
+    }))
+
+
+def main() -> None:
+    timings = []
+    with tempfile.TemporaryDirectory() as directory:
+        env = {
+            **BENCH_ENV,
+            'AI_TASK_STORE_PATH': str(Path(directory) / 'ai_tasks.sqlite3'),
+            **os.environ,
+            'PYTHONPATH': str(ROOT / 'src')
+        }
+        for _ in range(RUNS):
+            output = subprocess.run(
+                [sys.executable, __file__, '--child'],
+                cwd=ROOT, env=env, capture_output=True, text=True, check=True
+            ).stdout
+            timings.append(json.loads(output.strip().splitlines()[-1]))
+    for step in timings[0]:
+        print(f'{step:<22} {median(run[step] for run in timings) * 1e3:8.1f} ms')
+
+
+if __name__ == '__main__':
+    if '--child' in sys.argv:
+        child()
+    else:
+        main()
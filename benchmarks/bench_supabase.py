@@ -0,0 +1,77 @@
+"""Concurrent request throughput with blocking vs pooled Supabase queries.
+
+Each simulated request runs one query whose synchronous execute() blocks
+for a fixed round trip, like supabase-py waiting on PostgREST. "inline"
+calls it on the event loop as the services used to; "pooled" goes through
+core.supabase.execute. A probe task measures how late the event loop
+wakes up while the requests run.
+
+    python benchmarks/bench_supabase.py
+"""
+import asyncio
+import time
+from time import perf_counter
+
+from _setup import configure
+
+configure()
+
+from jobtrack.core.config import settings  # noqa: E402
+from jobtrack.core.supabase import execute, supabase_pool  # noqa: E402
+
+REQUESTS = 200
+CONCURRENCY = 50
+ROUND_TRIP = 0.02
+
+
+class BlockingQuery:
+    def execute(self):
+        time.sleep(ROUND_TRIP)
+        return []
+
+
+async def inline_request():
+    return BlockingQuery().execute()
+
+
+async def pooled_request():
+    return await execute(BlockingQuery())
+
+
+async def probe(lags, stop):
+    while not stop.is_set():
+        expected = perf_counter() + 0.001
+        await asyncio.sleep(0.001)
+        lags.append(perf_counter() - expected)
+
+
+async def run(label, request):
+    limit = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with limit:
+            await request()
+
+    lags, stop = [], asyncio.Event()
+    probing = asyncio.create_task(probe(lags, stop))
+    started = perf_counter()
+    await asyncio.gather(*(one() for _ in range(REQUESTS)))
+    elapsed = perf_counter() - started
+    stop.set()
+    await probing
+    print(f'{label:<8} {REQUESTS / elapsed:8.1f} requests/s  '
+          f'max loop lag {max(lags, default=0) * 1e3:7.1f} ms')
+
+
+def main() -> None:
+    print(f'{REQUESTS} requests, {CONCURRENCY} concurrent, {ROUND_TRIP * 1e3:.0f} ms per query, '
+          f'SUPABASE_MAX_CONCURRENCY={settings.supabase_max_concurrency}')
+    # Build the client up front so its setup is not timed
+    supabase_pool.resolve()
+    asyncio.run(run('inline', inline_request))
+    asyncio.run(run('pooled', pooled_request))
+    supabase_pool.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,9 @@
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
 from functools import wraps
 
-from .config import settings
+from .security import verify_token
 from ..services.user import user_service
 from ..schemas.user import User
 from ..models.user import UserRole
@@ -19,19 +18,14 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    try:
-        payload = jwt.decode(
-            token,
-            settings.secret_key,
-            algorithms=[settings.algorithm]
-        )
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
+    payload = await verify_token(token, token_type="access")
+    if payload is None:
+        raise credentials_exception
+    email: str = payload.get("sub")
+    if email is None:
         raise credentials_exception
     
-    user = user_service.get_user_by_email(email)
+    user = await user_service.get_cached_user(email)
     if user is None:
         raise credentials_exception
     
@@ -1,19 +1,93 @@
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
+from .lazy import Lazy
+
 
 class Settings(BaseSettings):
     # Supabase settings
     supabase_url: str = Field(..., env='SUPABASE_URL')
     supabase_key: str = Field(..., env='SUPABASE_KEY')
     supabase_secret_key: str = Field(..., env='SUPABASE_SECRET_KEY')
+    supabase_max_concurrency: int = Field(16, env='SUPABASE_MAX_CONCURRENCY')
+    supabase_max_connections: int = Field(20, env='SUPABASE_MAX_CONNECTIONS')
+    supabase_keepalive_seconds: float = Field(30.0, env='SUPABASE_KEEPALIVE_SECONDS')
+    # Needs the optional h2 package (pip install 'httpx[http2]')
+    supabase_http2: bool = Field(False, env='SUPABASE_HTTP2')
+    supabase_health_check_seconds: float = Field(30.0, env='SUPABASE_HEALTH_CHECK_SECONDS')
+    # Rows per request when reading a whole table; keep at or below the
+    # project's max-rows setting (1000 by default on Supabase)
+    supabase_page_size: int = Field(1000, env='SUPABASE_PAGE_SIZE')
     
     # JWT settings
     secret_key: str = Field(..., env='SECRET_KEY')
     algorithm: str = Field('HS256', env='ALGORITHM')
     access_token_expire_minutes: int = Field(30, env='ACCESS_TOKEN_EXPIRE_MINUTES')
     refresh_token_expire_days: int = Field(7, env='REFRESH_TOKEN_EXPIRE_DAYS')
+    token_cache_size: int = Field(4096, env='TOKEN_CACHE_SIZE')
+    # 'memory' (per process) or 'redis' (shared by every worker)
+    token_revocation_backend: str = Field('memory', env='TOKEN_REVOCATION_BACKEND')
+    token_revocation_redis_url: Optional[str] = Field(None, env='TOKEN_REVOCATION_REDIS_URL')
+    
+    # Password hashing settings
+    bcrypt_rounds: int = Field(12, env='BCRYPT_ROUNDS')
+    password_hash_workers: int = Field(4, env='PASSWORD_HASH_WORKERS')
+    password_hash_queue_limit: int = Field(32, env='PASSWORD_HASH_QUEUE_LIMIT')
+    
+    # Authenticated user cache settings
+    user_cache_size: int = Field(1024, env='USER_CACHE_SIZE')
+    user_cache_ttl_seconds: int = Field(60, env='USER_CACHE_TTL_SECONDS')
+    user_export_page_size: int = Field(500, env='USER_EXPORT_PAGE_SIZE')
+    
+    # Bulk job import/export settings
+    job_import_batch_size: int = Field(500, env='JOB_IMPORT_BATCH_SIZE')
+    job_export_page_size: int = Field(500, env='JOB_EXPORT_PAGE_SIZE')
+    job_interaction_batch_max: int = Field(100, env='JOB_INTERACTION_BATCH_MAX')
+    job_bulk_update_max_ids: int = Field(200, env='JOB_BULK_UPDATE_MAX_IDS')
+    job_bulk_update_chunk_size: int = Field(100, env='JOB_BULK_UPDATE_CHUNK_SIZE')
+    job_bulk_update_page_size: int = Field(1000, env='JOB_BULK_UPDATE_PAGE_SIZE')
+    
+    # Application statistics settings
+    stats_cache_size: int = Field(1024, env='STATS_CACHE_SIZE')
+    # Summaries are reloaded when the user's data version changes; with the
+    # memory version backend and several workers, this TTL bounds how long
+    # another worker's writes stay unseen
+    stats_cache_ttl_seconds: int = Field(120, env='STATS_CACHE_TTL_SECONDS')
+    stats_salary_bucket_size: int = Field(20000, env='STATS_SALARY_BUCKET_SIZE')
+    
+    # Per-user data versions behind ETags and the in-process read caches:
+    # 'memory' (per process) or 'redis' (shared by every worker)
+    data_version_backend: str = Field('memory', env='DATA_VERSION_BACKEND')
+    data_version_redis_url: Optional[str] = Field(None, env='DATA_VERSION_REDIS_URL')
+    
+    # Conditional GET / response cache settings
+    # With the memory version backend and several workers, a write on one
+    # worker reaches the others' ETags and cached bodies within the TTL
+    etag_enabled: bool = Field(True, env='ETAG_ENABLED')
+    response_cache_enabled: bool = Field(False, env='RESPONSE_CACHE_ENABLED')
+    response_cache_size: int = Field(2048, env='RESPONSE_CACHE_SIZE')
+    response_cache_ttl_seconds: int = Field(30, env='RESPONSE_CACHE_TTL_SECONDS')
+    
+    # Rate limiting settings
+    rate_limit_enabled: bool = Field(True, env='RATE_LIMIT_ENABLED')
+    rate_limit_backend: str = Field('memory', env='RATE_LIMIT_BACKEND')
+    rate_limit_redis_url: Optional[str] = Field(None, env='RATE_LIMIT_REDIS_URL')
+    rate_limit_max_keys: int = Field(100000, env='RATE_LIMIT_MAX_KEYS')
+    rate_limit_auth_per_minute: float = Field(10, env='RATE_LIMIT_AUTH_PER_MINUTE')
+    rate_limit_auth_burst: int = Field(5, env='RATE_LIMIT_AUTH_BURST')
+    rate_limit_auth_max_in_flight: int = Field(64, env='RATE_LIMIT_AUTH_MAX_IN_FLIGHT')
+    rate_limit_ai_per_minute: float = Field(20, env='RATE_LIMIT_AI_PER_MINUTE')
+    rate_limit_ai_burst: int = Field(10, env='RATE_LIMIT_AI_BURST')
+    rate_limit_ai_max_in_flight: int = Field(32, env='RATE_LIMIT_AI_MAX_IN_FLIGHT')
+    # Peers (e.g. the load balancer) whose X-Forwarded-For names the client;
+    # without them every request behind a proxy shares the proxy's bucket.
+    # Running uvicorn with --proxy-headers --forwarded-allow-ips also works.
+    rate_limit_trusted_proxies: List[str] = Field([], env='RATE_LIMIT_TRUSTED_PROXIES')
+    
+    # Observability settings
+    metrics_enabled: bool = Field(True, env='METRICS_ENABLED')
+    debug_timing_header: bool = Field(False, env='DEBUG_TIMING_HEADER')
     
     # CORS settings
     cors_origins: List[str] = Field(
@@ -25,10 +99,50 @@ class Settings(BaseSettings):
     openai_api_key: str = Field(..., env='OPENAI_API_KEY')
     openai_model: str = Field('gpt-4-turbo-preview', env='OPENAI_MODEL')
     openai_temperature: float = Field(0.7, env='OPENAI_TEMPERATURE')
+    openai_base_url: Optional[str] = Field(None, env='OPENAI_BASE_URL')
+    openai_timeout_seconds: float = Field(60.0, env='OPENAI_TIMEOUT_SECONDS')
+    openai_max_concurrency: int = Field(8, env='OPENAI_MAX_CONCURRENCY')
+    openai_max_connections: int = Field(20, env='OPENAI_MAX_CONNECTIONS')
+    openai_max_retries: int = Field(3, env='OPENAI_MAX_RETRIES')
+    openai_retry_base_delay: float = Field(0.5, env='OPENAI_RETRY_BASE_DELAY')
+    openai_retry_max_delay: float = Field(8.0, env='OPENAI_RETRY_MAX_DELAY')
+    ai_batch_match_concurrency: int = Field(4, env='AI_BATCH_MATCH_CONCURRENCY')
+    ai_batch_match_max_jobs: int = Field(100, env='AI_BATCH_MATCH_MAX_JOBS')
+    ai_prerank_top_k: int = Field(10, env='AI_PRERANK_TOP_K')
+    
+    # Background AI task queue settings
+    ai_task_workers: int = Field(4, env='AI_TASK_WORKERS')
+    ai_task_queue_limit: int = Field(1000, env='AI_TASK_QUEUE_LIMIT')
+    ai_task_user_concurrency: int = Field(2, env='AI_TASK_USER_CONCURRENCY')
+    ai_task_store_path: str = Field('ai_tasks.sqlite3', env='AI_TASK_STORE_PATH')
+    # Running tasks older than this are assumed orphaned by a dead worker
+    ai_task_stale_seconds: int = Field(900, env='AI_TASK_STALE_SECONDS')
+    
+    # Local job ranking index settings
+    ranking_index_cache_size: int = Field(256, env='RANKING_INDEX_CACHE_SIZE')
+    # Indexes are rebuilt when the user's data version changes; with the
+    # memory version backend and several workers, this TTL bounds how long
+    # another worker's writes stay unseen
+    ranking_index_ttl_seconds: int = Field(300, env='RANKING_INDEX_TTL_SECONDS')
+    
+    # Job search settings
+    search_index_cache_size: int = Field(256, env='SEARCH_INDEX_CACHE_SIZE')
+    # Indexes are rebuilt when the user's data version changes; with the
+    # memory version backend and several workers, this TTL bounds how long
+    # another worker's writes (including deletes) stay unseen
+    search_index_ttl_seconds: int = Field(300, env='SEARCH_INDEX_TTL_SECONDS')
+    search_snippet_chars: int = Field(160, env='SEARCH_SNIPPET_CHARS')
+    
+    # AI result cache settings ('memory', 'sqlite' or 'none')
+    ai_cache_backend: str = Field('memory', env='AI_CACHE_BACKEND')
+    ai_cache_path: str = Field('ai_cache.sqlite3', env='AI_CACHE_PATH')
+    ai_cache_ttl_seconds: int = Field(86400, env='AI_CACHE_TTL_SECONDS')
+    ai_cache_max_entries: int = Field(1024, env='AI_CACHE_MAX_ENTRIES')
     
     class Config:
         env_file = ".env"
         case_sensitive = False
 
 
-settings = Settings()
+# Settings are read from the environment on first access, not at import
+settings: Settings = Lazy(Settings, 'settings')
@@ -0,0 +1,94 @@
+import hashlib
+from time import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from .cache import LRUCache
+from .config import settings
+from .lazy import Lazy
+from .versions import data_versions, get_version
+
+# In-memory versions restart from zero, so the epoch keeps ETags issued
+# before a restart from ever matching again.
+_EPOCH = uuid4().hex[:8]
+
+response_cache: LRUCache = Lazy(
+    lambda: LRUCache(maxsize=settings.response_cache_size, ttl=settings.response_cache_ttl_seconds),
+    'response_cache'
+)
+
+# Infers the serializer from each value at runtime; callers that know the
+# content type should pass their own adapter, which serializes faster.
+_ANY_ADAPTER = TypeAdapter(Any)
+
+
+def _etag(version: int, resource: str) -> str:
+    digest = hashlib.blake2b(resource.encode('utf-8'), digest_size=8).hexdigest()
+    if data_versions.shared:
+        return f'W/"{version}-{digest}"'
+    # Per-process versions miss writes handled by other workers; the time
+    # window expires ETags after the cache TTL to bound that staleness
+    window = int(time() // settings.response_cache_ttl_seconds)
+    return f'W/"{_EPOCH}-{window}-{version}-{digest}"'
+
+
+def _if_none_match(request: Request) -> List[str]:
+    header = request.headers.get('if-none-match')
+    return [tag.strip() for tag in header.split(',')] if header else []
+
+
+async def cached_json_response(
+    request: Request,
+    user_id: Any,
+    build: Callable[[], Awaitable[Tuple[Any, Dict[str, str]]]],
+    adapter: Optional[TypeAdapter] = None
+) -> Response:
+    """Serve a per-user JSON read with ETag revalidation and a response cache.
+
+    build returns the response content and any extra headers; it only runs
+    when neither the client nor the in-process cache holds the current
+    version. ETags follow the per-user version in core/versions.py, which
+    is exact for a single worker or with DATA_VERSION_BACKEND=redis; with
+    several workers on the memory backend a write on one is only seen by
+    the others once ETags and cached bodies expire after
+    RESPONSE_CACHE_TTL_SECONDS.
+
+    Content is serialized straight to JSON bytes by pydantic-core through
+    adapter, so already-validated models are not validated again or routed
+    through jsonable_encoder.
+    """
+    adapter = adapter or _ANY_ADAPTER
+    if not settings.etag_enabled:
+        content, extra_headers = await build()
+        return Response(
+            content=adapter.dump_json(content),
+            media_type='application/json',
+            headers=extra_headers
+        )
+
+    user_id = str(user_id)
+    query = '&'.join(sorted(request.url.query.split('&'))) if request.url.query else ''
+    resource = f'{request.url.path}?{query}'
+    # Read before building, so a write racing the build changes the ETag
+    etag = _etag(await get_version(user_id), resource)
+    headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+
+    candidates = _if_none_match(request)
+    if etag in candidates or etag[2:] in candidates:
+        return Response(status_code=304, headers=headers)
+
+    cached = response_cache.get((user_id, resource)) if settings.response_cache_enabled else None
+    if cached is not None and cached[0] == etag:
+        _, body, extra_headers = cached
+    else:
+        # build raises for a missing resource, which If-None-Match: * must not hide
+        content, extra_headers = await build()
+        body = adapter.dump_json(content)
+        if settings.response_cache_enabled:
+            response_cache.set((user_id, resource), (etag, body, extra_headers))
+    if '*' in candidates:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type='application/json', headers={**headers, **extra_headers})
@@ -0,0 +1,44 @@
+import logging
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+logger = logging.getLogger('jobtrack.startup')
+
+
+class Lazy(Generic[T]):
+    """Provider that builds a shared object on first use instead of at import.
+
+    Attribute access is forwarded to the built object, so module-level
+    singletons keep working unchanged; `resolve` can also be passed to
+    FastAPI's Depends. Construction time is logged so slow setup steps
+    show up in startup logs.
+    """
+
+    def __init__(self, factory: Callable[[], T], name: str):
+        self._factory = factory
+        self._name = name
+        self._instance: Optional[T] = None
+        self._lock = Lock()
+
+    def resolve(self) -> T:
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    started = perf_counter()
+                    self._instance = self._factory()
+                    logger.info("%s initialised in %.1f ms", self._name, (perf_counter() - started) * 1000)
+        return self._instance
+
+    @property
+    def initialized(self) -> bool:
+        return self._instance is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = 'initialised' if self.initialized else 'pending'
+        return f'<Lazy {self._name} ({state})>'
@@ -0,0 +1,167 @@
+from bisect import bisect_left
+from contextvars import ContextVar
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_format_labels(self.labelnames, key)} {value}')
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # Per label set: non-cumulative bucket counts (+Inf last), sum, count
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0, 0])
+            series[0][bisect_left(self.buckets, value)] += 1
+            series[1][0] += value
+            series[1][1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            for key, (counts, (total, count)) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                    cumulative += bucket_count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    labels = _format_labels(self.labelnames, key, 'le="%s"' % le)
+                    lines.append(f'{self.name}_bucket{labels} {cumulative}')
+                lines.append(f'{self.name}_sum{_format_labels(self.labelnames, key)} {total}')
+                lines.append(f'{self.name}_count{_format_labels(self.labelnames, key)} {int(count)}')
+        return lines
+
+
+class Gauge:
+    """Gauge whose samples are read from a callback at scrape time."""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str], collect: Callable[[], Dict[LabelValues, float]]):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.collect = collect
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} gauge']
+        for key, value in sorted(self.collect().items()):
+            lines.append(f'{self.name}{_format_labels(self.labelnames, key)} {float(value)}')
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: list = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+REQUEST_LATENCY = registry.register(Histogram(
+    'jobtrack_http_request_duration_seconds',
+    'HTTP request latency by route',
+    ('method', 'route', 'status')
+))
+SUPABASE_LATENCY = registry.register(Histogram(
+    'jobtrack_supabase_query_duration_seconds',
+    'Supabase query latency including pool wait'
+))
+SUPABASE_CALLS_PER_REQUEST = registry.register(Histogram(
+    'jobtrack_supabase_queries_per_request',
+    'Supabase queries issued per HTTP request',
+    ('route',),
+    buckets=COUNT_BUCKETS
+))
+OPENAI_LATENCY = registry.register(Histogram(
+    'jobtrack_openai_request_duration_seconds',
+    'OpenAI call latency',
+    ('operation',)
+))
+OPENAI_TOKENS = registry.register(Counter(
+    'jobtrack_openai_tokens_total',
+    'OpenAI tokens used',
+    ('model', 'kind')
+))
+BCRYPT_LATENCY = registry.register(Histogram(
+    'jobtrack_bcrypt_duration_seconds',
+    'bcrypt hash/verify time',
+    ('operation',)
+))
+
+# Per-request time spent in each phase, keyed by phase name: [seconds, calls]
+_request_phases: ContextVar[Optional[Dict[str, List[float]]]] = ContextVar('request_phases', default=None)
+
+
+def start_request_timing() -> Dict[str, List[float]]:
+    """Begin collecting phase timings for the current request."""
+    phases: Dict[str, List[float]] = {}
+    _request_phases.set(phases)
+    return phases
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    """Attribute time to a phase of the current request, if one is being timed."""
+    phases = _request_phases.get()
+    if phases is not None:
+        entry = phases.setdefault(phase, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+
+
+def server_timing_header(phases: Dict[str, List[float]], total: float) -> str:
+    """Format phase timings as a Server-Timing header value."""
+    parts = [
+        f'{phase};dur={seconds * 1000:.1f};desc="{int(calls)} calls"'
+        for phase, (seconds, calls) in phases.items()
+    ]
+    parts.append(f'total;dur={total * 1000:.1f}')
+    return ', '.join(parts)
@@ -0,0 +1,63 @@
+import base64
+import json
+from typing import Any, List
+
+
+def encode_cursor(*values: Any, scope: str = '') -> str:
+    """Encode keyset values into an opaque, URL-safe cursor.
+
+    scope names the ordering the values belong to (see keyset_order), so a
+    cursor replayed under another sort is rejected instead of producing a
+    filter on the wrong column.
+    """
+    raw = json.dumps([scope] + [str(value) for value in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, size: int, scope: str = '') -> List[str]:
+    """Decode a cursor produced by encode_cursor, validating its arity and scope."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size + 1:
+        raise ValueError("Invalid cursor")
+    if values[0] != scope:
+        raise ValueError("Cursor does not match the requested sort order")
+    return [str(value) for value in values[1:]]
+
+
+def quote_filter_value(value: str) -> str:
+    """Quote a value for use inside a PostgREST logical (or/and) filter."""
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def keyset_filter(column: str, value: str, row_id: str, descending: bool) -> str:
+    """Build the PostgREST `or` filter selecting rows after (value, id)."""
+    op = 'lt' if descending else 'gt'
+    value = quote_filter_value(value)
+    row_id = quote_filter_value(row_id)
+    return f"{column}.{op}.{value},and({column}.eq.{value},id.{op}.{row_id})"
+
+
+def keyset_after(query: Any, column: str, value: str, row_id: str, descending: bool) -> Any:
+    """Restrict a PostgREST query to the rows after (value, id) in keyset order.
+
+    The pinned postgrest client has no or_() builder, so the filter is
+    added as a raw `or` query parameter.
+    """
+    query.params = query.params.add('or', f'({keyset_filter(column, value, row_id, descending)})')
+    return query
+
+
+def keyset_order(column: str, descending: bool) -> str:
+    """Build a single PostgREST order spec sorting by column, then id.
+
+    The pinned postgrest client adds one `order` query parameter per
+    .order() call and PostgREST honours only one of them, so the tie-break
+    on id has to travel in the same parameter.
+    """
+    direction = 'desc' if descending else 'asc'
+    return f'{column}.{direction},id.{direction}'
@@ -0,0 +1,200 @@
+import math
+from collections import defaultdict
+from threading import Lock
+from time import monotonic, time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import OAuth2PasswordRequestForm
+
+from .auth import get_current_user
+from .cache import LRUCache
+from .config import settings
+from .lazy import Lazy
+from .metrics import Counter, registry
+from ..schemas.user import User
+
+RATE_LIMITED = registry.register(Counter(
+    'jobtrack_rate_limited_total',
+    'Requests rejected by rate limiting or load shedding',
+    ('group', 'reason')
+))
+
+# Atomically refills and takes cost tokens (see MemoryRateLimitBackend.take);
+# returns 0 when allowed, otherwise the milliseconds until it would be.
+_REDIS_TAKE = """
+local tokens = tonumber(redis.call('HGET', KEYS[1], 't') or ARGV[2])
+local updated = tonumber(redis.call('HGET', KEYS[1], 'u') or ARGV[3])
+local rate, burst, now, cost = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3]), tonumber(ARGV[4])
+tokens = math.min(burst, tokens + (now - updated) * rate)
+local needed = math.min(cost, burst)
+local wait = 0
+if tokens >= needed then
+    tokens = tokens - cost
+else
+    wait = math.ceil((needed - tokens) / rate * 1000)
+end
+redis.call('HSET', KEYS[1], 't', tokens, 'u', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((burst + cost) / rate * 1000))
+return wait
+"""
+
+
+class MemoryRateLimitBackend:
+    """Token buckets held in process memory, one per key."""
+
+    def __init__(self, max_keys: int):
+        self.buckets = LRUCache(maxsize=max_keys)
+        self._lock = Lock()
+
+    async def take(self, key: str, rate: float, burst: int, cost: int = 1) -> float:
+        """Take cost tokens from key's bucket; return 0 or the seconds to wait.
+
+        A cost above burst is admitted from a full bucket and leaves it in
+        debt, so large requests are charged in full without being refused
+        forever.
+        """
+        now = monotonic()
+        needed = min(cost, burst)
+        with self._lock:
+            tokens, updated = self.buckets.get(key) or (burst, now)
+            tokens = min(burst, tokens + (now - updated) * rate)
+            if tokens >= needed:
+                self.buckets.set(key, (tokens - cost, now))
+                return 0.0
+            self.buckets.set(key, (tokens, now))
+            return (needed - tokens) / rate
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisRateLimitBackend:
+    """Token buckets in Redis, shared by every worker and instance."""
+
+    def __init__(self, url: str):
+        # Optional dependency, only needed for RATE_LIMIT_BACKEND=redis
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url)
+        self._take = self.client.register_script(_REDIS_TAKE)
+
+    async def take(self, key: str, rate: float, burst: int, cost: int = 1) -> float:
+        wait_ms = await self._take(keys=[f'ratelimit:{key}'], args=[rate, burst, time(), cost])
+        return int(wait_ms) / 1000
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+def build_rate_limit_backend():
+    """Create the bucket store configured by RATE_LIMIT_BACKEND."""
+    if settings.rate_limit_backend == 'redis':
+        if not settings.rate_limit_redis_url:
+            raise ValueError('RATE_LIMIT_REDIS_URL is required for the redis rate limit backend')
+        return RedisRateLimitBackend(settings.rate_limit_redis_url)
+    if settings.rate_limit_backend == 'memory':
+        return MemoryRateLimitBackend(settings.rate_limit_max_keys)
+    raise ValueError(f'Unknown RATE_LIMIT_BACKEND: {settings.rate_limit_backend}')
+
+
+rate_limit_backend = Lazy(build_rate_limit_backend, 'rate_limit_backend')
+
+# Requests currently admitted per route group
+_in_flight: Dict[str, int] = defaultdict(int)
+
+
+def _budget(group: str) -> Tuple[float, int]:
+    per_minute = getattr(settings, f'rate_limit_{group}_per_minute')
+    return per_minute / 60, getattr(settings, f'rate_limit_{group}_burst')
+
+
+def _client_ip(request: Request) -> str:
+    peer = request.client.host if request.client else 'unknown'
+    trusted = settings.rate_limit_trusted_proxies
+    if peer not in trusted:
+        return peer
+    forwarded = request.headers.get('x-forwarded-for', '')
+    # Walk back from the nearest hop past our own proxies; addresses further
+    # left were supplied by the client and could be spoofed
+    for address in reversed(forwarded.split(',')):
+        address = address.strip()
+        if address and address not in trusted:
+            return address
+    return peer
+
+
+async def _check(group: str, key: str, cost: int = 1) -> None:
+    rate, burst = _budget(group)
+    wait = await rate_limit_backend.take(f'{group}:{key}', rate, burst, cost)
+    if wait:
+        RATE_LIMITED.inc(group=group, reason='rate')
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please retry later",
+            headers={"Retry-After": str(math.ceil(wait))}
+        )
+
+
+async def charge(group: str, request: Request, user_id: Optional[Any], cost: int) -> None:
+    """Take cost tokens from group's per-IP budget and, given one, the user's.
+
+    For routes whose cost is only known in the handler, e.g. the number of
+    model completions a batch fans out to.
+    """
+    if not settings.rate_limit_enabled or cost <= 0:
+        return
+    await _check(group, f'ip:{_client_ip(request)}', cost)
+    if user_id is not None:
+        await _check(group, f'user:{user_id}', cost)
+
+
+def rate_limit(group: str, cost: int = 1) -> Callable[..., AsyncIterator[None]]:
+    """Dependency admitting a request against group's per-IP budget.
+
+    Requests beyond RATE_LIMIT_<GROUP>_MAX_IN_FLIGHT concurrent ones are
+    shed with 503 before any bucket is touched. With cost=0 only load
+    shedding applies and the handler charges the budget itself.
+    """
+    async def dependency(request: Request) -> AsyncIterator[None]:
+        if not settings.rate_limit_enabled:
+            yield
+            return
+        if _in_flight[group] >= getattr(settings, f'rate_limit_{group}_max_in_flight'):
+            RATE_LIMITED.inc(group=group, reason='load')
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please retry shortly",
+                headers={"Retry-After": "1"}
+            )
+        if cost:
+            await _check(group, f'ip:{_client_ip(request)}', cost)
+        _in_flight[group] += 1
+        try:
+            yield
+        finally:
+            _in_flight[group] -= 1
+
+    return dependency
+
+
+def user_rate_limit(group: str) -> Callable[..., Awaitable[None]]:
+    """Dependency admitting a request against group's per-user budget."""
+    async def dependency(current_user: User = Depends(get_current_user)) -> None:
+        if settings.rate_limit_enabled:
+            await _check(group, f'user:{current_user.id}')
+
+    return dependency
+
+
+def username_rate_limit(group: str) -> Callable[..., Awaitable[None]]:
+    """Dependency admitting a login against a budget per submitted username.
+
+    Complements the per-IP budget: credential stuffing spread over many
+    addresses still runs into the limit of each account it targets.
+    """
+    async def dependency(form_data: OAuth2PasswordRequestForm = Depends()) -> None:
+        if settings.rate_limit_enabled:
+            await _check(group, f'username:{form_data.username.strip().lower()}')
+
+    return dependency
@@ -0,0 +1,80 @@
+from time import time
+from typing import Dict, Optional, Tuple
+
+from .config import settings
+from .lazy import Lazy
+
+
+class MemoryRevocationStore:
+    """Revocations held in process memory.
+
+    Only the worker that handled a logout or password change sees it, and
+    a restart forgets it; use the redis backend with several workers.
+    """
+
+    def __init__(self):
+        # Revoked token ids until they expire
+        self.jtis: Dict[str, float] = {}
+        # Per subject, the time before which every issued token is revoked
+        self.subjects: Dict[str, Tuple[float, float]] = {}
+
+    async def revoke_token(self, jti: str, expires_at: float) -> None:
+        now = time()
+        for stale in [jti for jti, expiry in self.jtis.items() if expiry <= now]:
+            del self.jtis[stale]
+        self.jtis[jti] = expires_at
+
+    async def revoke_subject(self, subject: str, revoked_at: float, ttl: float) -> None:
+        now = time()
+        for stale in [sub for sub, (_, expiry) in self.subjects.items() if expiry <= now]:
+            del self.subjects[stale]
+        self.subjects[subject] = (revoked_at, revoked_at + ttl)
+
+    async def lookup(self, jti: Optional[str], subject: Optional[str]) -> Tuple[bool, Optional[float]]:
+        """Return whether jti is revoked and the subject's revoked-before time."""
+        entry = self.subjects.get(subject)
+        return jti in self.jtis, entry[0] if entry else None
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisRevocationStore:
+    """Revocations in Redis, shared by every worker and kept across restarts."""
+
+    def __init__(self, url: str):
+        # Optional dependency, only needed for TOKEN_REVOCATION_BACKEND=redis
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url)
+
+    async def revoke_token(self, jti: str, expires_at: float) -> None:
+        ttl = max(1, int(expires_at - time()) + 1)
+        await self.client.set(f'revoked:jti:{jti}', 1, ex=ttl)
+
+    async def revoke_subject(self, subject: str, revoked_at: float, ttl: float) -> None:
+        await self.client.set(f'revoked:sub:{subject}', repr(revoked_at), ex=int(ttl) + 1)
+
+    async def lookup(self, jti: Optional[str], subject: Optional[str]) -> Tuple[bool, Optional[float]]:
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.exists(f'revoked:jti:{jti}')
+            pipe.get(f'revoked:sub:{subject}')
+            revoked, revoked_before = await pipe.execute()
+        return bool(revoked), float(revoked_before) if revoked_before is not None else None
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+def build_revocation_store():
+    """Create the revocation store configured by TOKEN_REVOCATION_BACKEND."""
+    if settings.token_revocation_backend == 'redis':
+        if not settings.token_revocation_redis_url:
+            raise ValueError('TOKEN_REVOCATION_REDIS_URL is required for the redis revocation backend')
+        return RedisRevocationStore(settings.token_revocation_redis_url)
+    if settings.token_revocation_backend == 'memory':
+        return MemoryRevocationStore()
+    raise ValueError(f'Unknown TOKEN_REVOCATION_BACKEND: {settings.token_revocation_backend}')
+
+
+revocation_store = Lazy(build_revocation_store, 'revocation_store')
@@ -1,10 +1,35 @@
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from time import perf_counter, time
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import uuid4
 
 import bcrypt
+from fastapi import HTTPException, status
 from jose import JWTError, jwt
 
+from .cache import LRUCache
 from .config import settings
+from .lazy import Lazy
+from .metrics import BCRYPT_LATENCY, record_phase
+from .revocation import revocation_store
+
+_pending_hash_tasks = 0
+
+# Claims of recently verified tokens, keyed by a digest of the token
+token_cache: LRUCache = Lazy(lambda: LRUCache(maxsize=settings.token_cache_size), 'token_cache')
+
+@lru_cache(maxsize=None)
+def _hash_executor() -> ThreadPoolExecutor:
+    # bcrypt releases the GIL, so hashing on a small dedicated pool keeps the
+    # event loop responsive during login/registration bursts.
+    return ThreadPoolExecutor(
+        max_workers=settings.password_hash_workers,
+        thread_name_prefix='bcrypt'
+    )
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
@@ -15,9 +40,44 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """Generate password hash."""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
     return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
+async def _run_hash_task(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a bcrypt call on the hashing pool, shedding load when it is saturated."""
+    global _pending_hash_tasks
+    capacity = settings.password_hash_workers + settings.password_hash_queue_limit
+    if _pending_hash_tasks >= capacity:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please retry shortly",
+            headers={"Retry-After": "1"}
+        )
+
+    def timed():
+        started = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            BCRYPT_LATENCY.observe(perf_counter() - started, operation=func.__name__)
+
+    _pending_hash_tasks += 1
+    submitted = perf_counter()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor(), timed)
+    finally:
+        _pending_hash_tasks -= 1
+        record_phase('bcrypt', perf_counter() - submitted)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing pool."""
+    return await _run_hash_task(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """Generate a password hash on the hashing pool."""
+    return await _run_hash_task(get_password_hash, password)
+
 def create_tokens(email: str, role: str) -> Tuple[str, str]:
     """Create access and refresh tokens."""
     # Access token with shorter expiry
@@ -43,7 +103,7 @@ def create_token(data: Dict, expires_delta: Optional[timedelta] = None) -> str:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": time(), "jti": uuid4().hex})
     encoded_jwt = jwt.encode(
         to_encode,
         settings.secret_key,
@@ -51,16 +111,50 @@ def create_token(data: Dict, expires_delta: Optional[timedelta] = None) -> str:
     )
     return encoded_jwt
 
-def verify_token(token: str, token_type: str = "access") -> Optional[Dict]:
-    """Verify and decode a JWT token."""
-    try:
-        payload = jwt.decode(
-            token,
-            settings.secret_key,
-            algorithms=[settings.algorithm]
-        )
-        if payload.get("type") != token_type:
+def decode_token(token: str) -> Optional[Dict]:
+    """Verify a JWT's signature and expiry and return its claims.
+
+    The signature is checked once per token; later calls are served from
+    token_cache until the token expires. Returns None for an invalid token.
+    """
+    key = hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+    payload = token_cache.get(key)
+    if payload is None or payload["exp"] <= time():
+        try:
+            payload = jwt.decode(
+                token,
+                settings.secret_key,
+                algorithms=[settings.algorithm]
+            )
+        except JWTError:
+            token_cache.pop(key)
             return None
-        return payload
-    except JWTError:
+        token_cache.set(key, payload)
+    return payload
+
+async def verify_token(token: str, token_type: str = "access") -> Optional[Dict]:
+    """Verify and decode a JWT token of the given type.
+
+    Type and revocation are checked on every call, after the cached
+    signature check in decode_token. Returns None for any invalid token.
+    """
+    payload = decode_token(token)
+    if payload is None or payload.get("type") != token_type or await is_token_revoked(payload):
         return None
+    return payload
+
+async def is_token_revoked(payload: Dict) -> bool:
+    revoked, revoked_before = await revocation_store.lookup(payload.get("jti"), payload.get("sub"))
+    # Tokens without iat predate revocation support and are treated as old
+    return revoked or (revoked_before is not None and payload.get("iat", 0) < revoked_before)
+
+async def revoke_token(payload: Dict) -> None:
+    """Revoke a single token, e.g. on logout."""
+    if payload.get("jti"):
+        await revocation_store.revoke_token(payload["jti"], payload["exp"])
+
+async def revoke_user_tokens(subject: str) -> None:
+    """Revoke every token issued to subject so far, e.g. on password change."""
+    # Kept as long as the longest-lived token issued before it
+    ttl = timedelta(days=settings.refresh_token_expire_days).total_seconds()
+    await revocation_store.revoke_subject(subject, time(), ttl)
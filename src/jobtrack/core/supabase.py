@@ -1,10 +1,173 @@
+import asyncio
+import importlib.util
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
 from supabase import create_client, Client
 
 from .config import settings
+from .lazy import Lazy
+from .metrics import SUPABASE_LATENCY, record_phase
+
+logger = logging.getLogger(__name__)
+
+
+class SupabasePool:
+    """Process-wide Supabase client on a pooled, keep-alive HTTP session.
+
+    supabase-py is synchronous, so queries are checked out onto a bounded
+    worker pool to keep slow PostgREST calls from stalling the event loop.
+    Every service shares the one client and connection pool, and the pool
+    records checkout wait and query latency for sizing workers.
+    """
+
+    def __init__(self):
+        self.client = create_client(settings.supabase_url, settings.supabase_key)
+        self.size = settings.supabase_max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix='supabase')
+        self._replace_session()
+        self._lock = Lock()
+        self.in_flight = 0
+        self.waiting = 0
+        self.checkouts = 0
+        self.errors = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.query_seconds_total = 0.0
+        self.healthy = True
+
+    def _replace_session(self) -> None:
+        """Swap the PostgREST session for one with explicit pool limits."""
+        http2 = settings.supabase_http2 and importlib.util.find_spec('h2') is not None
+        if settings.supabase_http2 and not http2:
+            logger.warning("SUPABASE_HTTP2 is enabled but the h2 package is not installed; using HTTP/1.1")
+        postgrest = self.client.postgrest
+        old_session = postgrest.session
+        postgrest.session = httpx.Client(
+            base_url=old_session.base_url,
+            headers=old_session.headers,
+            timeout=old_session.timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.supabase_max_connections,
+                max_keepalive_connections=settings.supabase_max_connections,
+                keepalive_expiry=settings.supabase_keepalive_seconds
+            )
+        )
+        old_session.close()
+
+    async def execute(self, query: Any) -> Any:
+        """Execute a PostgREST query builder on the pool."""
+        submitted = perf_counter()
+        # Whether the worker picked the query up, or the caller gave up first
+        checkout = {'started': False, 'abandoned': False}
+        with self._lock:
+            self.waiting += 1
+
+        def run():
+            started = perf_counter()
+            wait = started - submitted
+            with self._lock:
+                if checkout['abandoned']:
+                    return None
+                checkout['started'] = True
+                self.waiting -= 1
+                self.in_flight += 1
+                self.checkouts += 1
+                self.wait_seconds_total += wait
+                self.wait_seconds_max = max(self.wait_seconds_max, wait)
+            try:
+                return query.execute()
+            except Exception:
+                with self._lock:
+                    self.errors += 1
+                raise
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+                    self.query_seconds_total += perf_counter() - started
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, run)
+        finally:
+            with self._lock:
+                # Cancelled while queued: the query never ran and never will
+                if not checkout['started']:
+                    checkout['abandoned'] = True
+                    self.waiting -= 1
+            elapsed = perf_counter() - submitted
+            SUPABASE_LATENCY.observe(elapsed)
+            record_phase('supabase', elapsed)
+
+    async def health_check(self) -> bool:
+        """Probe PostgREST with a minimal query and record the outcome."""
+        try:
+            await self.execute(self.client.table('users').select('id').limit(1))
+            self.healthy = True
+        except Exception as e:
+            logger.warning("Supabase health check failed: %s", e)
+            self.healthy = False
+        return self.healthy
+
+    async def run_health_checks(self) -> None:
+        """Health-check the pool periodically until cancelled."""
+        while True:
+            await asyncio.sleep(settings.supabase_health_check_seconds)
+            await self.health_check()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool size, utilisation and latency counters."""
+        with self._lock:
+            return {
+                'size': self.size,
+                'max_connections': settings.supabase_max_connections,
+                'in_flight': self.in_flight,
+                'waiting': self.waiting,
+                'checkouts': self.checkouts,
+                'errors': self.errors,
+                'wait_seconds_total': self.wait_seconds_total,
+                'wait_seconds_max': self.wait_seconds_max,
+                'wait_seconds_avg': self.wait_seconds_total / self.checkouts if self.checkouts else 0.0,
+                'query_seconds_total': self.query_seconds_total,
+                'healthy': self.healthy
+            }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self.client.postgrest.session.close()
+
+
+supabase_pool: SupabasePool = Lazy(SupabasePool, 'supabase_pool')
 
 def get_supabase() -> Client:
-    """Get Supabase client instance."""
-    return create_client(settings.supabase_url, settings.supabase_key)
+    """Get the shared Supabase client instance."""
+    return supabase_pool.client
+
+async def execute(query: Any) -> Any:
+    """Execute a PostgREST query builder without blocking the event loop."""
+    return await supabase_pool.execute(query)
+
+async def fetch_all(build_query: Callable[[], Any], page_size: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Fetch every row a query matches, paging past PostgREST's max-rows cap.
+
+    build_query returns a fresh builder per page; rows are ordered by id so
+    pages do not overlap. Paging stops on an empty page rather than a short
+    one, so a server cap below the page size cannot silently truncate.
+    """
+    page_size = page_size or settings.supabase_page_size
+    rows: List[Dict[str, Any]] = []
+    while True:
+        # The pinned postgrest client treats the end of range() as exclusive
+        query = build_query().order('id').range(len(rows), len(rows) + page_size)
+        page = (await execute(query)).data
+        if not page:
+            return rows
+        rows.extend(page)
 
 def init_supabase_schema():
     """Initialize Supabase database schema."""
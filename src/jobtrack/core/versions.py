@@ -0,0 +1,99 @@
+from typing import Any, Dict, Optional
+
+from .config import settings
+from .lazy import Lazy
+
+
+class MemoryVersionStore:
+    """Per-user data versions held in process memory.
+
+    Only the worker that handled a write sees its bump, and a restart
+    starts every user from zero again; use the redis backend with several
+    workers.
+    """
+
+    # Whether every worker sees the same versions
+    shared = False
+
+    def __init__(self):
+        self.versions: Dict[str, int] = {}
+
+    async def get(self, user_id: str) -> int:
+        return self.versions.get(user_id, 0)
+
+    async def bump(self, user_id: str) -> int:
+        self.versions[user_id] = self.versions.get(user_id, 0) + 1
+        return self.versions[user_id]
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisVersionStore:
+    """Per-user data versions in Redis, shared by every worker."""
+
+    shared = True
+
+    def __init__(self, url: str):
+        # Optional dependency, only needed for DATA_VERSION_BACKEND=redis
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url)
+
+    async def get(self, user_id: str) -> int:
+        return int(await self.client.get(f'version:{user_id}') or 0)
+
+    async def bump(self, user_id: str) -> int:
+        return await self.client.incr(f'version:{user_id}')
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+def build_version_store():
+    """Create the version store configured by DATA_VERSION_BACKEND."""
+    if settings.data_version_backend == 'redis':
+        if not settings.data_version_redis_url:
+            raise ValueError('DATA_VERSION_REDIS_URL is required for the redis data version backend')
+        return RedisVersionStore(settings.data_version_redis_url)
+    if settings.data_version_backend == 'memory':
+        return MemoryVersionStore()
+    raise ValueError(f'Unknown DATA_VERSION_BACKEND: {settings.data_version_backend}')
+
+
+data_versions = Lazy(build_version_store, 'data_versions')
+
+
+async def get_version(user_id: Any) -> int:
+    """Return the version of a user's data, which changes on every write."""
+    return await data_versions.get(str(user_id))
+
+
+async def bump_version(user_id: Any) -> int:
+    """Invalidate every cached read for a user after one of their writes.
+
+    Returns the new version, so a caller that already holds the previous
+    one can tell that no other write happened in between.
+    """
+    return await data_versions.bump(str(user_id))
+
+
+def advance_cached(cache: Any, key: Any, version: int) -> Optional[Any]:
+    """Return a value cached as (version, value) for in-place update by a write.
+
+    version is the one the write's bump_version returned. A value built
+    one version earlier misses only this write and is returned to be
+    patched; one already at version was built after the write (or is
+    being patched for another part of it) and is returned too, so the
+    patches must be idempotent. Anything older also missed writes handled
+    elsewhere and is dropped, to be rebuilt on its next read.
+    """
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    if cached[0] not in (version - 1, version):
+        cache.pop(key)
+        return None
+    if cached[0] != version:
+        cache.set(key, (version, cached[1]))
+    return cached[1]
@@ -1,40 +1,162 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from datetime import timedelta
+from time import perf_counter
 from typing import List, Optional, Any
 from uuid import UUID
-from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi import Depends, FastAPI, File, HTTPException, Query, UploadFile, status
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse, StreamingResponse
 from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import TypeAdapter
 
 from .core.config import settings
 from .core.auth import get_current_user
-from .core.supabase import init_supabase_schema
+from .core.http_cache import cached_json_response, response_cache
+from .core.metrics import (
+    REQUEST_LATENCY,
+    SUPABASE_CALLS_PER_REQUEST,
+    Gauge,
+    registry,
+    server_timing_header,
+    start_request_timing
+)
+from .core.ratelimit import rate_limit_backend
+from .core.revocation import revocation_store
+from .core.supabase import init_supabase_schema, supabase_pool
+from .core.versions import data_versions
 from .routes import auth, ai
-from .schemas.job import Job, JobCreate, JobUpdate, JobInteraction, JobInteractionCreate
+from .schemas.job import (
+    Job,
+    JobBulkStatusUpdate,
+    JobBulkUpdateResult,
+    JobCreate,
+    JobUpdate,
+    JobInteraction,
+    JobInteractionBatchCreate,
+    JobInteractionCreate,
+    JobInteractionPage,
+    JobFileFormat,
+    JobFilters,
+    JobImportResult,
+    JobInclude,
+    JobSearchPage,
+    JobSortField,
+    JobStats,
+    JobStatus,
+    RemoteType,
+    SortOrder
+)
 from .schemas.user import User
 from .services.job import (
     create_job,
-    get_user_jobs,
+    bulk_update_status,
+    list_user_jobs,
+    get_job_stats,
+    search_jobs,
     get_job,
     update_job,
     delete_job,
     create_job_interaction,
-    get_job_interactions
+    create_job_interactions,
+    get_job_interactions,
+    get_job_timeline
 )
+from .services.job_io import import_jobs, export_jobs
+from .services.ai import ai_service
+from .services.job import job_service
+from .services.stats import stats_service
+from .services.tasks import task_queue
+from .services.user import user_service
+
+logger = logging.getLogger("jobtrack.startup")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build settings, services and clients at startup rather than at import."""
+    started = perf_counter()
+    providers = (
+        settings, supabase_pool, user_service, job_service, stats_service, ai_service,
+        rate_limit_backend, revocation_store, data_versions
+    )
+    for provider in providers:
+        provider.resolve()
+    init_supabase_schema()
+    await task_queue.start()
+    health_checks = asyncio.create_task(supabase_pool.run_health_checks())
+    logger.info("Startup completed in %.1f ms", (perf_counter() - started) * 1000)
+    yield
+    health_checks.cancel()
+    await task_queue.stop()
+    if ai_service.initialized:
+        await ai_service.close()
+    if rate_limit_backend.initialized:
+        await rate_limit_backend.close()
+    if revocation_store.initialized:
+        await revocation_store.close()
+    if data_versions.initialized:
+        await data_versions.close()
+    supabase_pool.close()
+
+app = FastAPI(title="JobTrack AI", lifespan=lifespan)
+
+class SettingsCORSMiddleware(CORSMiddleware):
+    """CORS middleware that reads its origins when the app starts, not at import."""
 
-app = FastAPI(title="JobTrack AI")
+    def __init__(self, app):
+        super().__init__(
+            app,
+            allow_origins=settings.cors_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+            expose_headers=["X-Next-Cursor", "ETag"],
+        )
 
 # Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(SettingsCORSMiddleware)
+
+@app.middleware("http")
+async def time_requests(request: Request, call_next):
+    """Record request latency and Supabase calls per route template."""
+    phases = start_request_timing()
+    started = perf_counter()
+    response = await call_next(request)
+    elapsed = perf_counter() - started
+    route = getattr(request.scope.get("route"), "path", "unmatched")
+    REQUEST_LATENCY.observe(elapsed, method=request.method, route=route, status=response.status_code)
+    SUPABASE_CALLS_PER_REQUEST.observe(phases.get("supabase", (0, 0))[1], route=route)
+    if settings.debug_timing_header:
+        response.headers["Server-Timing"] = server_timing_header(phases, elapsed)
+    return response
+
+def _cache_stats():
+    caches = {}
+    if response_cache.initialized:
+        caches["response"] = response_cache
+    if user_service.initialized:
+        caches["user"] = user_service.user_cache
+    if stats_service.initialized:
+        caches["stats"] = stats_service.summaries
+    if ai_service.initialized and ai_service.cache is not None:
+        caches["ai"] = ai_service.cache
+    return {name: cache.stats() for name, cache in caches.items()}
+
+def _collect_cache_stat(stat: str):
+    return lambda: {(name,): stats[stat] for name, stats in _cache_stats().items() if stat in stats}
+
+def _collect_pool_stats():
+    if not supabase_pool.initialized:
+        return {}
+    return {(name,): value for name, value in supabase_pool.stats().items() if isinstance(value, (int, float))}
+
+for stat in ("hits", "misses", "size"):
+    registry.register(Gauge(f"jobtrack_cache_{stat}", f"Cache {stat} by cache", ("cache",), _collect_cache_stat(stat)))
+registry.register(Gauge("jobtrack_supabase_pool", "Supabase pool utilisation", ("stat",), _collect_pool_stats))
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="src/jobtrack/static"), name="static")
@@ -42,15 +164,23 @@ app.mount("/static", StaticFiles(directory="src/jobtrack/static"), name="static"
 # Initialize templates
 templates = Jinja2Templates(directory="src/jobtrack/templates")
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database schema on startup"""
-    init_supabase_schema()
-
 # Include routers
 app.include_router(auth.router)
 app.include_router(ai.router)
 
+@app.get("/health")
+async def health() -> Any:
+    """Report service health and Supabase pool utilisation."""
+    pool = supabase_pool.stats()
+    return {"status": "ok" if pool["healthy"] else "degraded", "supabase_pool": pool}
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """Expose latency histograms and cache counters in Prometheus text format."""
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
 # Frontend routes
 @app.get("/", response_class=HTMLResponse)
 async def read_root(request: Request):
@@ -69,31 +199,155 @@ async def dashboard_page(request: Request):
     return templates.TemplateResponse("dashboard.html", {"request": request})
 
 # Job endpoints
+# Reads return already-validated Job models; these serialize them directly
+# instead of re-validating against response_model.
+JOB_ADAPTER = TypeAdapter(Job)
+JOB_LIST_ADAPTER = TypeAdapter(List[Job])
+
 @app.post("/jobs/", response_model=Job)
 async def create_new_job(
     job: JobCreate,
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """Create a new job entry."""
-    return create_job(current_user.id, job)
+    return await create_job(current_user.id, job)
 
 @app.get("/jobs/", response_model=List[Job])
 async def read_user_jobs(
+    request: Request,
+    status: Optional[List[JobStatus]] = Query(None),
+    remote_type: Optional[List[RemoteType]] = Query(None),
+    salary_min: Optional[int] = None,
+    salary_max: Optional[int] = None,
+    company: Optional[str] = None,
+    sort: JobSortField = JobSortField.APPLIED_DATE,
+    order: SortOrder = SortOrder.DESC,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = None,
+    summary: bool = False,
+    include: List[JobInclude] = Query([]),
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """Get the current user's jobs.
+
+    Without a limit every matching job is returned. With a limit the next
+    page cursor, if any, is returned in the X-Next-Cursor header.
+    Pass include=interactions to embed each job's interactions.
+    Supports If-None-Match revalidation against the returned ETag.
+    """
+    filters = JobFilters(
+        status=status,
+        remote_type=remote_type,
+        salary_min=salary_min,
+        salary_max=salary_max,
+        company=company
+    )
+
+    async def build():
+        try:
+            page = await list_user_jobs(
+                current_user.id,
+                filters=filters,
+                sort=sort,
+                order=order,
+                limit=limit,
+                cursor=cursor,
+                summary=summary,
+                include_interactions=JobInclude.INTERACTIONS in include
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else {}
+        return page.items, headers
+
+    return await cached_json_response(request, current_user.id, build, JOB_LIST_ADAPTER)
+
+@app.get("/jobs/stats", response_model=JobStats)
+async def read_job_stats(
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """Get application statistics for the current user."""
+    return await get_job_stats(current_user.id)
+
+@app.get("/jobs/search", response_model=JobSearchPage)
+async def search_user_jobs(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user)
 ) -> Any:
-    """Get all jobs for the current user."""
-    return get_user_jobs(current_user.id)
+    """Full-text search over the current user's jobs and interaction notes.
+
+    Results are ranked by relevance and carry snippets with matched terms
+    wrapped in <mark>; pass next_cursor back to get the next page.
+    """
+    try:
+        return await search_jobs(current_user.id, q, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/jobs/bulk-status", response_model=JobBulkUpdateResult)
+async def bulk_update_job_status(
+    update: JobBulkStatusUpdate,
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """Change the status of many jobs at once, selected by id or by filter."""
+    if (update.job_ids is None) == (update.filter is None):
+        raise HTTPException(status_code=400, detail="Provide exactly one of job_ids or filter")
+    if update.job_ids is not None and len(update.job_ids) > settings.job_bulk_update_max_ids:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.job_bulk_update_max_ids} job ids per request"
+        )
+    if update.filter is not None and not any(update.filter.model_dump().values()):
+        raise HTTPException(status_code=400, detail="Filter must set at least one condition")
+    return await bulk_update_status(
+        current_user.id,
+        update.status,
+        job_ids=update.job_ids,
+        filters=update.filter
+    )
+
+@app.post("/jobs/import", response_model=JobImportResult)
+async def import_user_jobs(
+    file: UploadFile = File(...),
+    format: Optional[JobFileFormat] = None,
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """Bulk import jobs from an uploaded CSV or NDJSON file."""
+    if format is None:
+        filename = (file.filename or '').lower()
+        format = JobFileFormat.NDJSON if filename.endswith(('.ndjson', '.jsonl')) else JobFileFormat.CSV
+    return await import_jobs(current_user.id, file.file, format)
+
+@app.get("/jobs/export")
+async def export_user_jobs(
+    format: JobFileFormat = JobFileFormat.CSV,
+    current_user: User = Depends(get_current_user)
+) -> StreamingResponse:
+    """Stream all of the current user's jobs as CSV or NDJSON."""
+    media_type = 'text/csv' if format == JobFileFormat.CSV else 'application/x-ndjson'
+    return StreamingResponse(
+        export_jobs(current_user.id, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="jobs.{format.value}"'}
+    )
 
 @app.get("/jobs/{job_id}", response_model=Job)
 async def read_job(
+    request: Request,
     job_id: UUID,
+    include: List[JobInclude] = Query([]),
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """Get a specific job by ID."""
-    job = get_job(job_id, current_user.id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    return job
+    async def build():
+        job = await get_job(job_id, current_user.id, JobInclude.INTERACTIONS in include)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job, {}
+
+    return await cached_json_response(request, current_user.id, build, JOB_ADAPTER)
 
 @app.patch("/jobs/{job_id}", response_model=Job)
 async def update_existing_job(
@@ -102,7 +356,7 @@ async def update_existing_job(
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """Update a job entry."""
-    job = update_job(job_id, current_user.id, job_update)
+    job = await update_job(job_id, current_user.id, job_update)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job
@@ -113,7 +367,7 @@ async def delete_existing_job(
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """Delete a job entry."""
-    if not delete_job(job_id, current_user.id):
+    if not await delete_job(job_id, current_user.id):
         raise HTTPException(status_code=404, detail="Job not found")
     return {"message": "Job deleted successfully"}
 
@@ -124,12 +378,10 @@ async def create_new_job_interaction(
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """Create a new interaction for a job."""
-    # Verify job exists and belongs to user
-    job = get_job(job_id, current_user.id)
-    if not job:
+    created = await create_job_interaction(job_id, current_user.id, interaction)
+    if created is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    
-    return create_job_interaction(interaction)
+    return created
 
 @app.get("/jobs/{job_id}/interactions/", response_model=List[JobInteraction])
 async def read_job_interactions(
@@ -137,9 +389,41 @@ async def read_job_interactions(
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """Get all interactions for a job."""
-    # Verify job exists and belongs to user
-    job = get_job(job_id, current_user.id)
-    if not job:
+    interactions = await get_job_interactions(job_id, current_user.id)
+    if interactions is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return interactions
+
+@app.post("/jobs/{job_id}/interactions/batch", response_model=List[JobInteraction])
+async def create_job_interactions_batch(
+    job_id: UUID,
+    batch: JobInteractionBatchCreate,
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """Create several interactions for a job in one insert."""
+    if len(batch.interactions) > settings.job_interaction_batch_max:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.job_interaction_batch_max} interactions per batch"
+        )
+    created = await create_job_interactions(job_id, current_user.id, batch.interactions)
+    if created is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return created
+
+@app.get("/jobs/{job_id}/timeline", response_model=JobInteractionPage)
+async def read_job_timeline(
+    job_id: UUID,
+    order: SortOrder = SortOrder.ASC,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """Get a job's interactions ordered by date, one page at a time."""
+    try:
+        page = await get_job_timeline(job_id, current_user.id, order=order, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    
-    return get_job_interactions(job_id)
+    return page
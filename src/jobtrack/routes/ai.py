@@ -1,12 +1,53 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Optional
+import json
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Dict, List, Optional
+from uuid import UUID
 from ..core.auth import get_current_user
+from ..core.config import settings
+from ..core.ratelimit import charge, rate_limit, user_rate_limit
+from ..schemas.ai import (
+    AITask,
+    AITaskCreate,
+    AITaskResult,
+    BatchMatchRequest,
+    RankedJob,
+    RankJobsRequest
+)
 from ..schemas.user import User
 from ..services.ai import ai_service
+from ..services.job import job_service
+from ..services.ranking import ranking_service
+from ..services.tasks import task_queue
 
 router = APIRouter(prefix="/ai", tags=["ai"])
 
-@router.post("/analyze-resume")
+# Paid model calls: throttled per client IP and per user, one token per
+# completion. Background tasks run one completion each, charged on submit;
+# batch routes take one token up front and charge each completion on top.
+AI_LIMITS = [Depends(rate_limit("ai")), Depends(user_rate_limit("ai"))]
+
+async def _sse_events(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Frame text chunks as Server-Sent Events, ending with a done/error event."""
+    try:
+        async for chunk in chunks:
+            yield f"data: {json.dumps(chunk)}\n\n"
+    except Exception as e:
+        yield f"event: error\ndata: {json.dumps(str(e))}\n\n"
+    else:
+        yield "event: done\ndata: {}\n\n"
+    finally:
+        # Runs on client disconnect too, cancelling the upstream completion
+        await chunks.aclose()
+
+def _sse_response(chunks: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(
+        _sse_events(chunks),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/analyze-resume", dependencies=AI_LIMITS)
 async def analyze_resume(
     resume_text: str,
     current_user: User = Depends(get_current_user)
@@ -17,7 +58,7 @@ async def analyze_resume(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/match-job")
+@router.post("/match-job", dependencies=AI_LIMITS)
 async def match_job(
     job_description: str,
     resume_analysis: Dict,
@@ -29,7 +70,92 @@ async def match_job(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/generate-cover-letter")
+def _ndjson(item: Dict) -> str:
+    return json.dumps(item, default=str) + "\n"
+
+def _parse_result(content: str):
+    try:
+        return json.loads(content)
+    except (TypeError, ValueError):
+        return content
+
+@router.post("/match-jobs", dependencies=AI_LIMITS)
+async def match_jobs(
+    request: Request,
+    batch: BatchMatchRequest,
+    current_user: User = Depends(get_current_user)
+) -> StreamingResponse:
+    """Match one resume analysis against many of the user's jobs.
+
+    Results stream back as NDJSON lines in completion order; a failed
+    match is reported on its own line without aborting the batch. With
+    top_k (or without job_ids) the jobs are first pre-ranked locally and
+    only the top_k most similar are sent to the model. The AI budget is
+    charged one token per request, before any ranking, plus one per
+    distinct description sent to the model.
+    """
+    scores: Dict = {}
+    missing: List[UUID] = []
+    if batch.job_ids is None or batch.top_k:
+        top_k = min(batch.top_k or settings.ai_prerank_top_k, settings.ai_batch_match_max_jobs)
+        ranked = await ranking_service.rank(current_user.id, batch.resume_analysis, top_k, batch.job_ids)
+        scores = dict(ranked)
+        job_ids = list(scores)
+        if batch.job_ids is not None:
+            # Candidates outside the index were deleted or are not the user's
+            missing = await ranking_service.missing(current_user.id, batch.job_ids)
+    else:
+        job_ids = list(dict.fromkeys(batch.job_ids))
+    if len(job_ids) > settings.ai_batch_match_max_jobs:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.ai_batch_match_max_jobs} jobs can be matched per request"
+        )
+    descriptions = await job_service.get_job_descriptions(job_ids, current_user.id)
+
+    unmatched: List[Dict] = [{"job_id": job_id, "error": "Job not found"} for job_id in missing]
+    jobs_by_description: Dict[str, list] = {}
+    for job_id in job_ids:
+        description = descriptions.get(job_id)
+        if job_id not in descriptions:
+            unmatched.append({"job_id": job_id, "error": "Job not found"})
+        elif not description:
+            unmatched.append({"job_id": job_id, "error": "Job has no description"})
+        else:
+            jobs_by_description.setdefault(description, []).append(job_id)
+    await charge("ai", request, current_user.id, cost=len(jobs_by_description))
+
+    async def results() -> AsyncIterator[str]:
+        for item in unmatched:
+            yield _ndjson(item)
+
+        matches = ai_service.match_jobs(list(jobs_by_description), batch.resume_analysis)
+        try:
+            async for description, result, error in matches:
+                for job_id in jobs_by_description[description]:
+                    item = {"job_id": job_id}
+                    if job_id in scores:
+                        item["similarity"] = scores[job_id]
+                    if error is None:
+                        item["match"] = _parse_result(result)
+                    else:
+                        item["error"] = str(error)
+                    yield _ndjson(item)
+        finally:
+            await matches.aclose()
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+@router.post("/rank-jobs", response_model=List[RankedJob], dependencies=AI_LIMITS)
+async def rank_jobs(
+    ranking: RankJobsRequest,
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """Rank the user's jobs by local similarity to a resume, without an LLM call."""
+    ranked = await ranking_service.rank(current_user.id, ranking.resume_analysis, ranking.top_k)
+    return [RankedJob(job_id=job_id, score=score) for job_id, score in ranked]
+
+@router.post("/generate-cover-letter", dependencies=AI_LIMITS)
 async def generate_cover_letter(
     job_description: str,
     resume_analysis: Dict,
@@ -46,7 +172,19 @@ async def generate_cover_letter(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/suggest-improvements")
+@router.post("/generate-cover-letter/stream", dependencies=AI_LIMITS)
+async def stream_cover_letter(
+    job_description: str,
+    resume_analysis: Dict,
+    company_name: str,
+    current_user: User = Depends(get_current_user)
+) -> StreamingResponse:
+    """Stream a cover letter over Server-Sent Events as it is generated."""
+    return _sse_response(
+        ai_service.stream_cover_letter(job_description, resume_analysis, company_name)
+    )
+
+@router.post("/suggest-improvements", dependencies=AI_LIMITS)
 async def suggest_improvements(
     application_materials: Dict,
     current_user: User = Depends(get_current_user)
@@ -56,3 +194,41 @@ async def suggest_improvements(
         return await ai_service.suggest_improvements(application_materials)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/suggest-improvements/stream", dependencies=AI_LIMITS)
+async def stream_improvements(
+    application_materials: Dict,
+    current_user: User = Depends(get_current_user)
+) -> StreamingResponse:
+    """Stream improvement suggestions over Server-Sent Events as they are generated."""
+    return _sse_response(ai_service.stream_improvements(application_materials))
+
+@router.post("/tasks", response_model=AITask, status_code=status.HTTP_202_ACCEPTED, dependencies=AI_LIMITS)
+async def submit_task(
+    task: AITaskCreate,
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """Queue an AI task to run in the background and return its ID."""
+    return await task_queue.submit(current_user.id, task.kind, task.params, task.priority)
+
+@router.get("/tasks/{task_id}", response_model=AITask)
+async def get_task(
+    task_id: UUID,
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """Get the status of a background AI task."""
+    task = await task_queue.get_task(task_id, current_user.id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+@router.get("/tasks/{task_id}/result", response_model=AITaskResult)
+async def get_task_result(
+    task_id: UUID,
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """Get the result of a finished background AI task."""
+    result = await task_queue.get_result(task_id, current_user.id)
+    if not result:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return result
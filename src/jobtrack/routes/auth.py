@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from typing import Any
+from typing import Any, AsyncIterator, Optional
 
 from ..services.user import user_service
 from ..schemas.user import (
     User,
     UserCreate,
+    UserFilters,
     UserUpdate,
     Token,
     PasswordReset,
@@ -14,22 +17,30 @@ from ..schemas.user import (
 from ..core.auth import (
     get_current_user,
     get_current_admin_user,
+    oauth2_scheme,
     check_permissions
 )
+from ..core.config import settings
 from ..models.user import UserRole
-from ..core.security import verify_token
+from ..core.ratelimit import rate_limit, username_rate_limit
+from ..core.security import revoke_token, verify_token
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-@router.post("/register", response_model=User)
+# Password hashing endpoints: throttled per client IP
+AUTH_LIMITS = [Depends(rate_limit("auth"))]
+# Logins are also throttled per submitted username
+LOGIN_LIMITS = [*AUTH_LIMITS, Depends(username_rate_limit("auth"))]
+
+@router.post("/register", response_model=User, dependencies=AUTH_LIMITS)
 async def register(user_data: UserCreate) -> Any:
     """Register a new user."""
-    return user_service.create_user(user_data)
+    return await user_service.create_user(user_data)
 
-@router.post("/login", response_model=Token)
+@router.post("/login", response_model=Token, dependencies=LOGIN_LIMITS)
 async def login(form_data: OAuth2PasswordRequestForm = Depends()) -> Any:
     """Login and get access token."""
-    auth_result = user_service.authenticate_user(form_data.username, form_data.password)
+    auth_result = await user_service.authenticate_user(form_data.username, form_data.password)
     return {
         "access_token": auth_result["access_token"],
         "refresh_token": auth_result["refresh_token"],
@@ -40,7 +51,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()) -> Any:
 async def refresh_token(refresh_token: str) -> Any:
     """Get new access token using refresh token."""
     # Verify refresh token
-    token_data = verify_token(refresh_token, token_type="refresh")
+    token_data = await verify_token(refresh_token, token_type="refresh")
     if not token_data:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -48,7 +59,7 @@ async def refresh_token(refresh_token: str) -> Any:
         )
     
     # Get user and create new tokens
-    user = user_service.get_user_by_email(token_data["email"])
+    user = await user_service.get_user_by_email(token_data["sub"])
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -62,6 +73,22 @@ async def refresh_token(refresh_token: str) -> Any:
         "token_type": auth_result["token_type"]
     }
 
+@router.post("/logout")
+async def logout(
+    refresh_token: Optional[str] = None,
+    token: str = Depends(oauth2_scheme),
+    current_user: User = Depends(get_current_user)
+) -> Any:
+    """Revoke the current access token and, if given, its refresh token."""
+    access_data = await verify_token(token, token_type="access")
+    if access_data:
+        await revoke_token(access_data)
+    if refresh_token:
+        refresh_data = await verify_token(refresh_token, token_type="refresh")
+        if refresh_data and refresh_data["sub"] == current_user.email:
+            await revoke_token(refresh_data)
+    return {"message": "Logged out successfully"}
+
 @router.get("/me", response_model=User)
 async def read_users_me(current_user: User = Depends(get_current_user)) -> Any:
     """Get current user information."""
@@ -73,15 +100,15 @@ async def update_user_me(
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """Update current user information."""
-    return user_service.update_user(current_user.id, update_data)
+    return await user_service.update_user(current_user.id, update_data)
 
-@router.post("/password/change")
+@router.post("/password/change", dependencies=AUTH_LIMITS)
 async def change_password(
     password_data: PasswordChange,
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """Change user password."""
-    if user_service.change_password(
+    if await user_service.change_password(
         current_user.id,
         password_data.current_password,
         password_data.new_password
@@ -92,24 +119,68 @@ async def change_password(
         detail="Password change failed"
     )
 
-@router.post("/password/reset")
+@router.post("/password/reset", dependencies=AUTH_LIMITS)
 async def request_password_reset(email_data: PasswordReset) -> Any:
     """Request password reset."""
     # This would typically send a password reset email
     # For now, we'll just return a success message
-    user = user_service.get_user_by_email(email_data.email)
+    user = await user_service.get_user_by_email(email_data.email)
     if user:
         # TODO: Implement email sending
         return {"message": "If the email exists, a password reset link will be sent"}
     return {"message": "If the email exists, a password reset link will be sent"}
 
 # Admin routes
+def _user_filters(
+    role: Optional[UserRole] = None,
+    is_active: Optional[bool] = None,
+    is_verified: Optional[bool] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None
+) -> UserFilters:
+    return UserFilters(
+        role=role,
+        is_active=is_active,
+        is_verified=is_verified,
+        created_after=created_after,
+        created_before=created_before
+    )
+
 @router.get("/users", response_model=list[User])
 async def list_users(
+    response: Response,
+    filters: UserFilters = Depends(_user_filters),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_admin_user)
 ) -> Any:
-    """List all users (admin only)."""
-    return user_service.list_users()
+    """List users, newest first (admin only).
+
+    The next page cursor, if any, is returned in the X-Next-Cursor header.
+    """
+    try:
+        page = await user_service.list_users(filters, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
+
+@router.get("/users/export")
+async def export_users(
+    filters: UserFilters = Depends(_user_filters),
+    current_user: User = Depends(get_current_admin_user)
+) -> StreamingResponse:
+    """Stream every matching user as NDJSON (admin only)."""
+    async def lines() -> AsyncIterator[str]:
+        async for user in user_service.iter_users(filters, settings.user_export_page_size):
+            yield user.model_dump_json() + '\n'
+
+    return StreamingResponse(
+        lines(),
+        media_type='application/x-ndjson',
+        headers={"Content-Disposition": 'attachment; filename="users.ndjson"'}
+    )
 
 @router.get("/users/{user_id}", response_model=User)
 async def get_user(
@@ -117,7 +188,7 @@ async def get_user(
     current_user: User = Depends(get_current_admin_user)
 ) -> Any:
     """Get user by ID (admin only)."""
-    user = user_service.get_user_by_id(user_id)
+    user = await user_service.get_user_by_id(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -132,4 +203,4 @@ async def update_user(
     current_user: User = Depends(get_current_admin_user)
 ) -> Any:
     """Update user (admin only)."""
-    return user_service.update_user(user_id, update_data)
+    return await user_service.update_user(user_id, update_data)
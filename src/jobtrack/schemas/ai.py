@@ -0,0 +1,58 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+class BatchMatchRequest(BaseModel):
+    resume_analysis: Dict
+    # Omit to pre-rank all of the user's jobs and match only the top_k
+    job_ids: Optional[List[UUID]] = Field(None, min_length=1)
+    top_k: Optional[int] = Field(None, ge=1)
+
+class RankJobsRequest(BaseModel):
+    resume_analysis: Dict
+    top_k: int = Field(10, ge=1, le=500)
+
+class RankedJob(BaseModel):
+    job_id: UUID
+    score: float
+
+class AITaskKind(str, Enum):
+    ANALYZE_RESUME = 'analyze_resume'
+    MATCH_JOB = 'match_job'
+    GENERATE_COVER_LETTER = 'generate_cover_letter'
+    SUGGEST_IMPROVEMENTS = 'suggest_improvements'
+
+class AITaskPriority(str, Enum):
+    HIGH = 'high'
+    NORMAL = 'normal'
+    LOW = 'low'
+
+class AITaskStatus(str, Enum):
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+
+class AITaskCreate(BaseModel):
+    kind: AITaskKind
+    # Keyword arguments for the matching AIService method
+    params: Dict[str, Any]
+    priority: AITaskPriority = AITaskPriority.NORMAL
+
+class AITask(BaseModel):
+    id: UUID
+    kind: AITaskKind
+    priority: AITaskPriority
+    status: AITaskStatus
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+class AITaskResult(BaseModel):
+    id: UUID
+    status: AITaskStatus
+    result: Optional[str] = None
+    error: Optional[str] = None
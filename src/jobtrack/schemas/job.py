@@ -1,7 +1,7 @@
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Dict, Optional, List
 from uuid import UUID
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 from enum import Enum
 
 class JobStatus(str, Enum):
@@ -40,6 +40,13 @@ class JobInteraction(JobInteractionBase):
     class Config:
         from_attributes = True
 
+class JobInteractionBatchCreate(BaseModel):
+    interactions: List[JobInteractionBase] = Field(..., min_length=1)
+
+class JobInteractionPage(BaseModel):
+    items: List[JobInteraction]
+    next_cursor: Optional[str] = None
+
 class JobBase(BaseModel):
     company_name: str
     position_title: str
@@ -79,6 +86,92 @@ class JobUpdate(BaseModel):
     notes: Optional[str] = None
     applied_date: Optional[date] = None
 
+class JobSortField(str, Enum):
+    APPLIED_DATE = 'applied_date'
+    CREATED_AT = 'created_at'
+    UPDATED_AT = 'updated_at'
+    COMPANY_NAME = 'company_name'
+    POSITION_TITLE = 'position_title'
+
+class SortOrder(str, Enum):
+    ASC = 'asc'
+    DESC = 'desc'
+
+class JobInclude(str, Enum):
+    INTERACTIONS = 'interactions'
+
+class JobFilters(BaseModel):
+    status: Optional[List[JobStatus]] = None
+    remote_type: Optional[List[RemoteType]] = None
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    company: Optional[str] = None
+
+class JobPage(BaseModel):
+    items: List[Job]
+    next_cursor: Optional[str] = None
+
+class JobSearchHit(BaseModel):
+    job_id: UUID
+    company_name: str
+    position_title: str
+    status: JobStatus
+    score: float
+    # Field name -> snippet with matched terms wrapped in <mark>
+    highlights: Dict[str, str] = {}
+
+class JobSearchPage(BaseModel):
+    items: List[JobSearchHit]
+    next_cursor: Optional[str] = None
+
+class JobFileFormat(str, Enum):
+    CSV = 'csv'
+    NDJSON = 'ndjson'
+
+class JobImportRowError(BaseModel):
+    row: int
+    errors: List[str]
+
+class JobImportResult(BaseModel):
+    imported: int = 0
+    failed: int = 0
+    errors: List[JobImportRowError] = []
+
+class WeeklyApplications(BaseModel):
+    week_start: date
+    count: int
+
+class SalaryBucket(BaseModel):
+    min: int
+    max: int
+    count: int
+
+class JobStats(BaseModel):
+    total: int
+    status_counts: Dict[JobStatus, int]
+    applications_per_week: List[WeeklyApplications]
+    response_rate: float
+    offer_rate: float
+    median_days_to_first_interaction: Optional[float] = None
+    salary_distribution: List[SalaryBucket]
+
+class JobBulkFilter(BaseModel):
+    status: Optional[List[JobStatus]] = None
+    applied_after: Optional[date] = None
+    applied_before: Optional[date] = None
+    # Only jobs with no interaction on or after this time
+    no_interactions_since: Optional[datetime] = None
+
+class JobBulkStatusUpdate(BaseModel):
+    status: JobStatus
+    # Exactly one of job_ids and filter selects the jobs to change
+    job_ids: Optional[List[UUID]] = Field(None, min_length=1)
+    filter: Optional[JobBulkFilter] = None
+
+class JobBulkUpdateResult(BaseModel):
+    updated: int
+    job_ids: List[UUID]
+
 class CompanyBase(BaseModel):
     name: str
     website: Optional[str] = None
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, EmailStr, Field, constr
 from uuid import UUID
 from ..models.user import UserRole
@@ -31,13 +31,25 @@ class UserInDB(UserBase):
     created_at: datetime
     updated_at: datetime
     last_login: Optional[datetime] = None
+    hashed_password: Optional[str] = None
 
     class Config:
         from_attributes = True
 
 class User(UserInDB):
     """User model returned to the client (excludes sensitive data)"""
-    pass
+    hashed_password: Optional[str] = Field(default=None, exclude=True)
+
+class UserFilters(BaseModel):
+    role: Optional[UserRole] = None
+    is_active: Optional[bool] = None
+    is_verified: Optional[bool] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+class UserPage(BaseModel):
+    items: List[User]
+    next_cursor: Optional[str] = None
 
 class Token(BaseModel):
     access_token: str
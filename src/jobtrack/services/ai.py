@@ -1,12 +1,136 @@
-from typing import Dict, List, Optional
-from openai import OpenAI
+import asyncio
+import random
+from time import perf_counter
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI
+
 from ..core.config import settings
+from ..core.metrics import OPENAI_LATENCY, OPENAI_TOKENS, record_phase
+from ..core.lazy import Lazy
+from .ai_cache import AIResultCache, build_ai_cache
+
+def build_openai_client() -> AsyncOpenAI:
+    """Create an async OpenAI client on a pooled, keep-alive HTTP session."""
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.openai_max_connections,
+            max_keepalive_connections=settings.openai_max_connections
+        ),
+        timeout=settings.openai_timeout_seconds
+    )
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        base_url=settings.openai_base_url,
+        http_client=http_client,
+        timeout=settings.openai_timeout_seconds,
+        # Retries are handled by AIService so they can release their slot
+        max_retries=0
+    )
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    # Covers timeouts, which subclass APIConnectionError
+    return isinstance(error, APIConnectionError)
 
 class AIService:
-    def __init__(self):
-        self.client = OpenAI(api_key=settings.openai_api_key)
+    def __init__(self, client: Any = None, cache: Optional[AIResultCache] = None):
+        self.client = client or build_openai_client()
         self.model = settings.openai_model
         self.temperature = settings.openai_temperature
+        self.cache = cache if cache is not None else build_ai_cache()
+        # Caps in-flight completions for this process
+        self._slots = asyncio.Semaphore(settings.openai_max_concurrency)
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
+
+    async def _call_with_retries(self, call: Callable[[], Awaitable[Any]], keep_slot: bool = False) -> Any:
+        """Run an API call, retrying 429/5xx/connection errors with jittered backoff.
+
+        Each attempt takes a concurrency slot and gives it back before backing
+        off. With keep_slot the slot of the successful attempt stays taken and
+        the caller must release it.
+        """
+        for attempt in range(settings.openai_max_retries + 1):
+            await self._slots.acquire()
+            try:
+                result = await call()
+            except BaseException as e:
+                self._slots.release()
+                if attempt == settings.openai_max_retries or not _is_retryable(e):
+                    raise
+            else:
+                if not keep_slot:
+                    self._slots.release()
+                return result
+            # Full jitter keeps retrying workers from synchronising
+            delay = min(settings.openai_retry_max_delay, settings.openai_retry_base_delay * 2 ** attempt)
+            await asyncio.sleep(random.uniform(0, delay))
+
+    def _record_call(self, operation: str, started: float, usage: Any = None) -> None:
+        elapsed = perf_counter() - started
+        OPENAI_LATENCY.observe(elapsed, operation=operation)
+        record_phase('openai', elapsed)
+        if usage is not None:
+            OPENAI_TOKENS.inc(usage.prompt_tokens, model=self.model, kind='prompt')
+            OPENAI_TOKENS.inc(usage.completion_tokens, model=self.model, kind='completion')
+
+    async def _complete(self, messages: List[Dict], json_response: bool = False, operation: str = "chat") -> str:
+        """Run a chat completion and return the message content."""
+        kwargs = {"response_format": { "type": "json_object" }} if json_response else {}
+        started = perf_counter()
+        response = await self._call_with_retries(lambda: self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            timeout=settings.openai_timeout_seconds,
+            **kwargs
+        ))
+        self._record_call(operation, started, getattr(response, "usage", None))
+        return response.choices[0].message.content
+
+    async def _stream(self, messages: List[Dict], json_response: bool = False, operation: str = "chat_stream") -> AsyncIterator[str]:
+        """Run a streaming chat completion, yielding content deltas as they arrive.
+
+        Closing the generator (e.g. when the client disconnects) closes the
+        upstream response and frees the concurrency slot.
+        """
+        kwargs = {"response_format": { "type": "json_object" }} if json_response else {}
+        started = perf_counter()
+        stream = await self._call_with_retries(lambda: self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            timeout=settings.openai_timeout_seconds,
+            stream=True,
+            **kwargs
+        ), keep_slot=True)
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            try:
+                await stream.response.aclose()
+                self._record_call(operation, started)
+            finally:
+                self._slots.release()
+
+    async def _cached_complete(self, method: str, payload: Any, messages: List[Dict], json_response: bool = False) -> str:
+        """Run a completion, reusing a previous result for identical input."""
+        if self.cache is None:
+            return await self._complete(messages, json_response, method)
+        key = self.cache.make_key(method, self.model, self.temperature, payload)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+        content = await self._complete(messages, json_response, method)
+        await self.cache.set(key, content)
+        return content
 
     async def analyze_resume(self, resume_text: str) -> Dict:
         """Analyze a resume and extract key information."""
@@ -19,17 +143,15 @@ class AIService:
         
         Format the response as a JSON object."""
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
+        return await self._cached_complete(
+            "analyze_resume",
+            resume_text,
+            [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": resume_text}
             ],
-            temperature=self.temperature,
-            response_format={ "type": "json_object" }
+            json_response=True
         )
-        
-        return response.choices[0].message.content
 
     async def match_job(self, job_description: str, resume_analysis: Dict) -> Dict:
         """Analyze how well a job matches with the candidate's profile."""
@@ -41,20 +163,44 @@ class AIService:
         
         Format the response as a JSON object."""
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
+        return await self._cached_complete(
+            "match_job",
+            {"job_description": job_description, "resume_analysis": resume_analysis},
+            [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": f"Job Description: {job_description}\n\nCandidate Profile: {resume_analysis}"}
             ],
-            temperature=self.temperature,
-            response_format={ "type": "json_object" }
+            json_response=True
         )
-        
-        return response.choices[0].message.content
 
-    async def generate_cover_letter(self, job_description: str, resume_analysis: Dict, company_name: str) -> str:
-        """Generate a customized cover letter based on the job and candidate's profile."""
+    async def match_jobs(
+        self,
+        job_descriptions: List[str],
+        resume_analysis: Dict
+    ) -> AsyncIterator[Tuple[str, Optional[str], Optional[Exception]]]:
+        """Match many job descriptions against one profile with bounded fan-out.
+
+        Identical descriptions are matched once. Yields (description, result,
+        error) in completion order; one failure does not stop the others.
+        """
+        limit = asyncio.Semaphore(settings.ai_batch_match_concurrency)
+
+        async def run(description: str):
+            async with limit:
+                try:
+                    return description, await self.match_job(description, resume_analysis), None
+                except Exception as e:
+                    return description, None, e
+
+        tasks = [asyncio.create_task(run(description)) for description in dict.fromkeys(job_descriptions)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _cover_letter_messages(self, job_description: str, resume_analysis: Dict, company_name: str) -> List[Dict]:
         system_prompt = """You are an expert cover letter writer. Write a professional, compelling cover letter that:
         1. Is tailored to the specific job and company
         2. Highlights relevant skills and experiences
@@ -63,19 +209,26 @@ class AIService:
         
         Format the letter with proper business letter structure."""
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": f"Company: {company_name}\nJob Description: {job_description}\nCandidate Profile: {resume_analysis}"}
-            ],
-            temperature=self.temperature
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": f"Company: {company_name}\nJob Description: {job_description}\nCandidate Profile: {resume_analysis}"}
+        ]
+
+    async def generate_cover_letter(self, job_description: str, resume_analysis: Dict, company_name: str) -> str:
+        """Generate a customized cover letter based on the job and candidate's profile."""
+        return await self._complete(
+            self._cover_letter_messages(job_description, resume_analysis, company_name),
+            operation="generate_cover_letter"
         )
-        
-        return response.choices[0].message.content
 
-    async def suggest_improvements(self, application_materials: Dict) -> Dict:
-        """Suggest improvements for resume, cover letter, and application strategy."""
+    def stream_cover_letter(self, job_description: str, resume_analysis: Dict, company_name: str) -> AsyncIterator[str]:
+        """Stream a customized cover letter as it is generated."""
+        return self._stream(
+            self._cover_letter_messages(job_description, resume_analysis, company_name),
+            operation="stream_cover_letter"
+        )
+
+    def _improvements_messages(self, application_materials: Dict) -> List[Dict]:
         system_prompt = """You are an expert career coach. Analyze the application materials and provide:
         1. Resume improvement suggestions
         2. Cover letter improvement suggestions
@@ -84,18 +237,28 @@ class AIService:
         
         Format the response as a JSON object."""
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": str(application_materials)}
-            ],
-            temperature=self.temperature,
-            response_format={ "type": "json_object" }
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": str(application_materials)}
+        ]
+
+    async def suggest_improvements(self, application_materials: Dict) -> Dict:
+        """Suggest improvements for resume, cover letter, and application strategy."""
+        return await self._cached_complete(
+            "suggest_improvements",
+            application_materials,
+            self._improvements_messages(application_materials),
+            json_response=True
+        )
+
+    def stream_improvements(self, application_materials: Dict) -> AsyncIterator[str]:
+        """Stream improvement suggestions (a JSON object) as they are generated."""
+        return self._stream(
+            self._improvements_messages(application_materials),
+            json_response=True,
+            operation="stream_improvements"
         )
-        
-        return response.choices[0].message.content
 
 
 # Initialize AI service
-ai_service = AIService()
+ai_service: AIService = Lazy(AIService, 'ai_service')
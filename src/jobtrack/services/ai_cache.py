@@ -0,0 +1,128 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from ..core.cache import LRUCache
+from ..core.config import settings
+
+
+class MemoryCacheBackend:
+    """In-process LRU backend; results are lost on restart."""
+    blocking = False
+
+    def __init__(self, max_entries: int, ttl: Optional[float]):
+        self._cache = LRUCache(maxsize=max_entries, ttl=ttl)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: str) -> None:
+        self._cache.set(key, value)
+
+
+class SQLiteCacheBackend:
+    """On-disk backend shared by every worker on the host."""
+    blocking = True
+
+    def __init__(self, path: str, ttl: Optional[float]):
+        self.ttl = ttl
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS ai_results ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)'
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value, expires_at FROM ai_results WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                self._conn.execute('DELETE FROM ai_results WHERE key = ?', (key,))
+                self._conn.commit()
+                return None
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        expires_at = time.time() + self.ttl if self.ttl else None
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO ai_results (key, value, expires_at) VALUES (?, ?, ?)',
+                (key, value, expires_at)
+            )
+            self._conn.commit()
+
+
+def _normalize(value: Any) -> Any:
+    """Collapse insignificant whitespace so trivially different inputs share a key."""
+    if isinstance(value, str):
+        return ' '.join(value.split())
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+class AIResultCache:
+    """Content-addressed cache of AI completions with hit-rate metrics."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(method: str, model: str, temperature: float, payload: Any) -> str:
+        material = json.dumps(
+            [method, model, temperature, _normalize(payload)],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        if self.backend.blocking:
+            value = await asyncio.to_thread(self.backend.get, key)
+        else:
+            value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        if self.backend.blocking:
+            await asyncio.to_thread(self.backend.set, key, value)
+        else:
+            self.backend.set(key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'backend': type(self.backend).__name__,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+def build_ai_cache() -> Optional[AIResultCache]:
+    """Create the result cache configured by AI_CACHE_BACKEND, if any."""
+    ttl = settings.ai_cache_ttl_seconds or None
+    if settings.ai_cache_backend == 'memory':
+        return AIResultCache(MemoryCacheBackend(settings.ai_cache_max_entries, ttl))
+    if settings.ai_cache_backend == 'sqlite':
+        return AIResultCache(SQLiteCacheBackend(settings.ai_cache_path, ttl))
+    return None
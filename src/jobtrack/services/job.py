@@ -1,14 +1,34 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
 from uuid import UUID
 
-from ..core.supabase import get_supabase
+from postgrest.types import ReturnMethod
+
+from ..core.config import settings
+from ..core.pagination import decode_cursor, encode_cursor, keyset_after, keyset_order
+from ..core.supabase import get_supabase, execute, fetch_all
+from ..core.versions import bump_version
+from ..core.lazy import Lazy
+from .ranking import ranking_service
+from .search import search_service
+from .stats import stats_service
 from ..schemas.job import (
     Job,
     JobCreate,
     JobUpdate,
+    JobFilters,
+    JobBulkFilter,
+    JobBulkUpdateResult,
+    JobPage,
+    JobSearchPage,
+    JobSortField,
+    JobStats,
+    JobStatus,
+    SortOrder,
     JobInteraction,
+    JobInteractionBase,
     JobInteractionCreate,
+    JobInteractionPage,
     Company,
     CompanyCreate,
     JobApplication,
@@ -20,87 +40,130 @@ from ..schemas.job import (
     SkillCreate
 )
 
+# Every jobs column except the large free-text blobs
+JOB_SUMMARY_COLUMNS = (
+    'id, user_id, company_name, position_title, job_url, status, '
+    'salary_min, salary_max, location, remote_type, applied_date, '
+    'created_at, updated_at'
+)
+
+# Embeds a job's interactions as Job.interactions in the same request
+INTERACTIONS_EMBED = 'interactions:job_interactions(*)'
+
+def _job_columns(summary: bool = False, include_interactions: bool = False) -> str:
+    columns = JOB_SUMMARY_COLUMNS if summary else '*'
+    if include_interactions:
+        columns = f'{columns}, {INTERACTIONS_EMBED}'
+    return columns
+
 class JobService:
     def __init__(self):
         self.client = get_supabase()
 
-    def create_company(self, company: CompanyCreate) -> Company:
+    async def _on_job_saved(self, user_id: str, job: Job) -> None:
+        version = await bump_version(user_id)
+        stats_service.record_job(user_id, job, version)
+        ranking_service.record_job(user_id, job, version)
+        search_service.record_job(user_id, job, version)
+
+    async def _on_jobs_updated(self, user_id: str, jobs: List[Job]) -> None:
+        version = await bump_version(user_id)
+        ranking_service.record_version(user_id, version)
+        for job in jobs:
+            stats_service.record_job(user_id, job, version)
+            search_service.record_job(user_id, job, version)
+
+    async def _on_job_deleted(self, user_id: str, job_id: UUID) -> None:
+        version = await bump_version(user_id)
+        stats_service.forget_job(user_id, job_id, version)
+        ranking_service.forget_job(user_id, job_id, version)
+        search_service.forget_job(user_id, job_id, version)
+
+    async def _on_jobs_imported(self, user_id: str) -> None:
+        await bump_version(user_id)
+        stats_service.invalidate(user_id)
+        ranking_service.invalidate(user_id)
+        search_service.invalidate(user_id)
+
+    async def _on_interaction_created(self, user_id: str, job_id: UUID, interaction: JobInteraction) -> None:
+        version = await bump_version(user_id)
+        ranking_service.record_version(user_id, version)
+        stats_service.record_interaction(user_id, job_id, interaction.interaction_date, version)
+        search_service.record_interaction(user_id, job_id, interaction, version)
+
+    async def create_company(self, company: CompanyCreate) -> Company:
         data = {
-            **company.model_dump(),
-            'created_at': datetime.utcnow()
+            **company.model_dump(mode='json'),
+            'created_at': datetime.utcnow().isoformat()
         }
-        result = self.client.table('companies').insert(data).execute()
+        result = await execute(self.client.table('companies').insert(data))
         return Company(**result.data[0])
 
-    def create_job_application(self, application: JobApplicationCreate, user_id: int) -> JobApplication:
+    async def create_job_application(self, application: JobApplicationCreate, user_id: int) -> JobApplication:
         data = {
-            **application.model_dump(),
+            **application.model_dump(mode='json'),
             'user_id': user_id,
-            'created_at': datetime.utcnow(),
-            'updated_at': datetime.utcnow()
+            'created_at': datetime.utcnow().isoformat(),
+            'updated_at': datetime.utcnow().isoformat()
         }
-        result = self.client.table('job_applications').insert(data).execute()
+        result = await execute(self.client.table('job_applications').insert(data))
         return JobApplication(**result.data[0])
 
-    def get_user_applications(self, user_id: int) -> List[JobApplicationWithDetails]:
-        result = (self.client
-                 .table('job_applications')
-                 .select('*, company:companies(*), interactions(*), skills(*)')
-                 .eq('user_id', user_id)
-                 .order('created_at', desc=True)
-                 .execute())
+    async def get_user_applications(self, user_id: int) -> List[JobApplicationWithDetails]:
+        result = await execute(self.client
+                               .table('job_applications')
+                               .select('*, company:companies(*), interactions(*), skills(*)')
+                               .eq('user_id', user_id)
+                               .order('created_at', desc=True))
         return [JobApplicationWithDetails(**app) for app in result.data]
 
-    def create_interaction(self, interaction: InteractionCreate) -> Interaction:
+    async def create_interaction(self, interaction: InteractionCreate) -> Interaction:
         data = {
-            **interaction.model_dump(),
-            'created_at': datetime.utcnow()
+            **interaction.model_dump(mode='json'),
+            'created_at': datetime.utcnow().isoformat()
         }
-        result = self.client.table('interactions').insert(data).execute()
+        result = await execute(self.client.table('interactions').insert(data))
         return Interaction(**result.data[0])
 
-    def get_application_interactions(self, application_id: int) -> List[Interaction]:
-        result = (self.client
-                 .table('interactions')
-                 .select('*')
-                 .eq('job_application_id', application_id)
-                 .order('created_at', desc=True)
-                 .execute())
+    async def get_application_interactions(self, application_id: int) -> List[Interaction]:
+        result = await execute(self.client
+                               .table('interactions')
+                               .select('*')
+                               .eq('job_application_id', application_id)
+                               .order('created_at', desc=True))
         return [Interaction(**interaction) for interaction in result.data]
 
-    def create_skill(self, skill: SkillCreate) -> Skill:
+    async def create_skill(self, skill: SkillCreate) -> Skill:
         data = {
-            **skill.model_dump(),
-            'created_at': datetime.utcnow()
+            **skill.model_dump(mode='json'),
+            'created_at': datetime.utcnow().isoformat()
         }
-        result = self.client.table('skills').insert(data).execute()
+        result = await execute(self.client.table('skills').insert(data))
         return Skill(**result.data[0])
 
-    def add_skills_to_application(self, application_id: int, skill_ids: List[int]) -> None:
+    async def add_skills_to_application(self, application_id: int, skill_ids: List[int]) -> None:
         data = [
             {'job_application_id': application_id, 'skill_id': skill_id}
             for skill_id in skill_ids
         ]
-        self.client.table('job_application_skills').insert(data).execute()
+        await execute(self.client.table('job_application_skills').insert(data))
 
-    def update_application_status(self, application_id: int, status: str) -> JobApplication:
+    async def update_application_status(self, application_id: int, status: str) -> JobApplication:
         data = {
             'status': status,
-            'updated_at': datetime.utcnow()
+            'updated_at': datetime.utcnow().isoformat()
         }
-        result = (self.client
-                 .table('job_applications')
-                 .update(data)
-                 .eq('id', application_id)
-                 .execute())
+        result = await execute(self.client
+                               .table('job_applications')
+                               .update(data)
+                               .eq('id', application_id))
         return JobApplication(**result.data[0])
 
-    def get_application_stats(self, user_id: int) -> dict:
-        applications = (self.client
-                       .table('job_applications')
-                       .select('status')
-                       .eq('user_id', user_id)
-                       .execute())
+    async def get_application_stats(self, user_id: int) -> dict:
+        applications = await execute(self.client
+                                     .table('job_applications')
+                                     .select('status')
+                                     .eq('user_id', user_id))
         
         stats = {
             'total': len(applications.data),
@@ -116,88 +179,385 @@ class JobService:
             
         return stats
 
-    def create_job(self, user_id: str, job: JobCreate) -> Job:
+    async def create_job(self, user_id: str, job: JobCreate) -> Job:
         """Create a new job entry."""
-        job_dict = job.model_dump()
+        job_dict = job.model_dump(mode='json')
         job_dict.update({
             'user_id': user_id,
-            'created_at': datetime.utcnow(),
-            'updated_at': datetime.utcnow()
+            'created_at': datetime.utcnow().isoformat(),
+            'updated_at': datetime.utcnow().isoformat()
         })
         
-        result = self.client.table('jobs').insert(job_dict).execute()
-        return Job(**result.data[0])
+        result = await execute(self.client.table('jobs').insert(job_dict))
+        created = Job(**result.data[0])
+        await self._on_job_saved(user_id, created)
+        return created
 
-    def get_user_jobs(self, user_id: str) -> List[Job]:
+    async def get_user_jobs(self, user_id: str) -> List[Job]:
         """Get all jobs for a user."""
-        result = self.client.table('jobs').select('*').eq('user_id', user_id).execute()
+        result = await execute(self.client.table('jobs').select('*').eq('user_id', user_id))
         return [Job(**job) for job in result.data]
 
-    def get_job(self, job_id: UUID, user_id: str) -> Optional[Job]:
-        """Get a specific job."""
-        result = self.client.table('jobs').select('*').eq('id', str(job_id)).eq('user_id', user_id).execute()
+    async def list_user_jobs(
+        self,
+        user_id: str,
+        filters: Optional[JobFilters] = None,
+        sort: JobSortField = JobSortField.APPLIED_DATE,
+        order: SortOrder = SortOrder.DESC,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        summary: bool = False,
+        include_interactions: bool = False
+    ) -> JobPage:
+        """Get a filtered, keyset-paginated page of a user's jobs.
+
+        Rows are ordered by (sort, id) so the cursor stays stable while jobs
+        are added; summary mode leaves out job_description and notes, and
+        include_interactions embeds each job's interactions in the same
+        query. Raises ValueError for a malformed cursor or one issued under
+        another sort or order.
+        """
+        descending = order == SortOrder.DESC
+        ordering = keyset_order(sort.value, descending)
+        query = (self.client
+                 .table('jobs')
+                 .select(_job_columns(summary, include_interactions))
+                 .eq('user_id', user_id))
+        
+        if filters:
+            if filters.status:
+                query = query.in_('status', [s.value for s in filters.status])
+            if filters.remote_type:
+                query = query.in_('remote_type', [r.value for r in filters.remote_type])
+            # Match jobs whose advertised range overlaps the requested one
+            if filters.salary_min is not None:
+                query = query.gte('salary_max', filters.salary_min)
+            if filters.salary_max is not None:
+                query = query.lte('salary_min', filters.salary_max)
+            if filters.company:
+                query = query.ilike('company_name', f'%{filters.company}%')
+        
+        if cursor:
+            sort_value, last_id = decode_cursor(cursor, 2, scope=ordering)
+            query = keyset_after(query, sort.value, sort_value, last_id, descending)
+        
+        query = query.order(ordering)
+        if limit:
+            # Fetch one extra row to learn whether another page exists
+            query = query.limit(limit + 1)
+        
+        rows = (await execute(query)).data
+        next_cursor = None
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][sort.value], rows[-1]['id'], scope=ordering)
+        return JobPage(items=[Job(**job) for job in rows], next_cursor=next_cursor)
+
+    def _apply_bulk_filters(self, query, filters: Optional[JobBulkFilter]):
+        if filters:
+            if filters.status:
+                query = query.in_('status', [s.value for s in filters.status])
+            if filters.applied_after is not None:
+                query = query.gte('applied_date', filters.applied_after.isoformat())
+            if filters.applied_before is not None:
+                query = query.lt('applied_date', filters.applied_before.isoformat())
+        return query
+
+    async def _collect_ids(self, build_query: Callable[[], Any], column: str) -> Set[str]:
+        """Collect every value of column a query matches, paging past the server's row cap."""
+        rows = await fetch_all(build_query, settings.job_bulk_update_page_size)
+        return {str(row[column]) for row in rows}
+
+    async def bulk_update_status(
+        self,
+        user_id: str,
+        status: JobStatus,
+        job_ids: Optional[List[UUID]] = None,
+        filters: Optional[JobBulkFilter] = None
+    ) -> JobBulkUpdateResult:
+        """Move the selected jobs to status with set-based updates.
+
+        Jobs are selected by id or by filter, always scoped to the user;
+        jobs already in the target status are left untouched. Filtered
+        selections are resolved to ids first (minus jobs with an
+        interaction since no_interactions_since), then updated in chunks
+        of JOB_BULK_UPDATE_CHUNK_SIZE ids to keep request URLs short. Each
+        chunk re-applies the filter, so jobs changed in the meantime are
+        not swept up.
+        """
+        if job_ids is not None:
+            candidates = {str(job_id) for job_id in job_ids}
+        else:
+            candidates = await self._collect_ids(
+                lambda: self._apply_bulk_filters(
+                    self.client
+                    .table('jobs')
+                    .select('id')
+                    .eq('user_id', user_id)
+                    .neq('status', status.value),
+                    filters
+                ),
+                'id'
+            )
+            if candidates and filters and filters.no_interactions_since is not None:
+                candidates -= await self._collect_ids(
+                    lambda: (self.client
+                             .table('job_interactions')
+                             .select('id, job_id, jobs!inner(user_id)')
+                             .eq('jobs.user_id', user_id)
+                             .gte('interaction_date', filters.no_interactions_since.isoformat())),
+                    'job_id'
+                )
+        
+        ids = sorted(candidates)
+        chunk_size = settings.job_bulk_update_chunk_size
+        now = datetime.utcnow().isoformat()
+        updated: List[Job] = []
+        for start in range(0, len(ids), chunk_size):
+            query = self._apply_bulk_filters(
+                self.client
+                .table('jobs')
+                .update({'status': status.value, 'updated_at': now})
+                .eq('user_id', user_id)
+                .neq('status', status.value)
+                .in_('id', ids[start:start + chunk_size]),
+                filters
+            )
+            updated.extend(Job(**job) for job in (await execute(query)).data)
+        if updated:
+            await self._on_jobs_updated(user_id, updated)
+        return JobBulkUpdateResult(updated=len(updated), job_ids=[job.id for job in updated])
+
+    async def bulk_create_jobs(self, user_id: str, jobs: List[JobCreate]) -> int:
+        """Insert many jobs with a single multi-row insert."""
+        if not jobs:
+            return 0
+        now = datetime.utcnow().isoformat()
+        rows = [
+            {**job.model_dump(mode='json'), 'user_id': str(user_id), 'created_at': now, 'updated_at': now}
+            for job in jobs
+        ]
+        await execute(self.client.table('jobs').insert(rows, returning=ReturnMethod.minimal))
+        await self._on_jobs_imported(user_id)
+        return len(rows)
+
+    async def iter_user_jobs(self, user_id: str, page_size: int) -> AsyncIterator[Job]:
+        """Yield all of a user's jobs one keyset page at a time."""
+        cursor = None
+        while True:
+            page = await self.list_user_jobs(user_id, limit=page_size, cursor=cursor)
+            for job in page.items:
+                yield job
+            if not page.next_cursor:
+                return
+            cursor = page.next_cursor
+
+    async def get_job_descriptions(self, job_ids: List[UUID], user_id: str) -> Dict[UUID, Optional[str]]:
+        """Get the descriptions of the user's jobs among job_ids in one query."""
+        result = await execute(self.client
+                               .table('jobs')
+                               .select('id, job_description')
+                               .in_('id', [str(job_id) for job_id in job_ids])
+                               .eq('user_id', user_id))
+        return {UUID(row['id']): row['job_description'] for row in result.data}
+
+    async def get_job(
+        self,
+        job_id: UUID,
+        user_id: str,
+        include_interactions: bool = False
+    ) -> Optional[Job]:
+        """Get a specific job, optionally with its interactions embedded."""
+        result = await execute(self.client
+                               .table('jobs')
+                               .select(_job_columns(include_interactions=include_interactions))
+                               .eq('id', str(job_id))
+                               .eq('user_id', user_id))
         jobs = result.data
         return Job(**jobs[0]) if jobs else None
 
-    def update_job(self, job_id: UUID, user_id: str, job_update: JobUpdate) -> Optional[Job]:
-        """Update a job entry."""
-        # Verify job exists and belongs to user
-        if not self.get_job(job_id, user_id):
-            return None
-        
-        update_dict = job_update.model_dump(exclude_unset=True)
-        update_dict['updated_at'] = datetime.utcnow()
+    async def update_job(self, job_id: UUID, user_id: str, job_update: JobUpdate) -> Optional[Job]:
+        """Update a job entry owned by the user in a single statement."""
+        update_dict = job_update.model_dump(mode='json', exclude_unset=True)
+        update_dict['updated_at'] = datetime.utcnow().isoformat()
         
-        result = self.client.table('jobs').update(update_dict).eq('id', str(job_id)).execute()
-        return Job(**result.data[0])
+        result = await execute(self.client
+                               .table('jobs')
+                               .update(update_dict)
+                               .eq('id', str(job_id))
+                               .eq('user_id', user_id))
+        # No returned row means the job does not exist or belongs to someone else
+        if not result.data:
+            return None
+        updated = Job(**result.data[0])
+        await self._on_job_saved(user_id, updated)
+        return updated
 
-    def delete_job(self, job_id: UUID, user_id: str) -> bool:
-        """Delete a job entry."""
-        # Verify job exists and belongs to user
-        if not self.get_job(job_id, user_id):
+    async def delete_job(self, job_id: UUID, user_id: str) -> bool:
+        """Delete a job entry owned by the user in a single statement."""
+        result = await execute(self.client
+                               .table('jobs')
+                               .delete()
+                               .eq('id', str(job_id))
+                               .eq('user_id', user_id))
+        if not result.data:
             return False
-        
-        self.client.table('jobs').delete().eq('id', str(job_id)).execute()
+        await self._on_job_deleted(user_id, job_id)
         return True
 
-    def create_job_interaction(self, interaction: JobInteractionCreate) -> JobInteraction:
-        """Create a new job interaction."""
-        interaction_dict = interaction.model_dump()
+    async def job_exists(self, job_id: UUID, user_id: str) -> bool:
+        """Check job ownership without fetching the job body."""
+        result = await execute(self.client
+                               .table('jobs')
+                               .select('id')
+                               .eq('id', str(job_id))
+                               .eq('user_id', user_id))
+        return bool(result.data)
+
+    async def create_job_interaction(
+        self,
+        job_id: UUID,
+        user_id: str,
+        interaction: JobInteractionCreate
+    ) -> Optional[JobInteraction]:
+        """Create a new interaction on a job owned by the user."""
+        if not await self.job_exists(job_id, user_id):
+            return None
+        
+        interaction_dict = interaction.model_dump(mode='json')
         interaction_dict.update({
-            'created_at': datetime.utcnow(),
-            'updated_at': datetime.utcnow()
+            'job_id': str(job_id),
+            'created_at': datetime.utcnow().isoformat(),
+            'updated_at': datetime.utcnow().isoformat()
         })
         
-        result = self.client.table('job_interactions').insert(interaction_dict).execute()
-        return JobInteraction(**result.data[0])
+        result = await execute(self.client.table('job_interactions').insert(interaction_dict))
+        created = JobInteraction(**result.data[0])
+        await self._on_interaction_created(user_id, job_id, created)
+        return created
 
-    def get_job_interactions(self, job_id: UUID) -> List[JobInteraction]:
-        """Get all interactions for a job."""
-        result = self.client.table('job_interactions').select('*').eq('job_id', str(job_id)).execute()
-        return [JobInteraction(**interaction) for interaction in result.data]
+    async def create_job_interactions(
+        self,
+        job_id: UUID,
+        user_id: str,
+        interactions: List[JobInteractionBase]
+    ) -> Optional[List[JobInteraction]]:
+        """Create many interactions on a job owned by the user with one insert."""
+        if not await self.job_exists(job_id, user_id):
+            return None
+        
+        now = datetime.utcnow().isoformat()
+        rows = [
+            {**interaction.model_dump(mode='json'), 'job_id': str(job_id), 'created_at': now, 'updated_at': now}
+            for interaction in interactions
+        ]
+        result = await execute(self.client.table('job_interactions').insert(rows))
+        created = [JobInteraction(**interaction) for interaction in result.data]
+        for interaction in created:
+            await self._on_interaction_created(user_id, job_id, interaction)
+        return created
 
+    async def get_job_timeline(
+        self,
+        job_id: UUID,
+        user_id: str,
+        order: SortOrder = SortOrder.ASC,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Optional[JobInteractionPage]:
+        """Get a keyset-paginated page of a job's interactions by interaction_date.
+
+        The inner join on jobs scopes rows to the user's job in the same
+        query; only an empty page needs a second query to tell "no
+        interactions" from "not your job", which returns None. Raises
+        ValueError for a malformed cursor or one issued under another order.
+        """
+        descending = order == SortOrder.DESC
+        ordering = keyset_order('interaction_date', descending)
+        query = (self.client
+                 .table('job_interactions')
+                 .select('*, jobs!inner(user_id)')
+                 .eq('job_id', str(job_id))
+                 .eq('jobs.user_id', user_id))
+        if cursor:
+            interaction_date, last_id = decode_cursor(cursor, 2, scope=ordering)
+            query = keyset_after(query, 'interaction_date', interaction_date, last_id, descending)
+        # Fetch one extra row to learn whether another page exists
+        query = query.order(ordering).limit(limit + 1)
+        
+        rows = (await execute(query)).data
+        if not rows and not await self.job_exists(job_id, user_id):
+            return None
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]['interaction_date'], rows[-1]['id'], scope=ordering)
+        return JobInteractionPage(items=[JobInteraction(**row) for row in rows], next_cursor=next_cursor)
+
+    async def get_job_interactions(self, job_id: UUID, user_id: str) -> Optional[List[JobInteraction]]:
+        """Get all interactions for a job owned by the user, oldest first.
+
+        Ownership and interactions are resolved in one embedded select;
+        None means the job was not found.
+        """
+        result = await execute(self.client
+                               .table('jobs')
+                               .select('id, job_interactions(*)')
+                               .eq('id', str(job_id))
+                               .eq('user_id', user_id)
+                               .order(keyset_order('interaction_date', descending=False),
+                                      foreign_table='job_interactions'))
+        if not result.data:
+            return None
+        return [JobInteraction(**interaction) for interaction in result.data[0]['job_interactions']]
 
 # Initialize job service
-job_service = JobService()
+job_service: JobService = Lazy(JobService, 'job_service')
 
 # Export functions that use the service
-def create_job(user_id: str, job: JobCreate) -> Job:
-    return job_service.create_job(user_id, job)
+async def create_job(user_id: str, job: JobCreate) -> Job:
+    return await job_service.create_job(user_id, job)
+
+async def get_user_jobs(user_id: str) -> List[Job]:
+    return await job_service.get_user_jobs(user_id)
+
+async def list_user_jobs(user_id: str, **kwargs) -> JobPage:
+    return await job_service.list_user_jobs(user_id, **kwargs)
+
+async def get_job_stats(user_id: str) -> JobStats:
+    return await stats_service.get_stats(user_id)
+
+async def search_jobs(user_id: str, query: str, limit: int, cursor: Optional[str] = None) -> JobSearchPage:
+    return await search_service.search(user_id, query, limit, cursor)
+
+async def bulk_update_status(user_id: str, status: JobStatus, **kwargs) -> JobBulkUpdateResult:
+    return await job_service.bulk_update_status(user_id, status, **kwargs)
+
+async def get_job(job_id: UUID, user_id: str, include_interactions: bool = False) -> Optional[Job]:
+    return await job_service.get_job(job_id, user_id, include_interactions)
 
-def get_user_jobs(user_id: str) -> List[Job]:
-    return job_service.get_user_jobs(user_id)
+async def update_job(job_id: UUID, user_id: str, job_update: JobUpdate) -> Optional[Job]:
+    return await job_service.update_job(job_id, user_id, job_update)
 
-def get_job(job_id: UUID, user_id: str) -> Optional[Job]:
-    return job_service.get_job(job_id, user_id)
+async def delete_job(job_id: UUID, user_id: str) -> bool:
+    return await job_service.delete_job(job_id, user_id)
 
-def update_job(job_id: UUID, user_id: str, job_update: JobUpdate) -> Optional[Job]:
-    return job_service.update_job(job_id, user_id, job_update)
+async def create_job_interaction(
+    job_id: UUID,
+    user_id: str,
+    interaction: JobInteractionCreate
+) -> Optional[JobInteraction]:
+    return await job_service.create_job_interaction(job_id, user_id, interaction)
 
-def delete_job(job_id: UUID, user_id: str) -> bool:
-    return job_service.delete_job(job_id, user_id)
+async def create_job_interactions(
+    job_id: UUID,
+    user_id: str,
+    interactions: List[JobInteractionBase]
+) -> Optional[List[JobInteraction]]:
+    return await job_service.create_job_interactions(job_id, user_id, interactions)
 
-def create_job_interaction(interaction: JobInteractionCreate) -> JobInteraction:
-    return job_service.create_job_interaction(interaction)
+async def get_job_interactions(job_id: UUID, user_id: str) -> Optional[List[JobInteraction]]:
+    return await job_service.get_job_interactions(job_id, user_id)
 
-def get_job_interactions(job_id: UUID) -> List[JobInteraction]:
-    return job_service.get_job_interactions(job_id)
+async def get_job_timeline(job_id: UUID, user_id: str, **kwargs) -> Optional[JobInteractionPage]:
+    return await job_service.get_job_timeline(job_id, user_id, **kwargs)
@@ -0,0 +1,141 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict, IO, Iterator, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+
+from ..core.config import settings
+from ..schemas.job import Job, JobCreate, JobFileFormat, JobImportResult, JobImportRowError
+from .job import job_service
+
+# Column order for exports; imports accept the same layout
+EXPORT_FIELDS = ['id'] + list(JobCreate.model_fields) + ['created_at', 'updated_at']
+
+
+def _decode_lines(stream: IO[bytes], bad_lines: Set[int]) -> Iterator[str]:
+    """Decode an upload line by line, noting lines that are not valid UTF-8.
+
+    Undecodable lines are yielded with replacement characters so the CSV
+    reader keeps its place; callers skip the rows that touch them.
+    """
+    for line_number, line in enumerate(stream, start=1):
+        try:
+            text = line.decode('utf-8')
+        except UnicodeDecodeError:
+            bad_lines.add(line_number)
+            text = line.decode('utf-8', errors='replace')
+        if line_number == 1:
+            text = text.lstrip('\ufeff')
+        yield text
+
+
+def _iter_rows(stream: IO[bytes], file_format: JobFileFormat) -> Iterator[Tuple[int, Any, Optional[str]]]:
+    """Yield (row number, raw row, read error) triples without reading the whole file."""
+    bad_lines: Set[int] = set()
+    lines = _decode_lines(stream, bad_lines)
+    if file_format == JobFileFormat.NDJSON:
+        for line_number, line in enumerate(lines, start=1):
+            if line.strip():
+                yield line_number, line, 'invalid UTF-8' if line_number in bad_lines else None
+        return
+
+    reader = csv.DictReader(lines)
+    row_number = 0
+    last_line = reader.line_num
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            row_number += 1
+            yield row_number, None, f'malformed CSV: {e}'
+            if reader.line_num == last_line:
+                return
+            last_line = reader.line_num
+            continue
+        row_number += 1
+        row_lines = range(last_line + 1, reader.line_num + 1)
+        last_line = reader.line_num
+        if any(line in bad_lines for line in row_lines):
+            yield row_number, None, 'invalid UTF-8'
+            continue
+        # Extra cells beyond the header land under None; blank cells mean
+        # "not set" rather than empty strings
+        yield row_number, {
+            key: value for key, value in row.items()
+            if key is not None and value not in ('', None)
+        }, None
+
+
+def _parse_row(raw: Any, file_format: JobFileFormat) -> JobCreate:
+    if file_format == JobFileFormat.NDJSON:
+        return JobCreate.model_validate_json(raw)
+    return JobCreate(**raw)
+
+
+def _format_errors(error: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}"
+        for err in error.errors()
+    ]
+
+
+async def import_jobs(user_id: str, stream: IO[bytes], file_format: JobFileFormat) -> JobImportResult:
+    """Validate and insert jobs from a CSV/NDJSON stream in batches.
+
+    Invalid rows are reported individually and skipped; valid rows are
+    inserted with one multi-row insert per batch.
+    """
+    result = JobImportResult()
+    batch: List[Tuple[int, JobCreate]] = []
+
+    async def flush():
+        try:
+            result.imported += await job_service.bulk_create_jobs(user_id, [job for _, job in batch])
+        except Exception as e:
+            result.failed += len(batch)
+            result.errors.extend(JobImportRowError(row=row, errors=[str(e)]) for row, _ in batch)
+        batch.clear()
+
+    for row_number, raw, read_error in _iter_rows(stream, file_format):
+        errors = [read_error] if read_error else None
+        if errors is None:
+            try:
+                batch.append((row_number, _parse_row(raw, file_format)))
+            except ValidationError as e:
+                errors = _format_errors(e)
+            except (TypeError, ValueError) as e:
+                errors = [str(e)]
+        if errors is not None:
+            result.failed += 1
+            result.errors.append(JobImportRowError(row=row_number, errors=errors))
+            continue
+        if len(batch) >= settings.job_import_batch_size:
+            await flush()
+    if batch:
+        await flush()
+    return result
+
+
+def _csv_line(values: List) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def _export_row(job: Job) -> Dict:
+    return job.model_dump(mode='json', include=set(EXPORT_FIELDS))
+
+
+async def export_jobs(user_id: str, file_format: JobFileFormat) -> AsyncIterator[str]:
+    """Stream a user's jobs as CSV or NDJSON, one keyset page at a time."""
+    if file_format == JobFileFormat.CSV:
+        yield _csv_line(EXPORT_FIELDS)
+    async for job in job_service.iter_user_jobs(user_id, settings.job_export_page_size):
+        row = _export_row(job)
+        if file_format == JobFileFormat.CSV:
+            yield _csv_line([row.get(field) for field in EXPORT_FIELDS])
+        else:
+            yield json.dumps(row) + '\n'
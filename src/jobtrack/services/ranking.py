@@ -0,0 +1,191 @@
+import asyncio
+import json
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from uuid import UUID
+
+import numpy as np
+
+from ..core.cache import LRUCache
+from ..core.config import settings
+from ..core.supabase import get_supabase, fetch_all
+from ..core.versions import advance_cached, get_version
+from ..core.lazy import Lazy
+from ..schemas.job import Job
+
+@lru_cache(maxsize=None)
+def _vectorizer():
+    # Imported on first use: scikit-learn is slow to import and only the
+    # ranking endpoints need it.
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+    # Stateless hashing keeps per-user indexes incrementally updatable: a new
+    # or edited job never changes the feature space of the others.
+    return HashingVectorizer(
+        n_features=2 ** 18,
+        ngram_range=(1, 2),
+        stop_words='english',
+        alternate_sign=False,
+        norm='l2'
+    )
+
+
+def _job_text(position_title: Optional[str], job_description: Optional[str]) -> str:
+    return f"{position_title or ''}\n{job_description or ''}"
+
+
+def _flatten(value: Any) -> Iterable[str]:
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _flatten(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _flatten(item)
+    elif value is not None:
+        yield str(value)
+
+
+def resume_terms(resume_analysis: Union[Dict, str]) -> str:
+    """Extract the skills text from an analyze_resume result."""
+    if isinstance(resume_analysis, str):
+        try:
+            resume_analysis = json.loads(resume_analysis)
+        except ValueError:
+            return resume_analysis
+    if isinstance(resume_analysis, dict):
+        skills = [value for key, value in resume_analysis.items() if 'skill' in str(key).lower()]
+        if skills:
+            return ' '.join(_flatten(skills))
+    return ' '.join(_flatten(resume_analysis))
+
+
+class JobFeatureIndex:
+    """Sparse feature rows for one user's jobs, kept in step with their edits."""
+
+    def __init__(self):
+        self.job_ids: List[str] = []
+        self.rows: List[Any] = []
+        self.positions: Dict[str, int] = {}
+        self._matrix = None
+
+    def upsert(self, job_id: str, row: Any) -> None:
+        position = self.positions.get(job_id)
+        if position is None:
+            self.positions[job_id] = len(self.job_ids)
+            self.job_ids.append(job_id)
+            self.rows.append(row)
+        else:
+            self.rows[position] = row
+        self._matrix = None
+
+    def remove(self, job_id: str) -> None:
+        position = self.positions.pop(job_id, None)
+        if position is None:
+            return
+        # Swap the last row into the hole to keep removal O(1)
+        last_id, last_row = self.job_ids.pop(), self.rows.pop()
+        if position < len(self.job_ids):
+            self.job_ids[position] = last_id
+            self.rows[position] = last_row
+            self.positions[last_id] = position
+        self._matrix = None
+
+    def matrix(self):
+        if self._matrix is None:
+            from scipy import sparse
+            self._matrix = sparse.vstack(self.rows, format='csr')
+        return self._matrix
+
+    def rank(self, query: Any, top_k: int, candidates: Optional[Iterable[str]] = None) -> List[Tuple[str, float]]:
+        """Score every job against query in one sparse product and keep the best top_k."""
+        if not self.job_ids:
+            return []
+        # Rows and query are L2-normalised, so the dot product is the cosine
+        scores = (self.matrix() @ query.T).toarray().ravel()
+        if candidates is not None:
+            mask = np.full(scores.shape, -np.inf)
+            for job_id in candidates:
+                position = self.positions.get(str(job_id))
+                if position is not None:
+                    mask[position] = scores[position]
+            scores = mask
+        k = min(top_k, int(np.isfinite(scores).sum()))
+        if k <= 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return [(self.job_ids[i], float(scores[i])) for i in best]
+
+
+class RankingService:
+    def __init__(self):
+        self.client = get_supabase()
+        self.indexes = LRUCache(
+            maxsize=settings.ranking_index_cache_size,
+            ttl=settings.ranking_index_ttl_seconds
+        )
+
+    async def _get_index(self, user_id: str) -> JobFeatureIndex:
+        # Indexes are cached with the user's data version, so a write handled
+        # by any worker sharing the version store forces a rebuild here
+        version = await get_version(user_id)
+        cached = self.indexes.get(str(user_id))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        rows = await fetch_all(
+            lambda: self.client.table('jobs').select('id, position_title, job_description').eq('user_id', user_id)
+        )
+        index = JobFeatureIndex()
+        if rows:
+            texts = [_job_text(row['position_title'], row['job_description']) for row in rows]
+            matrix = await asyncio.to_thread(_vectorizer().transform, texts)
+            for row, features in zip(rows, matrix):
+                index.upsert(str(row['id']), features)
+        self.indexes.set(str(user_id), (version, index))
+        return index
+
+    async def rank(
+        self,
+        user_id: str,
+        resume_analysis: Union[Dict, str],
+        top_k: int,
+        candidates: Optional[List[UUID]] = None
+    ) -> List[Tuple[UUID, float]]:
+        """Rank a user's jobs by similarity to the resume's skills, best first."""
+        index = await self._get_index(user_id)
+        query = _vectorizer().transform([resume_terms(resume_analysis)])
+        ranked = index.rank(
+            query,
+            top_k,
+            [str(job_id) for job_id in candidates] if candidates is not None else None
+        )
+        return [(UUID(job_id), score) for job_id, score in ranked]
+
+    async def missing(self, user_id: str, job_ids: List[UUID]) -> List[UUID]:
+        """Return the job_ids absent from the user's index, so never ranked."""
+        index = await self._get_index(user_id)
+        return [job_id for job_id in dict.fromkeys(job_ids) if str(job_id) not in index.positions]
+
+    def record_job(self, user_id: str, job: Job, version: int) -> None:
+        """Re-vectorize a created or updated job in the user's cached index."""
+        index = advance_cached(self.indexes, str(user_id), version)
+        if index is not None:
+            index.upsert(str(job.id), _vectorizer().transform([_job_text(job.position_title, job.job_description)]))
+
+    def record_version(self, user_id: str, version: int) -> None:
+        """Keep the cached index across a write that changes no job's text."""
+        advance_cached(self.indexes, str(user_id), version)
+
+    def forget_job(self, user_id: str, job_id: Union[UUID, str], version: int) -> None:
+        """Remove a deleted job from the user's cached index."""
+        index = advance_cached(self.indexes, str(user_id), version)
+        if index is not None:
+            index.remove(str(job_id))
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's index so it is rebuilt on the next ranking."""
+        self.indexes.pop(str(user_id))
+
+
+# Initialize ranking service
+ranking_service: RankingService = Lazy(RankingService, 'ranking_service')
@@ -0,0 +1,229 @@
+import asyncio
+import heapq
+import html
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+from uuid import UUID
+
+from ..core.cache import LRUCache
+from ..core.config import settings
+from ..core.pagination import decode_cursor, encode_cursor
+from ..core.supabase import get_supabase, fetch_all
+from ..core.versions import advance_cached, get_version
+from ..core.lazy import Lazy
+from ..schemas.job import Job, JobInteraction, JobSearchHit, JobSearchPage, JobStatus
+
+# Everything the index needs, including the notes of every interaction
+SEARCH_COLUMNS = (
+    'id, company_name, position_title, job_description, notes, status, '
+    'job_interactions(id, notes)'
+)
+
+# Term frequency multiplier per field, so title and company hits outrank
+# the same word buried in a long description
+FIELD_WEIGHTS = {
+    'position_title': 3.0,
+    'company_name': 2.0,
+    'job_description': 1.0,
+    'notes': 1.0,
+    'interactions': 1.0
+}
+
+# Standard BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return [token.lower() for token in _TOKEN_RE.findall(text)] if text else []
+
+
+def highlight(text: str, terms: Set[str], width: int) -> Optional[str]:
+    """Cut a snippet of text around the first matched term, marking every match in it."""
+    matches = [match for match in _TOKEN_RE.finditer(text) if match.group().lower() in terms]
+    if not matches:
+        return None
+    start = max(0, matches[0].start() - width // 3)
+    end = min(len(text), start + width)
+    parts = ['…'] if start else []
+    position = start
+    for match in matches:
+        if match.end() > end:
+            break
+        parts.append(html.escape(text[position:match.start()]))
+        parts.append(f'<mark>{html.escape(match.group())}</mark>')
+        position = match.end()
+    parts.append(html.escape(text[position:end]))
+    if end < len(text):
+        parts.append('…')
+    return ''.join(parts)
+
+
+class SearchDocument:
+    __slots__ = ('company_name', 'position_title', 'status', 'fields', 'interactions', 'terms', 'length')
+
+    def __init__(self, row: Dict[str, Any], interactions: Dict[str, str]):
+        self.company_name = row['company_name']
+        self.position_title = row['position_title']
+        self.status = row['status']
+        # Interaction id -> notes, so recording an interaction twice is harmless
+        self.interactions = interactions
+        self.fields = {
+            'position_title': row['position_title'],
+            'company_name': row['company_name'],
+            'job_description': row.get('job_description'),
+            'notes': row.get('notes'),
+            'interactions': '\n'.join(interactions.values())
+        }
+        self.terms: Dict[str, float] = Counter()
+        self.length = 0
+        for field, text in self.fields.items():
+            tokens = tokenize(text)
+            self.length += len(tokens)
+            for token in tokens:
+                self.terms[token] += FIELD_WEIGHTS[field]
+
+
+class JobSearchIndex:
+    """Inverted index over one user's jobs, ranked with BM25."""
+
+    def __init__(self):
+        self.documents: Dict[str, SearchDocument] = {}
+        self.postings: Dict[str, Dict[str, float]] = {}
+        self.total_length = 0
+
+    @classmethod
+    def build(cls, rows: Iterable[Dict[str, Any]]) -> 'JobSearchIndex':
+        index = cls()
+        for row in rows:
+            notes = {
+                str(interaction['id']): interaction['notes']
+                for interaction in row.get('job_interactions') or [] if interaction.get('notes')
+            }
+            index.upsert(str(row['id']), SearchDocument(row, notes))
+        return index
+
+    def upsert(self, job_id: str, document: SearchDocument) -> None:
+        self.remove(job_id)
+        self.documents[job_id] = document
+        self.total_length += document.length
+        for term, frequency in document.terms.items():
+            self.postings.setdefault(term, {})[job_id] = frequency
+
+    def remove(self, job_id: str) -> None:
+        document = self.documents.pop(job_id, None)
+        if document is None:
+            return
+        self.total_length -= document.length
+        for term in document.terms:
+            postings = self.postings[term]
+            del postings[job_id]
+            if not postings:
+                del self.postings[term]
+
+    def search(self, terms: Set[str], limit: int) -> List[tuple]:
+        """Return the best (job_id, score) pairs for any of terms, best first."""
+        count = len(self.documents)
+        if not count:
+            return []
+        average_length = self.total_length / count or 1
+        scores: Dict[str, float] = {}
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for job_id, frequency in postings.items():
+                length_norm = 1 - BM25_B + BM25_B * self.documents[job_id].length / average_length
+                scores[job_id] = scores.get(job_id, 0.0) + idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+        # Break score ties on id so pages stay stable between requests
+        return heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], item[0]))
+
+
+class SearchService:
+    def __init__(self):
+        self.client = get_supabase()
+        self.indexes = LRUCache(
+            maxsize=settings.search_index_cache_size,
+            ttl=settings.search_index_ttl_seconds
+        )
+
+    async def _get_index(self, user_id: str) -> JobSearchIndex:
+        # Indexes are cached with the user's data version, so a write handled
+        # by any worker sharing the version store forces a rebuild here
+        version = await get_version(user_id)
+        cached = self.indexes.get(str(user_id))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        rows = await fetch_all(lambda: self.client.table('jobs').select(SEARCH_COLUMNS).eq('user_id', user_id))
+        index = await asyncio.to_thread(JobSearchIndex.build, rows)
+        self.indexes.set(str(user_id), (version, index))
+        return index
+
+    async def search(self, user_id: str, query: str, limit: int, cursor: Optional[str] = None) -> JobSearchPage:
+        """Rank a user's jobs against a free-text query, with highlighted snippets.
+
+        Raises ValueError for a malformed cursor.
+        """
+        offset = int(decode_cursor(cursor, 1)[0]) if cursor else 0
+        if offset < 0:
+            raise ValueError("Invalid cursor")
+        terms = set(tokenize(query))
+        if not terms:
+            return JobSearchPage(items=[])
+        index = await self._get_index(user_id)
+        ranked = index.search(terms, offset + limit + 1)
+        page = ranked[offset:offset + limit]
+        items = []
+        for job_id, score in page:
+            document = index.documents[job_id]
+            highlights = {}
+            for field, text in document.fields.items():
+                snippet = highlight(text, terms, settings.search_snippet_chars) if text else None
+                if snippet:
+                    highlights[field] = snippet
+            items.append(JobSearchHit(
+                job_id=UUID(job_id),
+                company_name=document.company_name,
+                position_title=document.position_title,
+                status=JobStatus(document.status),
+                score=score,
+                highlights=highlights
+            ))
+        next_cursor = encode_cursor(offset + limit) if len(ranked) > offset + limit else None
+        return JobSearchPage(items=items, next_cursor=next_cursor)
+
+    def record_job(self, user_id: str, job: Job, version: int) -> None:
+        """Re-index a created or updated job in the user's cached index."""
+        index = advance_cached(self.indexes, str(user_id), version)
+        if index is not None:
+            existing = index.documents.get(str(job.id))
+            row = job.model_dump(include={'company_name', 'position_title', 'job_description', 'notes', 'status'})
+            index.upsert(str(job.id), SearchDocument(row, existing.interactions if existing else {}))
+
+    def record_interaction(self, user_id: str, job_id: Union[UUID, str], interaction: JobInteraction, version: int) -> None:
+        """Add a new interaction's notes to its job's entry."""
+        index = advance_cached(self.indexes, str(user_id), version)
+        document = index.documents.get(str(job_id)) if index is not None else None
+        if document is not None and interaction.notes:
+            row = {**document.fields, 'status': document.status}
+            interactions = {**document.interactions, str(interaction.id): interaction.notes}
+            index.upsert(str(job_id), SearchDocument(row, interactions))
+
+    def forget_job(self, user_id: str, job_id: Union[UUID, str], version: int) -> None:
+        """Remove a deleted job from the user's cached index."""
+        index = advance_cached(self.indexes, str(user_id), version)
+        if index is not None:
+            index.remove(str(job_id))
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's index so it is rebuilt on the next search."""
+        self.indexes.pop(str(user_id))
+
+
+# Initialize search service
+search_service: SearchService = Lazy(SearchService, 'search_service')
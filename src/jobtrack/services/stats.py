@@ -0,0 +1,186 @@
+from collections import Counter
+from datetime import date, datetime, timedelta
+from statistics import median
+from typing import Dict, NamedTuple, Optional, Union
+from uuid import UUID
+
+from ..core.cache import LRUCache
+from ..core.config import settings
+from ..core.supabase import get_supabase, fetch_all
+from ..core.versions import advance_cached, get_version
+from ..core.lazy import Lazy
+from ..schemas.job import (
+    Job,
+    JobStats,
+    JobStatus,
+    SalaryBucket,
+    WeeklyApplications
+)
+
+# Only the columns the aggregates need, plus first-interaction candidates
+STATS_COLUMNS = 'id, status, applied_date, salary_min, salary_max, job_interactions(interaction_date)'
+
+OFFER_STATUSES = {JobStatus.OFFER_RECEIVED, JobStatus.ACCEPTED}
+# Statuses the user can set without hearing back from the employer
+NO_RESPONSE_STATUSES = {JobStatus.APPLIED, JobStatus.WITHDRAWN}
+
+
+def _to_date(value: Union[str, date, None]) -> Optional[date]:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+class JobFacts(NamedTuple):
+    """The per-job values a user's statistics are derived from."""
+    status: JobStatus
+    applied_date: date
+    salary_min: Optional[int]
+    salary_max: Optional[int]
+    first_interaction: Optional[date]
+
+
+class StatsSummary:
+    """Per-user aggregates, kept current as jobs change instead of rescanned."""
+
+    def __init__(self):
+        self.jobs: Dict[str, JobFacts] = {}
+        self.status_counts: Counter = Counter()
+        self.weekly_counts: Counter = Counter()
+
+    def add(self, job_id: str, facts: JobFacts) -> None:
+        self.remove(job_id)
+        self.jobs[job_id] = facts
+        self.status_counts[facts.status] += 1
+        self.weekly_counts[facts.applied_date - timedelta(days=facts.applied_date.weekday())] += 1
+
+    def remove(self, job_id: str) -> Optional[JobFacts]:
+        facts = self.jobs.pop(job_id, None)
+        if facts is not None:
+            week = facts.applied_date - timedelta(days=facts.applied_date.weekday())
+            self.status_counts[facts.status] -= 1
+            self.weekly_counts[week] -= 1
+            if not self.status_counts[facts.status]:
+                del self.status_counts[facts.status]
+            if not self.weekly_counts[week]:
+                del self.weekly_counts[week]
+        return facts
+
+    def record_interaction(self, job_id: str, interaction_date: date) -> None:
+        facts = self.jobs.get(job_id)
+        if facts is not None and (facts.first_interaction is None or interaction_date < facts.first_interaction):
+            self.jobs[job_id] = facts._replace(first_interaction=interaction_date)
+
+    def to_stats(self) -> JobStats:
+        total = len(self.jobs)
+        responded = [
+            facts for facts in self.jobs.values()
+            if facts.first_interaction is not None or facts.status not in NO_RESPONSE_STATUSES
+        ]
+        days_to_first = [
+            (facts.first_interaction - facts.applied_date).days
+            for facts in self.jobs.values()
+            if facts.first_interaction is not None
+        ]
+        offers = sum(self.status_counts[status] for status in OFFER_STATUSES)
+        return JobStats(
+            total=total,
+            status_counts=dict(self.status_counts),
+            applications_per_week=[
+                WeeklyApplications(week_start=week, count=count)
+                for week, count in sorted(self.weekly_counts.items())
+            ],
+            response_rate=len(responded) / total if total else 0.0,
+            offer_rate=offers / total if total else 0.0,
+            median_days_to_first_interaction=median(days_to_first) if days_to_first else None,
+            salary_distribution=self._salary_distribution()
+        )
+
+    def _salary_distribution(self):
+        size = settings.stats_salary_bucket_size
+        buckets: Counter = Counter()
+        for facts in self.jobs.values():
+            bounds = [value for value in (facts.salary_min, facts.salary_max) if value is not None]
+            if bounds:
+                # Bucket each job by the midpoint of its advertised range
+                buckets[int(sum(bounds) / len(bounds)) // size] += 1
+        return [
+            SalaryBucket(min=bucket * size, max=(bucket + 1) * size, count=count)
+            for bucket, count in sorted(buckets.items())
+        ]
+
+
+class StatsService:
+    def __init__(self):
+        self.client = get_supabase()
+        self.summaries = LRUCache(
+            maxsize=settings.stats_cache_size,
+            ttl=settings.stats_cache_ttl_seconds
+        )
+
+    async def get_stats(self, user_id: str) -> JobStats:
+        """Get application statistics for a user."""
+        return (await self._get_summary(user_id)).to_stats()
+
+    async def _get_summary(self, user_id: str) -> StatsSummary:
+        # Summaries are cached with the user's data version, so a write
+        # handled by any worker sharing the version store forces a reload
+        version = await get_version(user_id)
+        cached = self.summaries.get(str(user_id))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        rows = await fetch_all(lambda: self.client.table('jobs').select(STATS_COLUMNS).eq('user_id', user_id))
+        summary = StatsSummary()
+        for row in rows:
+            interaction_dates = [
+                _to_date(interaction['interaction_date'])
+                for interaction in row.get('job_interactions') or []
+            ]
+            summary.add(str(row['id']), JobFacts(
+                status=JobStatus(row['status']),
+                applied_date=_to_date(row['applied_date']),
+                salary_min=row.get('salary_min'),
+                salary_max=row.get('salary_max'),
+                first_interaction=min(interaction_dates) if interaction_dates else None
+            ))
+        self.summaries.set(str(user_id), (version, summary))
+        return summary
+
+    def record_job(self, user_id: str, job: Job, version: int) -> None:
+        """Fold a created or updated job into the user's cached summary."""
+        summary = advance_cached(self.summaries, str(user_id), version)
+        if summary is None:
+            return
+        previous = summary.jobs.get(str(job.id))
+        first_interactions = [_to_date(i.interaction_date) for i in job.interactions]
+        if previous and previous.first_interaction:
+            first_interactions.append(previous.first_interaction)
+        summary.add(str(job.id), JobFacts(
+            status=job.status,
+            applied_date=job.applied_date,
+            salary_min=job.salary_min,
+            salary_max=job.salary_max,
+            first_interaction=min(first_interactions) if first_interactions else None
+        ))
+
+    def forget_job(self, user_id: str, job_id: Union[UUID, str], version: int) -> None:
+        """Remove a deleted job from the user's cached summary."""
+        summary = advance_cached(self.summaries, str(user_id), version)
+        if summary is not None:
+            summary.remove(str(job_id))
+
+    def record_interaction(self, user_id: str, job_id: Union[UUID, str], interaction_date: datetime, version: int) -> None:
+        """Update time-to-first-interaction for a job in the cached summary."""
+        summary = advance_cached(self.summaries, str(user_id), version)
+        if summary is not None:
+            summary.record_interaction(str(job_id), _to_date(interaction_date))
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's summary so it is rebuilt on the next read."""
+        self.summaries.pop(str(user_id))
+
+
+# Initialize stats service
+stats_service: StatsService = Lazy(StatsService, 'stats_service')
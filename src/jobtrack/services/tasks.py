@@ -0,0 +1,236 @@
+import asyncio
+import inspect
+import itertools
+import json
+import logging
+import sqlite3
+from collections import defaultdict, deque
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException, status
+
+from ..core.config import settings
+from ..schemas.ai import AITask, AITaskKind, AITaskPriority, AITaskResult, AITaskStatus
+from .ai import AIService, ai_service
+
+# Lower values are served first
+PRIORITY_LANES = {
+    AITaskPriority.HIGH: 0,
+    AITaskPriority.NORMAL: 1,
+    AITaskPriority.LOW: 2
+}
+
+logger = logging.getLogger(__name__)
+
+TASK_COLUMNS = 'id, user_id, kind, params, priority, status, result, error, created_at, started_at, finished_at'
+
+
+class TaskStore:
+    """SQLite persistence so queued and finished tasks survive a restart."""
+
+    def __init__(self, path: str):
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS ai_tasks ('
+            'id TEXT PRIMARY KEY, user_id TEXT NOT NULL, kind TEXT NOT NULL, '
+            'params TEXT NOT NULL, priority TEXT NOT NULL, status TEXT NOT NULL, '
+            'result TEXT, error TEXT, created_at TEXT NOT NULL, '
+            'started_at TEXT, finished_at TEXT)'
+        )
+        self._conn.commit()
+
+    def insert(self, task: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                f'INSERT INTO ai_tasks ({TASK_COLUMNS}) VALUES ({", ".join("?" * 11)})',
+                tuple(task.get(column) for column in TASK_COLUMNS.split(', '))
+            )
+            self._conn.commit()
+
+    def update(self, task_id: str, **fields: Any) -> None:
+        assignments = ', '.join(f'{column} = ?' for column in fields)
+        with self._lock:
+            self._conn.execute(
+                f'UPDATE ai_tasks SET {assignments} WHERE id = ?',
+                (*fields.values(), task_id)
+            )
+            self._conn.commit()
+
+    def claim(self, task_id: str, started_at: str) -> bool:
+        """Mark a queued task running; False if another worker already took it."""
+        with self._lock:
+            cursor = self._conn.execute(
+                'UPDATE ai_tasks SET status = ?, started_at = ? WHERE id = ? AND status = ?',
+                (AITaskStatus.RUNNING.value, started_at, task_id, AITaskStatus.QUEUED.value)
+            )
+            self._conn.commit()
+        return cursor.rowcount == 1
+
+    def requeue_stale(self, started_before: str) -> None:
+        """Return tasks whose worker died mid-run to the queue."""
+        with self._lock:
+            self._conn.execute(
+                'UPDATE ai_tasks SET status = ?, started_at = NULL WHERE status = ? AND started_at < ?',
+                (AITaskStatus.QUEUED.value, AITaskStatus.RUNNING.value, started_before)
+            )
+            self._conn.commit()
+
+    def get(self, task_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                f'SELECT {TASK_COLUMNS} FROM ai_tasks WHERE id = ? AND user_id = ?',
+                (task_id, user_id)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def queued(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT {TASK_COLUMNS} FROM ai_tasks WHERE status = ? ORDER BY created_at',
+                (AITaskStatus.QUEUED.value,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+class TaskQueue:
+    """In-process priority queue running AI tasks on a fixed worker pool.
+
+    Each user has at most AI_TASK_USER_CONCURRENCY tasks running; further
+    tasks from that user wait aside until one of theirs finishes, so one
+    user's burst cannot occupy every worker.
+
+    The store may be shared by several processes: each picks up queued
+    rows on start, and a task only runs in the process that claims it.
+    """
+
+    def __init__(self, service: AIService, store: Optional[TaskStore] = None):
+        self.service = service
+        self.store = store
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._workers: List[asyncio.Task] = []
+        self._sequence = itertools.count()
+        self._running: Dict[str, int] = defaultdict(int)
+        self._deferred: Dict[str, Deque[Tuple]] = defaultdict(deque)
+        self._pending = 0
+
+    def _handlers(self) -> Dict[AITaskKind, Any]:
+        return {
+            AITaskKind.ANALYZE_RESUME: self.service.analyze_resume,
+            AITaskKind.MATCH_JOB: self.service.match_job,
+            AITaskKind.GENERATE_COVER_LETTER: self.service.generate_cover_letter,
+            AITaskKind.SUGGEST_IMPROVEMENTS: self.service.suggest_improvements
+        }
+
+    async def start(self) -> None:
+        """Start the workers and re-queue work interrupted by a restart."""
+        if self.store is None:
+            self.store = await asyncio.to_thread(TaskStore, settings.ai_task_store_path)
+        self._queue = asyncio.PriorityQueue()
+        stale = (datetime.utcnow() - timedelta(seconds=settings.ai_task_stale_seconds)).isoformat()
+        await asyncio.to_thread(self.store.requeue_stale, stale)
+        for task in await asyncio.to_thread(self.store.queued):
+            self._enqueue(task['id'], task['user_id'], AITaskPriority(task['priority']), task['kind'], json.loads(task['params']))
+        self._workers = [asyncio.create_task(self._work()) for _ in range(settings.ai_task_workers)]
+
+    async def stop(self) -> None:
+        """Stop the workers; unfinished tasks are picked up again on start."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def _enqueue(self, task_id: str, user_id: str, priority: AITaskPriority, kind: str, params: Dict) -> None:
+        self._pending += 1
+        self._queue.put_nowait((PRIORITY_LANES[priority], next(self._sequence), task_id, user_id, kind, params))
+
+    async def submit(self, user_id: str, kind: AITaskKind, params: Dict[str, Any], priority: AITaskPriority) -> AITask:
+        """Persist and enqueue a task, returning immediately."""
+        try:
+            inspect.signature(self._handlers()[kind]).bind(**params)
+        except TypeError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid params: {e}")
+        if self._pending >= settings.ai_task_queue_limit:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Task queue is full, please retry shortly",
+                headers={"Retry-After": "5"}
+            )
+        task = {
+            'id': str(uuid4()),
+            'user_id': str(user_id),
+            'kind': kind.value,
+            'params': json.dumps(params),
+            'priority': priority.value,
+            'status': AITaskStatus.QUEUED.value,
+            'created_at': _now()
+        }
+        await asyncio.to_thread(self.store.insert, task)
+        self._enqueue(task['id'], task['user_id'], priority, kind.value, params)
+        return AITask(**task)
+
+    async def get(self, task_id: UUID, user_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self.store.get, str(task_id), str(user_id))
+
+    async def get_task(self, task_id: UUID, user_id: str) -> Optional[AITask]:
+        """Get a task's status."""
+        task = await self.get(task_id, user_id)
+        return AITask(**task) if task else None
+
+    async def get_result(self, task_id: UUID, user_id: str) -> Optional[AITaskResult]:
+        """Get a task's result or error."""
+        task = await self.get(task_id, user_id)
+        return AITaskResult(**task) if task else None
+
+    async def _work(self) -> None:
+        while True:
+            entry = await self._queue.get()
+            user_id = entry[3]
+            if self._running[user_id] >= settings.ai_task_user_concurrency:
+                self._deferred[user_id].append(entry)
+                continue
+            self._running[user_id] += 1
+            try:
+                await self._run(*entry[2:])
+            except Exception:
+                # Keep the worker alive; the task stays queued or running in
+                # the store and is recovered on the next start
+                logger.exception("AI task %s could not be run", entry[2])
+            finally:
+                self._pending -= 1
+                self._running[user_id] -= 1
+                if self._deferred[user_id]:
+                    self._queue.put_nowait(self._deferred[user_id].popleft())
+                if not self._running[user_id]:
+                    del self._running[user_id]
+                if not self._deferred[user_id]:
+                    del self._deferred[user_id]
+
+    async def _run(self, task_id: str, user_id: str, kind: str, params: Dict) -> None:
+        if not await asyncio.to_thread(self.store.claim, task_id, _now()):
+            return
+        try:
+            result = await self._handlers()[AITaskKind(kind)](**params)
+        except asyncio.CancelledError:
+            # Stopped mid-run: hand the task back so the next start runs it.
+            # Written synchronously, as an await here could be cancelled too.
+            self.store.update(task_id, status=AITaskStatus.QUEUED.value, started_at=None)
+            raise
+        except Exception as e:
+            fields = {'status': AITaskStatus.FAILED.value, 'error': str(e)}
+        else:
+            fields = {'status': AITaskStatus.SUCCEEDED.value, 'result': result}
+        await asyncio.to_thread(self.store.update, task_id, finished_at=_now(), **fields)
+
+
+# Initialize task queue
+task_queue = TaskQueue(ai_service)
@@ -1,83 +1,118 @@
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import AsyncIterator, Optional, Dict, Any
 from fastapi import HTTPException, status
-from ..core.security import verify_password, get_password_hash, create_tokens
-from ..core.supabase import get_supabase
-from ..schemas.user import UserCreate, UserUpdate, User, UserInDB
+from ..core.cache import LRUCache
+from ..core.config import settings
+from ..core.pagination import decode_cursor, encode_cursor, keyset_after, keyset_order
+from ..core.security import (
+    verify_password_async,
+    get_password_hash_async,
+    create_tokens,
+    revoke_user_tokens
+)
+from ..core.supabase import get_supabase, execute
+from ..core.lazy import Lazy
+from ..schemas.user import UserCreate, UserUpdate, User, UserFilters, UserInDB, UserPage
 from ..models.user import UserRole
 
+# Every users column except credentials
+USER_COLUMNS = (
+    'id, email, full_name, role, is_active, is_verified, '
+    'created_at, updated_at, last_login'
+)
+
 class UserService:
     def __init__(self):
         self.client = get_supabase()
+        # Authenticated users keyed by token subject (email)
+        self.user_cache = LRUCache(
+            maxsize=settings.user_cache_size,
+            ttl=settings.user_cache_ttl_seconds
+        )
+
+    async def get_cached_user(self, email: str) -> Optional[UserInDB]:
+        """Get a user by email, served from the identity cache when possible."""
+        user = self.user_cache.get(email)
+        if user is None:
+            user = await self.get_user_by_email(email)
+            if user is not None:
+                self.user_cache.set(email, user)
+        return user
 
-    def get_user_by_email(self, email: str) -> Optional[UserInDB]:
+    def invalidate_cached_user(self, *emails: Optional[str]) -> None:
+        """Drop cached identities so the next request reloads them."""
+        for email in emails:
+            if email:
+                self.user_cache.pop(email)
+
+    async def get_user_by_email(self, email: str) -> Optional[UserInDB]:
         """Get a user by email."""
-        result = self.client.table('users').select('*').eq('email', email).execute()
+        result = await execute(self.client.table('users').select('*').eq('email', email))
         users = result.data
         return UserInDB(**users[0]) if users else None
 
-    def get_user_by_id(self, user_id: str) -> Optional[User]:
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Get a user by ID."""
-        result = self.client.table('users').select('*').eq('id', user_id).execute()
+        result = await execute(self.client.table('users').select('*').eq('id', user_id))
         users = result.data
         return User(**users[0]) if users else None
 
-    def create_user(self, user_data: UserCreate) -> User:
+    async def create_user(self, user_data: UserCreate) -> User:
         """Create a new user."""
         # Check if user exists
-        if self.get_user_by_email(user_data.email):
+        if await self.get_user_by_email(user_data.email):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
         
         # Hash password
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
         
         # Prepare user data
-        user_dict = user_data.model_dump()
+        user_dict = user_data.model_dump(mode='json')
         user_dict.pop('password')  # Remove plain password
         user_dict.update({
             'hashed_password': hashed_password,
             'role': UserRole.USER,
             'is_active': True,
             'is_verified': False,
-            'created_at': datetime.utcnow(),
-            'updated_at': datetime.utcnow()
+            'created_at': datetime.utcnow().isoformat(),
+            'updated_at': datetime.utcnow().isoformat()
         })
         
         # Create user
-        result = self.client.table('users').insert(user_dict).execute()
+        result = await execute(self.client.table('users').insert(user_dict))
         return User(**result.data[0])
 
-    def authenticate_user(self, email: str, password: str) -> Dict[str, Any]:
+    async def authenticate_user(self, email: str, password: str) -> Dict[str, Any]:
         """Authenticate a user and return tokens."""
-        user = self.get_user_by_email(email)
+        user = await self.get_user_by_email(email)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
             )
         
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
             )
         
         # Update last login
-        self.client.table('users').update({
-            'last_login': datetime.utcnow(),
-            'updated_at': datetime.utcnow()
-        }).eq('id', user.id).execute()
+        await execute(self.client.table('users').update({
+            'last_login': datetime.utcnow().isoformat(),
+            'updated_at': datetime.utcnow().isoformat()
+        }).eq('id', user.id))
         
         # Create tokens
         return self.create_tokens(user)
 
-    def update_user(self, user_id: str, update_data: UserUpdate) -> User:
+    async def update_user(self, user_id: str, update_data: UserUpdate) -> User:
         """Update user information."""
         # Check if user exists
-        user = self.get_user_by_id(user_id)
+        user = await self.get_user_by_id(user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -85,32 +120,35 @@ class UserService:
             )
         
         # Prepare update data
-        update_dict = update_data.model_dump(exclude_unset=True)
-        update_dict['updated_at'] = datetime.utcnow()
+        update_dict = update_data.model_dump(mode='json', exclude_unset=True)
+        update_dict['updated_at'] = datetime.utcnow().isoformat()
         
         # Update user
-        result = self.client.table('users').update(update_dict).eq('id', user_id).execute()
+        result = await execute(self.client.table('users').update(update_dict).eq('id', user_id))
+        self.invalidate_cached_user(user.email, update_dict.get('email'))
         return User(**result.data[0])
 
-    def change_password(self, user_id: str, current_password: str, new_password: str) -> bool:
+    async def change_password(self, user_id: str, current_password: str, new_password: str) -> bool:
         """Change user password."""
         # Get user
-        user = self.get_user_by_id(user_id)
+        user = await self.get_user_by_id(user_id)
         if not user:
             return False
         
         # Verify current password
-        if not verify_password(current_password, user.hashed_password):
+        if not await verify_password_async(current_password, user.hashed_password):
             return False
         
         # Hash new password
-        hashed_password = get_password_hash(new_password)
+        hashed_password = await get_password_hash_async(new_password)
         
         # Update password
-        self.client.table('users').update({
+        await execute(self.client.table('users').update({
             'hashed_password': hashed_password,
-            'updated_at': datetime.utcnow()
-        }).eq('id', user_id).execute()
+            'updated_at': datetime.utcnow().isoformat()
+        }).eq('id', user_id))
+        self.invalidate_cached_user(user.email)
+        await revoke_user_tokens(user.email)
         return True
 
     def create_tokens(self, user: UserInDB) -> Dict[str, Any]:
@@ -123,11 +161,56 @@ class UserService:
             "user": User(**user.model_dump())
         }
 
-    def list_users(self) -> List[User]:
-        """List all users."""
-        result = self.client.table('users').select('*').execute()
-        return [User(**user) for user in result.data]
+    async def list_users(
+        self,
+        filters: Optional[UserFilters] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> UserPage:
+        """Get a filtered, keyset-paginated page of users, newest first.
+
+        Only USER_COLUMNS are selected, so password hashes never leave the
+        database. Raises ValueError for a malformed cursor.
+        """
+        ordering = keyset_order('created_at', descending=True)
+        query = self.client.table('users').select(USER_COLUMNS)
+        
+        if filters:
+            if filters.role is not None:
+                query = query.eq('role', filters.role.value)
+            if filters.is_active is not None:
+                query = query.eq('is_active', filters.is_active)
+            if filters.is_verified is not None:
+                query = query.eq('is_verified', filters.is_verified)
+            if filters.created_after is not None:
+                query = query.gte('created_at', filters.created_after.isoformat())
+            if filters.created_before is not None:
+                query = query.lt('created_at', filters.created_before.isoformat())
+        
+        if cursor:
+            created_at, last_id = decode_cursor(cursor, 2, scope=ordering)
+            query = keyset_after(query, 'created_at', created_at, last_id, descending=True)
+        
+        # Fetch one extra row to learn whether another page exists
+        query = query.order(ordering).limit(limit + 1)
+        rows = (await execute(query)).data
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]['created_at'], rows[-1]['id'], scope=ordering)
+        return UserPage(items=[User(**user) for user in rows], next_cursor=next_cursor)
+
+    async def iter_users(self, filters: Optional[UserFilters], page_size: int) -> AsyncIterator[User]:
+        """Yield every matching user one keyset page at a time."""
+        cursor = None
+        while True:
+            page = await self.list_users(filters, limit=page_size, cursor=cursor)
+            for user in page.items:
+                yield user
+            if not page.next_cursor:
+                return
+            cursor = page.next_cursor
 
 
 # Initialize user service
-user_service = UserService()
+user_service: UserService = Lazy(UserService, 'user_service')
@@ -0,0 +1,38 @@
+import os
+
+# Settings are required at first use; services run against tests/fake_postgrest.py.
+for name, value in {
+    'SUPABASE_URL': 'http://localhost:54321',
+    'SUPABASE_KEY': 'test',
+    'SUPABASE_SECRET_KEY': 'test',
+    'SECRET_KEY': 'test-secret',
+    'OPENAI_API_KEY': 'test'
+}.items():
+    os.environ.setdefault(name, value)
+
+import pytest  # noqa: E402
+
+from fake_postgrest import FakePostgrest  # noqa: E402
+
+
+@pytest.fixture
+def postgrest(monkeypatch):
+    """Run the services against an in-memory PostgREST with a 1000-row cap."""
+    from jobtrack.core import supabase
+    from jobtrack.core.config import settings
+    from jobtrack.core.versions import data_versions
+    from jobtrack.services.job import job_service
+    from jobtrack.services.ranking import ranking_service
+    from jobtrack.services.search import search_service
+    from jobtrack.services.stats import stats_service
+
+    # supabase-py only checks that the key is shaped like a JWT
+    monkeypatch.setattr(settings, 'supabase_key', 'test.test.test')
+    pool = supabase.SupabasePool()
+    fake = FakePostgrest(max_rows=1000)
+    fake.install(pool.client)
+    monkeypatch.setattr(supabase.supabase_pool, '_instance', pool)
+    for provider in (job_service, stats_service, search_service, ranking_service, data_versions):
+        monkeypatch.setattr(provider, '_instance', None)
+    yield fake
+    pool.close()
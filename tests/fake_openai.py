@@ -0,0 +1,109 @@
+"""A small OpenAI-compatible chat completions server for tests and benchmarks.
+
+It answers /v1/chat/completions (plain and streamed) after a configurable
+delay, can fail the next requests with scripted status codes, and records
+how many requests it saw and how many were in flight at once.
+
+Tests mount it in-process through httpx.ASGITransport; benchmarks can serve
+it with uvicorn and point OPENAI_BASE_URL at it:
+
+    python tests/fake_openai.py --port 8001 --delay 0.05
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Iterable, List
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from openai import AsyncOpenAI
+
+
+class FakeOpenAI:
+    def __init__(self, delay: float = 0.0, content: str = '{"ok": true}', chunk_size: int = 8):
+        self.delay = delay
+        self.content = content
+        self.chunk_size = chunk_size
+        self.failures: List[int] = []
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.app = FastAPI()
+        self.app.post('/v1/chat/completions')(self._chat_completions)
+
+    def fail_next(self, statuses: Iterable[int]) -> None:
+        """Answer the next requests with these error statuses, in order."""
+        self.failures.extend(statuses)
+
+    def client(self, **kwargs) -> AsyncOpenAI:
+        """An AsyncOpenAI client talking to this server in-process."""
+        http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app))
+        return AsyncOpenAI(
+            api_key='test',
+            base_url='http://fake-openai/v1',
+            http_client=http_client,
+            max_retries=0,
+            **kwargs
+        )
+
+    def _completion(self, body: dict, **fields) -> dict:
+        return {
+            'id': f'chatcmpl-{self.requests}',
+            'created': int(time.time()),
+            'model': body.get('model', 'fake'),
+            **fields
+        }
+
+    async def _chat_completions(self, request: Request):
+        body = await request.json()
+        self.requests += 1
+        if self.failures:
+            status = self.failures.pop(0)
+            return JSONResponse({'error': {'message': f'scripted {status}', 'type': 'fake'}}, status_code=status)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if not body.get('stream'):
+            return JSONResponse(self._completion(
+                body,
+                object='chat.completion',
+                choices=[{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': self.content},
+                    'finish_reason': 'stop'
+                }],
+                usage={'prompt_tokens': 10, 'completion_tokens': 5, 'total_tokens': 15}
+            ))
+
+        async def events():
+            for start in range(0, len(self.content), self.chunk_size):
+                chunk = self._completion(
+                    body,
+                    object='chat.completion.chunk',
+                    choices=[{
+                        'index': 0,
+                        'delta': {'content': self.content[start:start + self.chunk_size]},
+                        'finish_reason': None
+                    }]
+                )
+                yield f'data: {json.dumps(chunk)}\n\n'
+            yield 'data: [DONE]\n\n'
+
+        return StreamingResponse(events(), media_type='text/event-stream')
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--delay', type=float, default=0.05)
+    args = parser.parse_args()
+    uvicorn.run(FakeOpenAI(delay=args.delay).app, port=args.port, log_level='warning')
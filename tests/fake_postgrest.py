@@ -0,0 +1,230 @@
+"""An in-memory stand-in for PostgREST behind the pinned postgrest client.
+
+It understands the subset of the PostgREST API the services use: column
+and embedded-resource selects, eq/neq/gt/gte/lt/lte/in/ilike filters,
+or/and groups, order, limit, Range headers and insert/update/delete with
+return=representation. Like a Supabase project it caps every read at
+max_rows, and it keeps every request so tests can inspect them.
+
+    fake = FakePostgrest(max_rows=1000)
+    fake.install(supabase_client)
+"""
+import json
+import re
+from collections import defaultdict
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote
+from uuid import uuid4
+
+import httpx
+
+# (table, embedded table) -> (cardinality, foreign key on the child table)
+RELATIONS = {
+    ('jobs', 'job_interactions'): ('many', 'job_id'),
+    ('job_interactions', 'jobs'): ('one', 'job_id'),
+}
+
+
+def _split(text: str) -> List[str]:
+    """Split on commas outside parentheses and double quotes."""
+    parts, depth, quoted, current = [], 0, False, ''
+    for index, char in enumerate(text):
+        if char == '"' and text[index - 1:index] != '\\':
+            quoted = not quoted
+        elif not quoted and char == '(':
+            depth += 1
+        elif not quoted and char == ')':
+            depth -= 1
+        elif not quoted and char == ',' and depth == 0:
+            parts.append(current)
+            current = ''
+            continue
+        current += char
+    if current:
+        parts.append(current)
+    return [part.strip() for part in parts]
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return re.sub(r'\\(.)', r'\1', value[1:-1])
+    return value
+
+
+def _compare(value: Any, criteria: str) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        other: Any = float(criteria)
+        value = float(value)
+    else:
+        value, other = str(value), criteria
+    return (value > other) - (value < other)
+
+
+def _matches(row: Dict[str, Any], column: str, operator: str, criteria: str) -> bool:
+    value = row.get(column)
+    if operator == 'in':
+        return str(value) in {_unquote(item) for item in _split(criteria[1:-1])}
+    if operator == 'is':
+        return value is None if criteria == 'null' else str(value).lower() == criteria
+    if operator in ('like', 'ilike'):
+        pattern = re.escape(_unquote(criteria)).replace('%', '.*').replace(r'\*', '.*')
+        flags = re.IGNORECASE if operator == 'ilike' else 0
+        return value is not None and re.fullmatch(pattern, str(value), flags) is not None
+    order = _compare(value, _unquote(criteria))
+    if order is None:
+        return False
+    return {
+        'eq': order == 0, 'neq': order != 0,
+        'gt': order > 0, 'gte': order >= 0,
+        'lt': order < 0, 'lte': order <= 0
+    }[operator]
+
+
+def _condition(expression: str):
+    """Compile one filter (col.op.criteria, and(...) or or(...)) to a predicate."""
+    for group, combine in (('and(', all), ('or(', any)):
+        if expression.startswith(group):
+            parts = [_condition(part) for part in _split(expression[len(group):-1])]
+            return lambda row, parts=parts, combine=combine: combine(part(row) for part in parts)
+    column, operator, criteria = expression.split('.', 2)
+    if operator == 'not':
+        inner = _condition(f'{column}.{criteria}')
+        return lambda row: not inner(row)
+    return lambda row: _matches(row, column, operator, criteria)
+
+
+def _sort(rows: List[Dict[str, Any]], spec: str) -> List[Dict[str, Any]]:
+    # Stable sorts applied from the last key to the first
+    for term in reversed(spec.split(',')):
+        column, *modifiers = term.split('.')
+        descending = 'desc' in modifiers
+        present = [row for row in rows if row.get(column) is not None]
+        missing = [row for row in rows if row.get(column) is None]
+        present.sort(key=lambda row: row[column], reverse=descending)
+        # Postgres puts NULLs last ascending and first descending
+        rows = missing + present if descending else present + missing
+    return rows
+
+
+class FakePostgrest:
+    def __init__(self, max_rows: Optional[int] = None):
+        self.max_rows = max_rows
+        self.tables: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.requests: List[httpx.Request] = []
+        self._lock = Lock()
+
+    def install(self, client: Any) -> None:
+        """Point a supabase-py client's PostgREST session at this fake."""
+        postgrest = client.postgrest
+        old_session = postgrest.session
+        postgrest.session = httpx.Client(
+            base_url=old_session.base_url,
+            headers=old_session.headers,
+            transport=httpx.MockTransport(self.handle)
+        )
+        old_session.close()
+
+    def insert(self, table: str, *rows: Dict[str, Any]) -> None:
+        for row in rows:
+            self.tables[table].append({'id': str(uuid4()), **row})
+
+    def reads(self, table: str) -> List[httpx.Request]:
+        return [request for request in self.requests if request.method == 'GET' and request.url.path.endswith(f'/{table}')]
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests.append(request)
+            table = request.url.path.rsplit('/', 1)[-1]
+            params: List[Tuple[str, str]] = [
+                (unquote(key), unquote(value))
+                for key, value in (pair.split('=', 1) for pair in request.url.query.decode().split('&') if pair)
+            ]
+            try:
+                return self._dispatch(request, table, params)
+            except (KeyError, ValueError) as e:
+                return httpx.Response(400, json={'code': 'PGRST100', 'message': f'failed to parse filter: {e}'})
+
+    def _dispatch(self, request: httpx.Request, table: str, params: List[Tuple[str, str]]) -> httpx.Response:
+        rows = self.tables[table]
+        representation = 'return=minimal' not in request.headers.get('prefer', '')
+        if request.method == 'POST':
+            body = json.loads(request.content)
+            created = [{'id': str(uuid4()), **row} for row in (body if isinstance(body, list) else [body])]
+            rows.extend(created)
+            return httpx.Response(201, json=created if representation else [])
+
+        select = dict(params).get('select', '*')
+        matched = [row for row in rows if self._filter(table, row, params)]
+        if request.method == 'PATCH':
+            changes = json.loads(request.content)
+            for row in matched:
+                row.update(changes)
+            return httpx.Response(200, json=matched if representation else [])
+        if request.method == 'DELETE':
+            self.tables[table] = [row for row in rows if row not in matched]
+            return httpx.Response(200, json=matched if representation else [])
+
+        for key, value in params:
+            if key == 'order':
+                matched = _sort(matched, value)
+        offset, end = 0, None
+        if 'range' in request.headers:
+            start, stop = request.headers['range'].split('-')
+            offset, end = int(start), int(stop) + 1
+            if end <= offset:
+                return httpx.Response(416, json={'code': 'PGRST103', 'message': 'Requested range not satisfiable'})
+        for key, value in params:
+            if key == 'limit':
+                end = offset + int(value) if end is None else min(end, offset + int(value))
+        matched = matched[offset:end]
+        if self.max_rows is not None:
+            matched = matched[:self.max_rows]
+        return httpx.Response(200, json=[self._project(table, row, select, params) for row in matched])
+
+    def _filter(self, table: str, row: Dict[str, Any], params: List[Tuple[str, str]]) -> bool:
+        for key, value in params:
+            if key in ('select', 'order', 'limit', 'offset') or '.' in key:
+                continue
+            expression = f'or({value[1:-1]})' if key == 'or' else f'{key}.{value}'
+            if not _condition(expression)(row):
+                return False
+        # Inner embeds drop rows whose filtered embed is empty
+        for item in _split(dict(params).get('select', '*')):
+            name = item.split(':')[-1].split('(')[0]
+            if name.endswith('!inner') and not self._embed(table, row, name[:-len('!inner')], params):
+                return False
+        return True
+
+    def _embed(self, table: str, row: Dict[str, Any], target: str, params: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        cardinality, key = RELATIONS[(table, target)]
+        if cardinality == 'many':
+            related = [child for child in self.tables[target] if child.get(key) == row['id']]
+        else:
+            related = [parent for parent in self.tables[target] if parent['id'] == row.get(key)]
+        for name, value in params:
+            if name.startswith(f'{target}.') and name != f'{target}.order':
+                column = name.split('.', 1)[1]
+                related = [item for item in related if _condition(f'{column}.{value}')(item)]
+        for name, value in params:
+            if name == f'{target}.order':
+                related = _sort(related, value)
+        return related
+
+    def _project(self, table: str, row: Dict[str, Any], select: str, params: List[Tuple[str, str]]) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        for item in _split(select):
+            if item == '*':
+                result.update(row)
+            elif '(' in item:
+                alias, _, embed = item.rpartition(':')
+                name, columns = embed[:-1].split('(', 1)
+                target = name.split('!')[0]
+                related = [self._project(target, child, columns, []) for child in self._embed(table, row, target, params)]
+                cardinality, _ = RELATIONS[(table, target)]
+                result[alias or target] = related if cardinality == 'many' else (related[0] if related else None)
+            else:
+                result[item] = row.get(item)
+        return result
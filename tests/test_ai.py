@@ -0,0 +1,203 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import BadRequestError, RateLimitError
+
+from jobtrack.core.config import settings
+from jobtrack.services import ai, ai_cache
+from jobtrack.services.ai import AIService
+from jobtrack.services.ai_cache import AIResultCache, MemoryCacheBackend, SQLiteCacheBackend
+
+from fake_openai import FakeOpenAI
+
+
+def _rate_limited() -> RateLimitError:
+    request = httpx.Request('POST', 'http://openai.test/v1/chat/completions')
+    return RateLimitError('rate limited', response=httpx.Response(429, request=request), body=None)
+
+
+class StubStream:
+    """Async iterable of streaming chunks with the response handle AIService closes."""
+
+    def __init__(self, deltas):
+        self.deltas = deltas
+        self.response = SimpleNamespace(aclose=self._aclose)
+        self.closed = False
+
+    async def _aclose(self):
+        self.closed = True
+
+    async def __aiter__(self):
+        for delta in self.deltas:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+
+class StubClient:
+    """Stands in for AsyncOpenAI, replaying scripted results per call."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.events = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.events.append('stream' if kwargs.get('stream') else 'complete')
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        if kwargs.get('stream'):
+            return StubStream(result)
+        message = SimpleNamespace(content=result)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    async def close(self):
+        pass
+
+
+def test_stream_backoff_releases_its_slot(monkeypatch):
+    monkeypatch.setattr(settings, 'openai_retry_base_delay', 0.2)
+    monkeypatch.setattr(ai.random, 'uniform', lambda low, high: high)
+
+    async def scenario():
+        client = StubClient([_rate_limited(), 'done', ['Dear ', 'team']])
+        service = AIService(client=client, cache=None)
+        service._slots = asyncio.Semaphore(1)
+
+        async def read_stream():
+            return [delta async for delta in service._stream([])]
+
+        streaming = asyncio.create_task(read_stream())
+        await asyncio.sleep(0.05)
+        # The stream is backing off; a completion must not wait for it
+        assert await asyncio.wait_for(service._complete([]), 0.1) == 'done'
+        assert await streaming == ['Dear ', 'team']
+        assert service._slots._value == 1
+        return client.events
+
+    assert asyncio.run(scenario()) == ['stream', 'complete', 'stream']
+
+
+def _cached_service(backend, results):
+    client = StubClient(results)
+    return AIService(client=client, cache=AIResultCache(backend)), client
+
+
+def test_identical_inputs_are_served_from_cache():
+    async def scenario():
+        service, client = _cached_service(MemoryCacheBackend(16, None), ['{"skills": []}', '{"skills": ["go"]}'])
+        first = await service.analyze_resume('Python  developer\n')
+        second = await service.analyze_resume(' Python developer')
+        other = await service.analyze_resume('Go developer')
+        return service, client, (first, second, other)
+
+    service, client, results = asyncio.run(scenario())
+    assert results == ('{"skills": []}', '{"skills": []}', '{"skills": ["go"]}')
+    assert client.events == ['complete', 'complete']
+    assert service.cache.stats()['hit_rate'] == 1 / 3
+
+
+def test_cache_key_covers_model_and_temperature():
+    key = AIResultCache.make_key('match_job', 'model-a', 0.7, {'job_description': 'x'})
+    assert key != AIResultCache.make_key('match_job', 'model-b', 0.7, {'job_description': 'x'})
+    assert key != AIResultCache.make_key('match_job', 'model-a', 0.2, {'job_description': 'x'})
+    assert key != AIResultCache.make_key('suggest_improvements', 'model-a', 0.7, {'job_description': 'x'})
+
+
+def test_sqlite_cache_is_shared_and_expires(tmp_path, monkeypatch):
+    path = str(tmp_path / 'ai_cache.sqlite3')
+    now = [1000.0]
+    monkeypatch.setattr(ai_cache.time, 'time', lambda: now[0])
+
+    async def scenario():
+        writer, _ = _cached_service(SQLiteCacheBackend(path, ttl=60), ['{"tips": 1}'])
+        await writer.suggest_improvements({'resume': 'text'})
+        reader, client = _cached_service(SQLiteCacheBackend(path, ttl=60), ['{"tips": 2}'])
+        cached = await reader.suggest_improvements({'resume': 'text'})
+        now[0] += 61
+        refreshed = await reader.suggest_improvements({'resume': 'text'})
+        return cached, refreshed, client.events
+
+    assert asyncio.run(scenario()) == ('{"tips": 1}', '{"tips": 2}', ['complete'])
+
+
+def test_failed_completions_are_not_cached():
+    async def scenario():
+        service, client = _cached_service(MemoryCacheBackend(16, None), [ValueError('bad response'), '{}'])
+        try:
+            await service.match_job('job', {})
+        except ValueError:
+            pass
+        return await service.match_job('job', {}), client.events
+
+    assert asyncio.run(scenario()) == ('{}', ['complete', 'complete'])
+
+
+def _fake_service(fake: FakeOpenAI) -> AIService:
+    service = AIService(client=fake.client(), cache=None)
+    service.cache = None
+    return service
+
+
+def test_fake_server_completion_and_stream():
+    fake = FakeOpenAI(content='{"match": 80}')
+
+    async def scenario():
+        service = _fake_service(fake)
+        try:
+            completed = await service.match_job('job', {})
+            streamed = ''.join([delta async for delta in service.stream_improvements({})])
+        finally:
+            await service.close()
+        return completed, streamed
+
+    assert asyncio.run(scenario()) == ('{"match": 80}', '{"match": 80}')
+
+
+def test_retryable_statuses_are_retried(monkeypatch):
+    monkeypatch.setattr(settings, 'openai_retry_base_delay', 0.001)
+    fake = FakeOpenAI()
+    fake.fail_next([429, 503])
+
+    async def scenario():
+        service = _fake_service(fake)
+        try:
+            return await service.analyze_resume('resume')
+        finally:
+            await service.close()
+
+    assert asyncio.run(scenario()) == '{"ok": true}'
+    assert fake.requests == 3
+
+
+def test_client_errors_are_not_retried():
+    fake = FakeOpenAI()
+    fake.fail_next([400])
+
+    async def scenario():
+        service = _fake_service(fake)
+        try:
+            await service.analyze_resume('resume')
+        finally:
+            await service.close()
+
+    with pytest.raises(BadRequestError):
+        asyncio.run(scenario())
+    assert fake.requests == 1
+
+
+def test_in_flight_completions_are_capped(monkeypatch):
+    monkeypatch.setattr(settings, 'openai_max_concurrency', 2)
+    fake = FakeOpenAI(delay=0.02)
+
+    async def scenario():
+        service = _fake_service(fake)
+        try:
+            await asyncio.gather(*(service.generate_cover_letter(f'job {n}', {}, 'Acme') for n in range(8)))
+        finally:
+            await service.close()
+
+    asyncio.run(scenario())
+    assert fake.requests == 8
+    assert fake.max_in_flight == 2
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from jobtrack.core import versions
+from jobtrack.core.config import settings
+from jobtrack.core.http_cache import cached_json_response, response_cache
+from jobtrack.core.versions import MemoryVersionStore, bump_version
+from jobtrack.schemas.job import JobCreate
+from jobtrack.services.job import job_service
+
+USER_ID = '00000000-0000-0000-0000-000000000001'
+
+
+@pytest.fixture(autouse=True)
+def fresh_versions(monkeypatch):
+    monkeypatch.setattr(versions.data_versions, '_instance', MemoryVersionStore())
+    monkeypatch.setattr(response_cache, '_instance', None)
+
+
+def _request(if_none_match: str = None, path: str = '/jobs/') -> Request:
+    headers = [(b'if-none-match', if_none_match.encode())] if if_none_match else []
+    return Request({'type': 'http', 'method': 'GET', 'path': path, 'query_string': b'', 'headers': headers})
+
+
+class Build:
+    def __init__(self, content=None):
+        self.content = content if content is not None else [{'id': 1}]
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.content == 'missing':
+            raise HTTPException(status_code=404, detail='Job not found')
+        return self.content, {}
+
+
+def _get(build, if_none_match: str = None):
+    return asyncio.run(cached_json_response(_request(if_none_match), USER_ID, build))
+
+
+def test_matching_etag_is_not_modified_without_building():
+    build = Build()
+    first = _get(build)
+    assert first.status_code == 200
+    assert first.body == b'[{"id":1}]'
+
+    second = _get(build, first.headers['ETag'])
+    assert second.status_code == 304
+    assert second.headers['ETag'] == first.headers['ETag']
+    assert build.calls == 1
+
+
+def test_a_write_changes_the_etag():
+    build = Build()
+    etag = _get(build).headers['ETag']
+    asyncio.run(bump_version(USER_ID))
+
+    response = _get(build, etag)
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert build.calls == 2
+
+
+def test_etags_are_per_user_and_resource():
+    build = Build()
+    etag = _get(build).headers['ETag']
+    other = asyncio.run(cached_json_response(_request(path='/jobs/1'), USER_ID, build)).headers['ETag']
+    assert other != etag
+    asyncio.run(bump_version('someone-else'))
+    assert _get(build, etag).status_code == 304
+
+
+def test_wildcard_needs_an_existing_resource():
+    assert _get(Build(), '*').status_code == 304
+    with pytest.raises(HTTPException) as error:
+        _get(Build('missing'), '*')
+    assert error.value.status_code == 404
+
+
+def test_cached_body_is_dropped_after_a_write(monkeypatch):
+    monkeypatch.setattr(settings, 'response_cache_enabled', True)
+    build = Build()
+    _get(build)
+    assert _get(build).body == b'[{"id":1}]'
+    assert build.calls == 1
+
+    asyncio.run(bump_version(USER_ID))
+    _get(build)
+    assert build.calls == 2
+
+
+def test_job_writes_bump_the_version(postgrest):
+    before = asyncio.run(versions.get_version(USER_ID))
+    asyncio.run(job_service.create_job(USER_ID, JobCreate(company_name='Acme', position_title='Engineer')))
+    assert asyncio.run(versions.get_version(USER_ID)) == before + 1
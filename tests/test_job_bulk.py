@@ -0,0 +1,80 @@
+import asyncio
+from datetime import date, datetime
+
+from jobtrack.core.config import settings
+from jobtrack.schemas.job import JobBulkFilter, JobStatus
+from jobtrack.services.job import job_service
+
+USER_ID = '00000000-0000-0000-0000-000000000001'
+OTHER_USER_ID = '00000000-0000-0000-0000-000000000002'
+
+
+def _job(applied_date: str, status: str = 'applied', user_id: str = USER_ID) -> dict:
+    return {
+        'user_id': user_id,
+        'company_name': 'Acme',
+        'position_title': 'Engineer',
+        'status': status,
+        'applied_date': applied_date,
+        'created_at': '2024-01-01T00:00:00',
+        'updated_at': '2024-01-01T00:00:00'
+    }
+
+
+def test_filtered_update_pages_past_the_row_cap(postgrest, monkeypatch):
+    monkeypatch.setattr(settings, 'job_bulk_update_page_size', 2)
+    monkeypatch.setattr(settings, 'job_bulk_update_chunk_size', 2)
+    postgrest.max_rows = 3
+    postgrest.insert('jobs', *[_job(f'2024-01-0{day}') for day in range(1, 8)])
+    postgrest.insert('jobs', _job('2024-01-02', status='rejected'), _job('2024-01-02', user_id=OTHER_USER_ID))
+
+    result = asyncio.run(job_service.bulk_update_status(
+        USER_ID,
+        JobStatus.REJECTED,
+        filters=JobBulkFilter(status=[JobStatus.APPLIED], applied_before=date(2024, 1, 6))
+    ))
+
+    assert result.updated == 5
+    jobs = postgrest.tables['jobs']
+    assert sum(job['status'] == 'rejected' for job in jobs) == 6
+    assert [job['status'] for job in jobs if job['user_id'] == OTHER_USER_ID] == ['applied']
+    # Each page asks for exactly page_size rows
+    ranges = [request.headers['range'].split('-') for request in postgrest.reads('jobs')]
+    assert {int(end) - int(start) + 1 for start, end in ranges} == {2}
+
+
+def test_page_size_of_one_is_a_valid_range(postgrest, monkeypatch):
+    monkeypatch.setattr(settings, 'job_bulk_update_page_size', 1)
+    postgrest.insert('jobs', _job('2024-01-01'), _job('2024-01-02'))
+
+    result = asyncio.run(job_service.bulk_update_status(USER_ID, JobStatus.WITHDRAWN, filters=JobBulkFilter()))
+
+    assert result.updated == 2
+
+
+def test_jobs_with_recent_interactions_are_excluded(postgrest):
+    postgrest.insert('jobs', _job('2024-01-01'), _job('2024-01-01'), _job('2024-01-01'))
+    quiet, stale, active = postgrest.tables['jobs']
+    postgrest.insert(
+        'job_interactions',
+        {'job_id': stale['id'], 'interaction_type': 'follow_up', 'interaction_date': '2024-01-02T00:00:00'},
+        {'job_id': active['id'], 'interaction_type': 'follow_up', 'interaction_date': '2024-03-01T00:00:00'}
+    )
+
+    result = asyncio.run(job_service.bulk_update_status(
+        USER_ID,
+        JobStatus.WITHDRAWN,
+        filters=JobBulkFilter(no_interactions_since=datetime(2024, 2, 1))
+    ))
+
+    assert sorted(str(job_id) for job_id in result.job_ids) == sorted([quiet['id'], stale['id']])
+
+
+def test_update_by_ids_is_scoped_to_the_user(postgrest):
+    postgrest.insert('jobs', _job('2024-01-01'), _job('2024-01-01', user_id=OTHER_USER_ID))
+    mine, theirs = postgrest.tables['jobs']
+
+    result = asyncio.run(job_service.bulk_update_status(USER_ID, JobStatus.INTERVIEWING, job_ids=[mine['id'], theirs['id']]))
+
+    assert [str(job_id) for job_id in result.job_ids] == [mine['id']]
+    assert theirs['status'] == 'applied'
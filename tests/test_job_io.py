@@ -0,0 +1,55 @@
+import asyncio
+import io
+
+from jobtrack.schemas.job import JobFileFormat
+from jobtrack.services import job_io
+
+USER_ID = '00000000-0000-0000-0000-000000000001'
+
+
+class StubJobService:
+    """Stands in for JobService, collecting inserted jobs."""
+
+    def __init__(self):
+        self.jobs = []
+
+    async def bulk_create_jobs(self, user_id, jobs):
+        self.jobs.extend(jobs)
+        return len(jobs)
+
+
+def _import(monkeypatch, content: bytes, file_format: JobFileFormat):
+    service = StubJobService()
+    monkeypatch.setattr(job_io, 'job_service', service)
+    result = asyncio.run(job_io.import_jobs(USER_ID, io.BytesIO(content), file_format))
+    return result, service.jobs
+
+
+def test_csv_import_reports_bad_rows_and_keeps_good_ones(monkeypatch):
+    content = (
+        'company_name,position_title,notes\n'
+        'Acme,Engineer,\n'
+        'Bad,Row,caf\xe9\n'.encode('latin-1') +
+        b'Wide,Row,note,extra\n'
+        b'Missing,\n'
+        b'Last,Engineer,"multi\nline"\n'
+    )
+    result, jobs = _import(monkeypatch, content, JobFileFormat.CSV)
+    assert [job.company_name for job in jobs] == ['Acme', 'Wide', 'Last']
+    assert jobs[2].notes == 'multi\nline'
+    assert result.imported == 3
+    assert result.failed == 2
+    assert [(error.row, error.errors) for error in result.errors][0] == (2, ['invalid UTF-8'])
+    assert result.errors[1].row == 4
+
+
+def test_ndjson_import_reports_undecodable_lines(monkeypatch):
+    content = (
+        b'{"company_name": "Acme", "position_title": "Engineer"}\n'
+        b'\n'
+        b'{"company_name": "\xff", "position_title": "Engineer"}\n'
+        b'{"company_name": "Next", "position_title": "Engineer"}\n'
+    )
+    result, jobs = _import(monkeypatch, content, JobFileFormat.NDJSON)
+    assert [job.company_name for job in jobs] == ['Acme', 'Next']
+    assert [(error.row, error.errors) for error in result.errors] == [(3, ['invalid UTF-8'])]
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from jobtrack.core.pagination import decode_cursor, encode_cursor, keyset_filter, keyset_order
+from jobtrack.schemas.job import JobSortField, SortOrder
+from jobtrack.services.job import job_service
+
+from fake_postgrest import _condition
+
+USER_ID = '00000000-0000-0000-0000-000000000001'
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor('2024-01-01', 'a,b"c', scope='applied_date.desc,id.desc')
+    assert '=' not in cursor
+    assert decode_cursor(cursor, 2, scope='applied_date.desc,id.desc') == ['2024-01-01', 'a,b"c']
+
+
+@pytest.mark.parametrize('cursor, size, scope', [
+    ('not base64!', 2, ''),
+    (encode_cursor('x'), 2, ''),
+    (encode_cursor('x', 'y', scope='company_name.asc,id.asc'), 2, 'applied_date.asc,id.asc'),
+    (encode_cursor('x', 'y', scope='applied_date.asc,id.asc'), 2, 'applied_date.desc,id.desc'),
+])
+def test_malformed_or_mismatched_cursors_are_rejected(cursor, size, scope):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, size, scope=scope)
+
+
+def test_keyset_order_is_one_order_spec():
+    assert keyset_order('applied_date', descending=True) == 'applied_date.desc,id.desc'
+    assert keyset_order('company_name', descending=False) == 'company_name.asc,id.asc'
+
+
+@pytest.mark.parametrize('value', ['plain', 'a,b', 'say "hi"', 'back\\slash', 'and(x.eq.1)', ''])
+def test_keyset_filter_quotes_values(value):
+    predicate = _condition(f"or({keyset_filter('name', value, 'id-5', descending=False)})")
+    assert predicate({'name': value + 'z', 'id': 'id-0'})
+    assert predicate({'name': value, 'id': 'id-6'})
+    assert not predicate({'name': value, 'id': 'id-5'})
+    assert not predicate({'name': value, 'id': 'id-4'})
+
+
+def _jobs(postgrest, names):
+    postgrest.insert('jobs', *[{
+        'user_id': USER_ID,
+        'company_name': name,
+        'position_title': 'Engineer',
+        'status': 'applied',
+        'applied_date': f'2024-01-{day % 3 + 1:02d}',
+        'created_at': '2024-01-01T00:00:00',
+        'updated_at': '2024-01-01T00:00:00'
+    } for day, name in enumerate(names)])
+
+
+@pytest.mark.parametrize('sort', [JobSortField.APPLIED_DATE, JobSortField.COMPANY_NAME])
+@pytest.mark.parametrize('order', [SortOrder.ASC, SortOrder.DESC])
+def test_job_pages_cover_every_job_once(postgrest, sort, order):
+    _jobs(postgrest, ['Acme, Inc.', 'B "quoted"', 'C (holdings)', 'D\\E', 'Acme, Inc.', 'F', 'G'])
+
+    async def pages():
+        seen, cursor = [], None
+        while True:
+            page = await job_service.list_user_jobs(USER_ID, sort=sort, order=order, limit=2, cursor=cursor)
+            seen.extend(str(job.id) for job in page.items)
+            if not page.next_cursor:
+                return seen
+            cursor = page.next_cursor
+
+    seen = asyncio.run(pages())
+    assert sorted(seen) == sorted(job['id'] for job in postgrest.tables['jobs'])
+
+
+def test_cursor_from_another_sort_is_a_value_error(postgrest):
+    _jobs(postgrest, ['A', 'B', 'C'])
+
+    async def scenario():
+        page = await job_service.list_user_jobs(USER_ID, sort=JobSortField.COMPANY_NAME, limit=1)
+        await job_service.list_user_jobs(USER_ID, sort=JobSortField.APPLIED_DATE, limit=1, cursor=page.next_cursor)
+
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
+
+
+def test_timeline_pages_cover_every_interaction_once(postgrest):
+    _jobs(postgrest, ['Acme'])
+    job_id = postgrest.tables['jobs'][0]['id']
+    postgrest.insert('job_interactions', *[{
+        'job_id': job_id,
+        'interaction_type': 'follow_up',
+        'interaction_date': f'2024-02-0{day % 3 + 1}T00:00:00',
+        'created_at': '2024-02-01T00:00:00',
+        'updated_at': '2024-02-01T00:00:00'
+    } for day in range(5)])
+
+    async def pages():
+        seen, cursor = [], None
+        while True:
+            page = await job_service.get_job_timeline(job_id, USER_ID, order=SortOrder.ASC, limit=2, cursor=cursor)
+            seen.extend(str(interaction.id) for interaction in page.items)
+            if not page.next_cursor:
+                return seen
+            cursor = page.next_cursor
+
+    assert sorted(asyncio.run(pages())) == sorted(row['id'] for row in postgrest.tables['job_interactions'])
@@ -0,0 +1,98 @@
+import asyncio
+import json
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from starlette.requests import Request
+
+from jobtrack.core import ratelimit
+from jobtrack.core.ratelimit import MemoryRateLimitBackend
+from jobtrack.core.versions import bump_version
+from jobtrack.routes import ai
+from jobtrack.schemas.ai import BatchMatchRequest
+from jobtrack.schemas.job import JobStatus, JobUpdate
+from jobtrack.schemas.user import User
+from jobtrack.services.ai import ai_service
+from jobtrack.services.job import job_service
+from jobtrack.services.ranking import ranking_service
+
+USER_ID = '00000000-0000-0000-0000-000000000001'
+RESUME = {'skills': ['python', 'postgres']}
+
+
+def _job(title: str, description: str = None) -> dict:
+    return {
+        'user_id': USER_ID, 'position_title': title, 'job_description': description, 'company_name': 'Acme',
+        'status': 'applied', 'applied_date': '2024-01-01',
+        'created_at': '2024-01-01T00:00:00', 'updated_at': '2024-01-01T00:00:00'
+    }
+
+
+def _rank(top_k: int = 10, candidates=None):
+    return asyncio.run(ranking_service.rank(USER_ID, RESUME, top_k, candidates))
+
+
+def test_index_is_built_past_the_row_cap(postgrest):
+    postgrest.insert('jobs', *[_job('Sales Manager') for _ in range(1000)], _job('Python Postgres Developer'))
+    best = postgrest.tables['jobs'][-1]
+
+    (job_id, score), = _rank(top_k=1)
+    assert str(job_id) == best['id'] and score > 0
+
+
+def test_candidates_restrict_the_ranking(postgrest):
+    postgrest.insert('jobs', _job('Python Developer'), _job('Postgres Administrator'), _job('Chef'))
+    python, postgres, chef = (UUID(row['id']) for row in postgrest.tables['jobs'])
+
+    assert {job_id for job_id, _ in _rank(candidates=[postgres, chef])} == {postgres, chef}
+    unknown = uuid4()
+    assert asyncio.run(ranking_service.missing(USER_ID, [python, unknown, unknown])) == [unknown]
+
+
+def test_writes_that_change_no_text_keep_the_index(postgrest):
+    postgrest.insert('jobs', _job('Python Developer'))
+    job_id = UUID(postgrest.tables['jobs'][0]['id'])
+    _rank()
+    reads = len(postgrest.reads('jobs'))
+
+    asyncio.run(job_service.update_job(job_id, USER_ID, JobUpdate(position_title='Postgres Developer')))
+    asyncio.run(job_service.bulk_update_status(USER_ID, JobStatus.REJECTED, job_ids=[job_id]))
+    _rank()
+    assert len(postgrest.reads('jobs')) == reads
+
+
+def test_writes_by_another_worker_rebuild_the_index(postgrest):
+    postgrest.insert('jobs', _job('Python Developer'))
+    assert len(_rank()) == 1
+
+    postgrest.tables['jobs'].clear()
+    asyncio.run(bump_version(USER_ID))
+    assert _rank() == []
+
+
+class StubAIService:
+    async def match_jobs(self, descriptions, resume_analysis):
+        for description in descriptions:
+            yield description, '{"score": 1}', None
+
+
+def test_match_jobs_reports_candidates_missing_from_the_index(postgrest, monkeypatch):
+    monkeypatch.setattr(ai_service, '_instance', StubAIService())
+    monkeypatch.setattr(ratelimit.rate_limit_backend, '_instance', MemoryRateLimitBackend(max_keys=16))
+    postgrest.insert('jobs', _job('Python Developer', 'Write python'))
+    known, unknown = UUID(postgrest.tables['jobs'][0]['id']), uuid4()
+    user = User(
+        id=USER_ID, email='user@example.com', full_name='User', is_active=True, is_verified=True,
+        created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1)
+    )
+    request = Request({'type': 'http', 'client': ('10.0.0.1', 1234), 'headers': []})
+    batch = BatchMatchRequest(resume_analysis=RESUME, job_ids=[known, unknown], top_k=5)
+
+    async def scenario():
+        response = await ai.match_jobs(request, batch, user)
+        return [json.loads(line) async for line in response.body_iterator]
+
+    lines = {line['job_id']: line for line in asyncio.run(scenario())}
+    assert lines[str(unknown)] == {'job_id': str(unknown), 'error': 'Job not found'}
+    assert lines[str(known)]['match'] == {'score': 1}
+    assert lines[str(known)]['similarity'] > 0
@@ -0,0 +1,102 @@
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from jobtrack.core import ratelimit
+from jobtrack.core.config import settings
+from jobtrack.core.ratelimit import MemoryRateLimitBackend
+from jobtrack.schemas.user import User
+
+
+def _request(peer: str, forwarded: str = None) -> Request:
+    headers = [(b'x-forwarded-for', forwarded.encode())] if forwarded else []
+    return Request({'type': 'http', 'client': (peer, 1234), 'headers': headers})
+
+
+def test_cost_is_taken_from_the_bucket():
+    backend = MemoryRateLimitBackend(max_keys=16)
+
+    async def scenario():
+        return [await backend.take('ai:user:1', 1.0, 10, cost) for cost in (4, 4, 4)]
+
+    waits = asyncio.run(scenario())
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(2.0, abs=0.01)
+
+
+def test_cost_above_burst_leaves_the_bucket_in_debt():
+    backend = MemoryRateLimitBackend(max_keys=16)
+
+    async def scenario():
+        return await backend.take('ai:user:1', 1.0, 10, 25), await backend.take('ai:user:1', 1.0, 10)
+
+    admitted, next_wait = asyncio.run(scenario())
+    assert admitted == 0.0
+    assert next_wait == pytest.approx(16.0, abs=0.01)
+
+
+def test_charge_rejects_once_completions_exhaust_the_budget(monkeypatch):
+    monkeypatch.setattr(ratelimit.rate_limit_backend, '_instance', MemoryRateLimitBackend(max_keys=16))
+    monkeypatch.setattr(settings, 'rate_limit_ai_burst', 10)
+
+    async def scenario():
+        await ratelimit.charge('ai', _request('10.0.0.1'), 'user-1', cost=10)
+        await ratelimit.charge('ai', _request('10.0.0.1'), 'user-1', cost=1)
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(scenario())
+    assert error.value.status_code == 429
+    assert 'Retry-After' in error.value.headers
+
+
+def test_forwarded_for_is_only_trusted_from_listed_proxies(monkeypatch):
+    monkeypatch.setattr(settings, 'rate_limit_trusted_proxies', ['10.0.0.1', '10.0.0.2'])
+    assert ratelimit._client_ip(_request('203.0.113.9', '198.51.100.1')) == '203.0.113.9'
+    assert ratelimit._client_ip(_request('10.0.0.1', '198.51.100.1')) == '198.51.100.1'
+    # A client-supplied hop left of the real client is ignored
+    assert ratelimit._client_ip(_request('10.0.0.1', '1.2.3.4, 198.51.100.1, 10.0.0.2')) == '198.51.100.1'
+    assert ratelimit._client_ip(_request('10.0.0.1')) == '10.0.0.1'
+
+
+def test_logins_are_limited_per_username_across_addresses(monkeypatch):
+    monkeypatch.setattr(ratelimit.rate_limit_backend, '_instance', MemoryRateLimitBackend(max_keys=16))
+    monkeypatch.setattr(settings, 'rate_limit_auth_burst', 2)
+    check = ratelimit.username_rate_limit('auth')
+
+    def login(username):
+        return check(OAuth2PasswordRequestForm(username=username, password='guess'))
+
+    async def scenario():
+        await login('victim@example.com')
+        await login(' Victim@Example.com')
+        await login('someone-else@example.com')
+        await login('victim@example.com')
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(scenario())
+    assert error.value.status_code == 429
+
+
+def test_match_jobs_charges_a_token_even_without_completions(postgrest, monkeypatch):
+    from jobtrack.core.auth import get_current_user
+    from jobtrack.main import app
+
+    monkeypatch.setattr(ratelimit.rate_limit_backend, '_instance', MemoryRateLimitBackend(max_keys=16))
+    monkeypatch.setattr(settings, 'rate_limit_ai_burst', 3)
+    user = User(
+        id='00000000-0000-0000-0000-000000000001', email='user@example.com', full_name='User',
+        is_active=True, is_verified=True, created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1)
+    )
+    monkeypatch.setitem(app.dependency_overrides, get_current_user, lambda: user)
+    client = TestClient(app)
+    # The job does not exist, so no completion is ever charged
+    body = {'resume_analysis': {'skills': ['python']}, 'job_ids': [str(uuid4())]}
+
+    statuses = [client.post('/ai/match-jobs', json=body).status_code for _ in range(4)]
+    assert statuses == [200, 200, 200, 429]
@@ -0,0 +1,126 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from jobtrack.core.versions import bump_version
+from jobtrack.schemas.job import JobInteraction
+from jobtrack.services.search import JobSearchIndex, highlight, search_service
+
+USER_ID = '00000000-0000-0000-0000-000000000001'
+
+
+def _row(title: str, company: str = 'Acme', description: str = None, **fields) -> dict:
+    return {
+        'id': fields.pop('id', str(uuid4())),
+        'company_name': company,
+        'position_title': title,
+        'job_description': description,
+        'status': 'applied',
+        **fields
+    }
+
+
+def test_title_matches_outrank_description_matches():
+    title, body = _row('Python Developer'), _row('Engineer', description='We use Python daily')
+    index = JobSearchIndex.build([body, title])
+    assert [job_id for job_id, _ in index.search({'python'}, 10)] == [title['id'], body['id']]
+
+
+def test_rare_terms_weigh_more_than_common_ones():
+    rows = [_row('Backend Engineer', description='rust') for _ in range(4)]
+    rows.append(_row('Backend Engineer', description='haskell'))
+    index = JobSearchIndex.build(rows)
+    scores = dict(index.search({'rust', 'haskell'}, 10))
+    assert scores[rows[-1]['id']] > scores[rows[0]['id']]
+
+
+def test_shorter_documents_score_higher_for_the_same_match():
+    short = _row('Engineer', description='kubernetes')
+    long = _row('Engineer', description='kubernetes ' + 'and plenty of other words ' * 20)
+    index = JobSearchIndex.build([long, short])
+    assert index.search({'kubernetes'}, 10)[0][0] == short['id']
+
+
+def test_removed_documents_leave_no_postings():
+    row = _row('Data Engineer')
+    index = JobSearchIndex.build([row])
+    index.remove(row['id'])
+    assert index.search({'data'}, 10) == []
+    assert index.postings == {} and index.total_length == 0
+
+
+def test_highlight_marks_and_escapes_matches():
+    assert highlight('Senior <Python> developer, python', {'python'}, 200) == (
+        'Senior &lt;<mark>Python</mark>&gt; developer, <mark>python</mark>'
+    )
+    assert highlight('Nothing to see', {'python'}, 200) is None
+
+
+def test_highlight_cuts_a_window_around_the_first_match():
+    text = 'filler ' * 20 + 'python ' + 'tail ' * 20
+    snippet = highlight(text, {'python'}, 30)
+    assert snippet.startswith('…') and snippet.endswith('…')
+    assert '<mark>python</mark>' in snippet
+    assert len(snippet.replace('<mark>', '').replace('</mark>', '')) <= 32
+
+
+def test_cursor_pages_cover_every_hit_once(postgrest):
+    postgrest.insert('jobs', *[_row(f'Python role {i}', user_id=USER_ID) for i in range(7)])
+
+    async def scenario():
+        seen, cursor = [], None
+        while True:
+            page = await search_service.search(USER_ID, 'python', 3, cursor)
+            seen.extend(str(hit.job_id) for hit in page.items)
+            if page.next_cursor is None:
+                return seen
+            cursor = page.next_cursor
+
+    seen = asyncio.run(scenario())
+    assert sorted(seen) == sorted(row['id'] for row in postgrest.tables['jobs'])
+
+
+@pytest.mark.parametrize('cursor', ['not base64!', 'LTE'])
+def test_malformed_cursors_are_rejected(postgrest, cursor):
+    with pytest.raises(ValueError):
+        asyncio.run(search_service.search(USER_ID, 'python', 3, cursor))
+
+
+def test_index_is_built_past_the_row_cap(postgrest):
+    postgrest.insert('jobs', *[_row('Engineer', user_id=USER_ID) for _ in range(1000)])
+    postgrest.insert('jobs', _row('Python Engineer', user_id=USER_ID))
+
+    page = asyncio.run(search_service.search(USER_ID, 'python', 10))
+    assert len(page.items) == 1
+
+
+def test_writes_by_another_worker_rebuild_the_index(postgrest):
+    row = _row('Python Engineer', user_id=USER_ID)
+    postgrest.insert('jobs', row)
+    assert len(asyncio.run(search_service.search(USER_ID, 'python', 10)).items) == 1
+
+    # A delete handled elsewhere only shows up as a new data version
+    postgrest.tables['jobs'].clear()
+    asyncio.run(bump_version(USER_ID))
+    assert asyncio.run(search_service.search(USER_ID, 'python', 10)).items == []
+
+
+def test_recording_an_interaction_twice_indexes_it_once(postgrest):
+    row = _row('Engineer', user_id=USER_ID)
+    postgrest.insert('jobs', row)
+    asyncio.run(search_service.search(USER_ID, 'engineer', 10))
+    reads = len(postgrest.reads('jobs'))
+    interaction = JobInteraction(
+        id=uuid4(), interaction_type='other', interaction_date='2024-01-01T00:00:00',
+        notes='Talked about python', created_at='2024-01-01T00:00:00', updated_at='2024-01-01T00:00:00'
+    )
+
+    version = asyncio.run(bump_version(USER_ID))
+    search_service.record_interaction(USER_ID, row['id'], interaction, version)
+    search_service.record_interaction(USER_ID, row['id'], interaction, version)
+
+    hit, = asyncio.run(search_service.search(USER_ID, 'python', 10)).items
+    assert hit.highlights['interactions'] == 'Talked about <mark>python</mark>'
+    # Patched in place rather than rebuilt
+    assert len(postgrest.reads('jobs')) == reads
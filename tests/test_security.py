@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import bcrypt
+import pytest
+from jose import ExpiredSignatureError, jwt
+
+from jobtrack.core import security
+from jobtrack.core.revocation import MemoryRevocationStore, revocation_store
+from jobtrack.core.security import create_token, create_tokens, decode_token, token_cache, verify_token
+from jobtrack.routes import auth
+from jobtrack.schemas.user import User
+from jobtrack.services.user import user_service
+
+EMAIL = 'user@example.com'
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(revocation_store, '_instance', MemoryRevocationStore())
+    monkeypatch.setattr(token_cache, '_instance', None)
+
+
+def _verify(token: str, token_type: str = 'access'):
+    return asyncio.run(verify_token(token, token_type))
+
+
+def test_tokens_are_only_accepted_as_their_own_type():
+    access, refresh = create_tokens(EMAIL, 'user')
+    assert _verify(access)['sub'] == EMAIL
+    assert _verify(refresh, 'refresh')['sub'] == EMAIL
+    assert _verify(refresh) is None
+    assert _verify(access, 'refresh') is None
+
+
+def test_tokens_signed_with_another_key_are_rejected():
+    claims = {'sub': EMAIL, 'type': 'access', 'exp': datetime.utcnow() + timedelta(minutes=5)}
+    assert _verify(jwt.encode(claims, 'not-the-secret', algorithm='HS256')) is None
+
+
+def test_logout_revokes_the_access_and_refresh_tokens():
+    access, refresh = create_tokens(EMAIL, 'user')
+    other_access, _ = create_tokens(EMAIL, 'user')
+    user = User(
+        id='00000000-0000-0000-0000-000000000001', email=EMAIL, full_name='User', is_active=True,
+        is_verified=True, created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1)
+    )
+
+    asyncio.run(auth.logout(refresh_token=refresh, token=access, current_user=user))
+    assert _verify(access) is None
+    assert _verify(refresh, 'refresh') is None
+    # Other sessions stay signed in
+    assert _verify(other_access) is not None
+
+
+def test_password_change_revokes_every_earlier_token(postgrest, monkeypatch):
+    monkeypatch.setattr(user_service, '_instance', None)
+    hashed = bcrypt.hashpw(b'old-password', bcrypt.gensalt(rounds=4)).decode()
+    postgrest.insert('users', {
+        'email': EMAIL, 'full_name': 'User', 'role': 'user', 'is_active': True, 'is_verified': True,
+        'hashed_password': hashed, 'created_at': '2024-01-01T00:00:00', 'updated_at': '2024-01-01T00:00:00'
+    })
+    user_id = postgrest.tables['users'][0]['id']
+    access, refresh = create_tokens(EMAIL, 'user')
+
+    assert asyncio.run(user_service.change_password(user_id, 'old-password', 'new-password'))
+    assert _verify(access) is None
+    assert _verify(refresh, 'refresh') is None
+    fresh, _ = create_tokens(EMAIL, 'user')
+    assert _verify(fresh) is not None
+
+
+def test_cached_claims_are_not_reused_after_expiry(monkeypatch):
+    token = create_token({'sub': EMAIL, 'type': 'access'}, timedelta(minutes=5))
+    real_decode, calls = security.jwt.decode, []
+
+    def decode(*args, **kwargs):
+        # The real check, against the clock the test controls
+        calls.append(args[0])
+        claims = real_decode(*args, **kwargs)
+        if claims['exp'] <= security.time():
+            raise ExpiredSignatureError('Signature has expired.')
+        return claims
+
+    monkeypatch.setattr(security.jwt, 'decode', decode)
+    claims = decode_token(token)
+    assert decode_token(token) == claims
+    assert len(calls) == 1
+
+    monkeypatch.setattr(security, 'time', lambda: claims['exp'] + 1)
+    assert decode_token(token) is None
+    assert len(calls) == 2
+    assert token_cache.stats()['size'] == 0
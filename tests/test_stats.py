@@ -0,0 +1,110 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from jobtrack.core.config import settings
+from jobtrack.core.versions import bump_version
+from jobtrack.schemas.job import JobCreate, JobStatus
+from jobtrack.services.job import job_service
+from jobtrack.services.stats import JobFacts, StatsSummary, stats_service
+
+USER_ID = '00000000-0000-0000-0000-000000000001'
+
+
+def _facts(status: JobStatus, first_interaction: date = None) -> JobFacts:
+    return JobFacts(status, date(2024, 1, 1), None, None, first_interaction)
+
+
+def test_withdrawn_without_interaction_is_not_a_response():
+    summary = StatsSummary()
+    summary.add('applied', _facts(JobStatus.APPLIED))
+    summary.add('withdrawn', _facts(JobStatus.WITHDRAWN))
+    summary.add('withdrawn-after-call', _facts(JobStatus.WITHDRAWN, date(2024, 1, 5)))
+    summary.add('rejected', _facts(JobStatus.REJECTED))
+
+    assert summary.to_stats().response_rate == 0.5
+
+
+def test_summary_aggregates(monkeypatch):
+    monkeypatch.setattr(settings, 'stats_salary_bucket_size', 10000)
+    summary = StatsSummary()
+    # Monday and Sunday of one week, then the next Monday
+    summary.add('a', JobFacts(JobStatus.APPLIED, date(2024, 1, 1), 50000, 70000, None))
+    summary.add('b', JobFacts(JobStatus.OFFER_RECEIVED, date(2024, 1, 7), 64000, None, date(2024, 1, 11)))
+    summary.add('c', JobFacts(JobStatus.ACCEPTED, date(2024, 1, 8), None, None, date(2024, 1, 10)))
+
+    stats = summary.to_stats()
+    assert stats.total == 3
+    assert stats.status_counts == {JobStatus.APPLIED: 1, JobStatus.OFFER_RECEIVED: 1, JobStatus.ACCEPTED: 1}
+    assert [(week.week_start, week.count) for week in stats.applications_per_week] == [
+        (date(2024, 1, 1), 2), (date(2024, 1, 8), 1)
+    ]
+    assert stats.offer_rate == pytest.approx(2 / 3)
+    assert stats.median_days_to_first_interaction == 3
+    assert [(bucket.min, bucket.count) for bucket in stats.salary_distribution] == [(60000, 2)]
+
+
+def test_replacing_and_removing_jobs_keeps_counts_exact():
+    summary = StatsSummary()
+    summary.add('a', _facts(JobStatus.APPLIED))
+    summary.add('a', _facts(JobStatus.REJECTED))
+    assert summary.to_stats().status_counts == {JobStatus.REJECTED: 1}
+
+    summary.remove('a')
+    stats = summary.to_stats()
+    assert stats.total == 0 and stats.status_counts == {} and stats.applications_per_week == []
+    assert stats.response_rate == 0.0
+
+
+def test_first_interaction_only_moves_earlier():
+    summary = StatsSummary()
+    summary.add('a', _facts(JobStatus.APPLIED, date(2024, 1, 10)))
+    summary.record_interaction('a', date(2024, 1, 20))
+    summary.record_interaction('a', date(2024, 1, 5))
+    assert summary.jobs['a'].first_interaction == date(2024, 1, 5)
+
+
+def _job_row(**fields) -> dict:
+    return {'user_id': USER_ID, 'status': 'applied', 'applied_date': '2024-01-01', **fields}
+
+
+def test_summary_is_loaded_past_the_row_cap(postgrest):
+    postgrest.insert('jobs', *[_job_row() for _ in range(1000)], _job_row(status='rejected'))
+
+    stats = asyncio.run(stats_service.get_stats(USER_ID))
+    assert stats.total == 1001
+    assert stats.status_counts[JobStatus.REJECTED] == 1
+
+
+def test_interactions_count_as_responses(postgrest):
+    postgrest.insert('jobs', _job_row(), _job_row())
+    job = postgrest.tables['jobs'][0]
+    postgrest.insert('job_interactions', {'job_id': job['id'], 'interaction_date': '2024-01-04T09:00:00'})
+
+    stats = asyncio.run(stats_service.get_stats(USER_ID))
+    assert stats.response_rate == 0.5
+    assert stats.median_days_to_first_interaction == 3
+
+
+def test_local_writes_patch_the_cached_summary(postgrest):
+    asyncio.run(stats_service.get_stats(USER_ID))
+    reads = len(postgrest.reads('jobs'))
+
+    created = asyncio.run(job_service.create_job(USER_ID, JobCreate(
+        company_name='Acme', position_title='Engineer', status=JobStatus.INTERVIEWING
+    )))
+    assert asyncio.run(stats_service.get_stats(USER_ID)).status_counts == {JobStatus.INTERVIEWING: 1}
+    asyncio.run(job_service.delete_job(created.id, USER_ID))
+    assert asyncio.run(stats_service.get_stats(USER_ID)).total == 0
+    assert len(postgrest.reads('jobs')) == reads
+
+
+def test_writes_by_another_worker_reload_the_summary(postgrest):
+    postgrest.insert('jobs', _job_row())
+    assert asyncio.run(stats_service.get_stats(USER_ID)).total == 1
+
+    postgrest.insert('jobs', _job_row())
+    assert asyncio.run(stats_service.get_stats(USER_ID)).total == 1
+    asyncio.run(bump_version(USER_ID))
+    assert asyncio.run(stats_service.get_stats(USER_ID)).total == 2
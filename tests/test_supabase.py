@@ -0,0 +1,46 @@
+import asyncio
+import threading
+
+from jobtrack.core.config import settings
+from jobtrack.core.supabase import SupabasePool
+
+
+class BlockingQuery:
+    def __init__(self, release: threading.Event = None):
+        self.release = release
+        self.executed = False
+
+    def execute(self):
+        self.executed = True
+        if self.release is not None:
+            self.release.wait(2)
+        return 'rows'
+
+
+def test_cancelled_queued_query_is_not_left_waiting(monkeypatch):
+    # supabase-py only checks that the key is shaped like a JWT
+    monkeypatch.setattr(settings, 'supabase_key', 'test.test.test')
+    monkeypatch.setattr(settings, 'supabase_max_concurrency', 1)
+    pool = SupabasePool()
+    release = threading.Event()
+    running, queued = BlockingQuery(release), BlockingQuery()
+
+    async def scenario():
+        first = asyncio.create_task(pool.execute(running))
+        second = asyncio.create_task(pool.execute(queued))
+        await asyncio.sleep(0.05)
+        assert pool.stats()['waiting'] == 1
+        second.cancel()
+        await asyncio.gather(second, return_exceptions=True)
+        release.set()
+        return await first
+
+    try:
+        assert asyncio.run(scenario()) == 'rows'
+    finally:
+        pool.close()
+    stats = pool.stats()
+    assert stats['waiting'] == 0
+    assert stats['in_flight'] == 0
+    assert stats['checkouts'] == 1
+    assert not queued.executed
@@ -0,0 +1,148 @@
+import asyncio
+
+from jobtrack.schemas.ai import AITaskKind, AITaskPriority, AITaskStatus
+from jobtrack.services.tasks import TaskQueue, TaskStore
+
+USER_ID = '00000000-0000-0000-0000-000000000001'
+
+
+class StubAIService:
+    """Stands in for AIService, recording calls instead of calling a model."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+
+    async def analyze_resume(self, resume_text: str) -> str:
+        self.calls.append(resume_text)
+        await asyncio.sleep(self.delay)
+        if resume_text == 'fail':
+            raise RuntimeError('model unavailable')
+        return f'{{"skills": ["{resume_text}"]}}'
+
+    async def match_job(self, job_description: str, resume_analysis: dict) -> str:
+        return '{}'
+
+    async def generate_cover_letter(self, job_description: str, resume_analysis: dict, company_name: str) -> str:
+        return ''
+
+    async def suggest_improvements(self, application_materials: dict) -> str:
+        return '{}'
+
+
+async def _wait_finished(queue: TaskQueue, task_id, timeout: float = 2.0):
+    for _ in range(int(timeout / 0.01)):
+        result = await queue.get_result(task_id, USER_ID)
+        if result.status in (AITaskStatus.SUCCEEDED, AITaskStatus.FAILED):
+            return result
+        await asyncio.sleep(0.01)
+    raise AssertionError('task did not finish')
+
+
+def test_submitted_task_result_is_persisted(tmp_path):
+    async def scenario():
+        store = TaskStore(str(tmp_path / 'tasks.sqlite3'))
+        queue = TaskQueue(StubAIService(), store)
+        await queue.start()
+        try:
+            task = await queue.submit(USER_ID, AITaskKind.ANALYZE_RESUME, {'resume_text': 'python'}, AITaskPriority.NORMAL)
+            assert task.status == AITaskStatus.QUEUED
+            result = await _wait_finished(queue, task.id)
+        finally:
+            await queue.stop()
+        assert result.status == AITaskStatus.SUCCEEDED
+        assert store.get(str(task.id), USER_ID)['result'] == '{"skills": ["python"]}'
+
+    asyncio.run(scenario())
+
+
+def test_failed_task_records_error(tmp_path):
+    async def scenario():
+        queue = TaskQueue(StubAIService(), TaskStore(str(tmp_path / 'tasks.sqlite3')))
+        await queue.start()
+        try:
+            task = await queue.submit(USER_ID, AITaskKind.ANALYZE_RESUME, {'resume_text': 'fail'}, AITaskPriority.HIGH)
+            return await _wait_finished(queue, task.id)
+        finally:
+            await queue.stop()
+
+    result = asyncio.run(scenario())
+    assert result.status == AITaskStatus.FAILED
+    assert result.error == 'model unavailable'
+
+
+def test_queues_sharing_a_store_run_each_task_once(tmp_path):
+    path = str(tmp_path / 'tasks.sqlite3')
+    service = StubAIService(delay=0.05)
+
+    async def scenario():
+        # A task left queued by a previous process
+        producer = TaskQueue(service, TaskStore(path))
+        await producer.start()
+        await producer.stop()
+        producer._queue = asyncio.PriorityQueue()
+        task = await producer.submit(USER_ID, AITaskKind.ANALYZE_RESUME, {'resume_text': 'once'}, AITaskPriority.NORMAL)
+
+        workers = [TaskQueue(service, TaskStore(path)) for _ in range(3)]
+        for queue in workers:
+            await queue.start()
+        try:
+            return await _wait_finished(workers[0], task.id)
+        finally:
+            for queue in workers:
+                await queue.stop()
+
+    result = asyncio.run(scenario())
+    assert result.status == AITaskStatus.SUCCEEDED
+    assert service.calls == ['once']
+
+
+def test_worker_survives_store_errors(tmp_path):
+    async def scenario():
+        store = TaskStore(str(tmp_path / 'tasks.sqlite3'))
+        queue = TaskQueue(StubAIService(), store)
+        await queue.start()
+        claim = store.claim
+        failures = iter([True])
+
+        def flaky_claim(task_id, started_at):
+            if next(failures, False):
+                raise RuntimeError('database is locked')
+            return claim(task_id, started_at)
+
+        store.claim = flaky_claim
+        try:
+            await queue.submit(USER_ID, AITaskKind.ANALYZE_RESUME, {'resume_text': 'lost'}, AITaskPriority.NORMAL)
+            task = await queue.submit(USER_ID, AITaskKind.ANALYZE_RESUME, {'resume_text': 'next'}, AITaskPriority.NORMAL)
+            return await _wait_finished(queue, task.id)
+        finally:
+            await queue.stop()
+
+    assert asyncio.run(scenario()).status == AITaskStatus.SUCCEEDED
+
+
+def test_task_interrupted_by_stop_runs_after_restart(tmp_path):
+    path = str(tmp_path / 'tasks.sqlite3')
+    service = StubAIService(delay=0.5)
+
+    async def scenario():
+        store = TaskStore(path)
+        queue = TaskQueue(service, store)
+        await queue.start()
+        task = await queue.submit(USER_ID, AITaskKind.ANALYZE_RESUME, {'resume_text': 'slow'}, AITaskPriority.NORMAL)
+        while not service.calls:
+            await asyncio.sleep(0.01)
+        await queue.stop()
+        assert store.get(str(task.id), USER_ID)['status'] == AITaskStatus.QUEUED.value
+
+        service.delay = 0.0
+        restarted = TaskQueue(service, TaskStore(path))
+        await restarted.start()
+        try:
+            return await _wait_finished(restarted, task.id)
+        finally:
+            await restarted.stop()
+
+    result = asyncio.run(scenario())
+    assert result.status == AITaskStatus.SUCCEEDED
+    assert service.calls == ['slow', 'slow']